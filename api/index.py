@@ -28,7 +28,7 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# /api/keys/validate  and  /api/keys/providers
+# /api/keys/validate, /api/keys/validate-batch and /api/keys/providers
 app.include_router(keys_router)
 
 # /api/debate/turn, /api/debate/consensus, /api/debate/conspectus
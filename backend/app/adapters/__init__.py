@@ -1,19 +1,58 @@
-from .base import LLMAdapter, GenerationConfig, Message, MessageRole
-from .anthropic_adapter import AnthropicAdapter
-from .openai_adapter import OpenAIAdapter
-from .gemini_adapter import GeminiAdapter
-from .xai_adapter import XAIAdapter
-from .deepseek_adapter import DeepSeekAdapter
-from .kimi_adapter import KimiAdapter
-from .qwen_adapter import QwenAdapter
-from .glm_adapter import GLMAdapter
+from .base import (
+    LLMAdapter,
+    GenerationConfig,
+    Message,
+    MessageRole,
+    StreamUsage,
+    ProviderError,
+    RateLimitedError,
+    ProviderOverloadedError,
+    TransientNetworkError,
+    ProviderAuthError,
+    ContextTooLongError,
+    CircuitOpenError,
+    RetryPolicy,
+)
 from .factory import get_adapter, PROVIDER_MODELS
 
+# Adapter classes import their provider SDK, so they are resolved on
+# first attribute access rather than when this package is imported.
+_LAZY_ADAPTERS = {
+    "AnthropicAdapter": "anthropic",
+    "OpenAIAdapter": "openai",
+    "GeminiAdapter": "google",
+    "XAIAdapter": "xai",
+    "DeepSeekAdapter": "deepseek",
+    "KimiAdapter": "kimi",
+    "QwenAdapter": "qwen",
+    "GLMAdapter": "glm",
+    "FakeAdapter": "fake",
+}
+
+
+def __getattr__(name: str):
+    provider = _LAZY_ADAPTERS.get(name)
+    if provider is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from .factory import get_adapter_class
+
+    return get_adapter_class(provider)
+
+
 __all__ = [
     "LLMAdapter",
     "GenerationConfig",
     "Message",
     "MessageRole",
+    "StreamUsage",
+    "ProviderError",
+    "RateLimitedError",
+    "ProviderOverloadedError",
+    "TransientNetworkError",
+    "ProviderAuthError",
+    "ContextTooLongError",
+    "CircuitOpenError",
+    "RetryPolicy",
     "AnthropicAdapter",
     "OpenAIAdapter",
     "GeminiAdapter",
@@ -22,6 +61,7 @@ __all__ = [
     "KimiAdapter",
     "QwenAdapter",
     "GLMAdapter",
+    "FakeAdapter",
     "get_adapter",
     "PROVIDER_MODELS",
 ]
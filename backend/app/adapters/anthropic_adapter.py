@@ -6,106 +6,180 @@ import logging
 from typing import AsyncGenerator
 
 import anthropic
-
-from .base import GenerationConfig, GenerationResult, LLMAdapter, Message, MessageRole
+import httpx
+
+from .base import (
+    ContextTooLongError,
+    GenerationConfig,
+    GenerationResult,
+    LLMAdapter,
+    Message,
+    MessageRole,
+    ProviderAuthError,
+    ProviderError,
+    ProviderOverloadedError,
+    StreamChunk,
+    StreamUsage,
+    TransientNetworkError,
+    error_from_status,
+    guarded_call,
+    guarded_stream,
+    parse_retry_after,
+)
+from .catalog import ANTHROPIC_MODELS
+from .clients import client_pool
 
 logger = logging.getLogger(__name__)
 
-ANTHROPIC_MODELS = [
-    "claude-opus-4-6",
-    "claude-sonnet-4-6",
-    "claude-haiku-4-5-20251001",
-]
+# Anthropic looks for earlier cache entries at up to ~20 content-block
+# boundaries before a breakpoint, so only the latest boundaries need
+# their own blocks.
+CACHE_LOOKBACK_BLOCKS = 20
+
+_EPHEMERAL = {"type": "ephemeral"}
 
 
 class AnthropicAdapter(LLMAdapter):
     """Adapter for Anthropic's Claude models via the Messages API."""
 
     provider_name = "anthropic"
+    provider_label = "Anthropic"
+
+    def __init__(self, base_url: str | None = None):
+        """Initialize with an optional base URL, e.g. a local stub server."""
+        self._base_url = base_url
 
+    @guarded_stream
     async def generate_stream(
         self,
         messages: list[Message],
         config: GenerationConfig,
         api_key: str,
-    ) -> AsyncGenerator[str, None]:
-        client = anthropic.AsyncAnthropic(api_key=api_key)
-
-        system_prompt, api_messages = self._prepare_messages(messages)
-
-        try:
-            async with client.messages.stream(
-                model=config.model,
-                max_tokens=config.max_tokens,
-                temperature=config.temperature,
-                system=system_prompt,
-                messages=api_messages,
-            ) as stream:
-                async for text in stream.text_stream:
-                    yield text
-        except anthropic.AuthenticationError:
-            raise ValueError("Invalid Anthropic API key")
-        except anthropic.RateLimitError:
-            raise RuntimeError("Anthropic rate limit exceeded. Please wait and retry.")
-        except anthropic.APIError as e:
-            raise RuntimeError(f"Anthropic API error: {e}")
-
+    ) -> AsyncGenerator[StreamChunk, None]:
+        with self._client(api_key) as client:
+            system_prompt, api_messages = self._prepare_messages(messages)
+
+            try:
+                async with client.messages.stream(
+                    model=config.model,
+                    max_tokens=config.max_tokens,
+                    temperature=config.temperature,
+                    system=_system_blocks(system_prompt),
+                    messages=api_messages,
+                    **_timeout_params(config),
+                ) as stream:
+                    async for text in stream.text_stream:
+                        yield text
+                    final = await stream.get_final_message()
+                    usage = final.usage
+                    cache_read = usage.cache_read_input_tokens or 0
+                    cache_write = usage.cache_creation_input_tokens or 0
+                    yield StreamUsage(
+                        # Anthropic's input_tokens excludes cached tokens
+                        input_tokens=usage.input_tokens + cache_read + cache_write,
+                        output_tokens=usage.output_tokens,
+                        model=final.model,
+                        finish_reason=final.stop_reason or "",
+                        cache_read_tokens=cache_read,
+                        cache_write_tokens=cache_write,
+                    )
+            # A connection dropped mid-stream surfaces as a raw httpx error
+            except (anthropic.APIError, httpx.TransportError) as e:
+                raise self._translate_error(e) from e
+
+    @guarded_call
     async def generate(
         self,
         messages: list[Message],
         config: GenerationConfig,
         api_key: str,
     ) -> GenerationResult:
-        client = anthropic.AsyncAnthropic(api_key=api_key)
+        with self._client(api_key) as client:
+            system_prompt, api_messages = self._prepare_messages(messages)
+
+            try:
+                response = await client.messages.create(
+                    model=config.model,
+                    max_tokens=config.max_tokens,
+                    temperature=config.temperature,
+                    system=_system_blocks(system_prompt),
+                    messages=api_messages,
+                    **_timeout_params(config),
+                )
+                usage = response.usage
+                cache_read = usage.cache_read_input_tokens or 0
+                cache_write = usage.cache_creation_input_tokens or 0
+                return GenerationResult(
+                    content=response.content[0].text,
+                    input_tokens=usage.input_tokens + cache_read + cache_write,
+                    output_tokens=usage.output_tokens,
+                    model=response.model,
+                    finish_reason=response.stop_reason or "",
+                    cache_read_tokens=cache_read,
+                    cache_write_tokens=cache_write,
+                )
+            except anthropic.APIError as e:
+                raise self._translate_error(e) from e
+
+    @guarded_call
+    async def validate_key(self, api_key: str) -> bool:
+        with self._client(api_key) as client:
+            try:
+                # Listing models authenticates the key without billing a generation
+                await client.models.list(limit=1)
+                return True
+            except anthropic.APIError as e:
+                error = self._translate_error(e)
+                if isinstance(error, ProviderAuthError):
+                    return False
+                raise error from e
 
-        system_prompt, api_messages = self._prepare_messages(messages)
+    def get_available_models(self) -> list[str]:
+        return ANTHROPIC_MODELS.copy()
 
-        try:
-            response = await client.messages.create(
-                model=config.model,
-                max_tokens=config.max_tokens,
-                temperature=config.temperature,
-                system=system_prompt,
-                messages=api_messages,
+    def _client(self, api_key: str) -> anthropic.AsyncAnthropic:
+        """Lease a pooled client so keep-alive connections are reused."""
+        return client_pool.lease(
+            self.provider_name,
+            self._base_url,
+            api_key,
+            # Retries are handled by guarded_stream/guarded_call
+            lambda: anthropic.AsyncAnthropic(
+                api_key=api_key, base_url=self._base_url, max_retries=0
+            ),
+        )
+
+    def _translate_error(self, e: anthropic.APIError | httpx.TransportError) -> ProviderError:
+        """Convert an Anthropic SDK exception into a typed ProviderError."""
+        # Includes timeouts
+        if isinstance(e, (anthropic.APIConnectionError, httpx.TransportError)):
+            return TransientNetworkError(
+                "Could not connect to the Anthropic API. "
+                "Check your network connection.",
+                provider=self.label,
             )
-            return GenerationResult(
-                content=response.content[0].text,
-                input_tokens=response.usage.input_tokens,
-                output_tokens=response.usage.output_tokens,
-                model=response.model,
-                finish_reason=response.stop_reason or "",
+        error_type = ""
+        if isinstance(e.body, dict):
+            error_type = (e.body.get("error") or {}).get("type", "")
+        if error_type == "overloaded_error":
+            # Also delivered as an in-stream error event on a 200 response
+            return ProviderOverloadedError(
+                "Anthropic is overloaded. Please try again shortly.",
+                provider=self.label,
             )
-        except anthropic.AuthenticationError:
-            raise ValueError("Invalid Anthropic API key")
-        except anthropic.RateLimitError:
-            raise RuntimeError("Anthropic rate limit exceeded. Please wait and retry.")
-        except anthropic.APIError as e:
-            raise RuntimeError(f"Anthropic API error: {e}")
-
-    async def validate_key(self, api_key: str) -> bool:
-        client = anthropic.AsyncAnthropic(api_key=api_key)
-        try:
-            # Minimal call: send a tiny message to verify the key works
-            await client.messages.create(
-                model="claude-haiku-4-5-20251001",
-                max_tokens=1,
-                messages=[{"role": "user", "content": "hi"}],
-            )
-            return True
-        except anthropic.AuthenticationError:
-            return False
-        except anthropic.RateLimitError:
-            raise RuntimeError("Rate limited. Please wait a moment and try again.")
-        except anthropic.APIConnectionError:
-            raise RuntimeError(
-                "Could not connect to the Anthropic API. "
-                "Check your network connection."
+        if isinstance(e, anthropic.APIStatusError):
+            if e.status_code == 400 and "prompt is too long" in e.message:
+                return ContextTooLongError(
+                    f"Anthropic rejected the prompt as too long: {e.message}",
+                    provider=self.label,
+                )
+            return error_from_status(
+                self.label,
+                e.status_code,
+                e.message,
+                parse_retry_after(e.response.headers),
             )
-        except anthropic.APIError as e:
-            raise RuntimeError(f"Anthropic API error: {e.message}")
-
-    def get_available_models(self) -> list[str]:
-        return ANTHROPIC_MODELS.copy()
+        return ProviderError(f"Anthropic API error: {e}", provider=self.label)
 
     @staticmethod
     def _prepare_messages(
@@ -114,18 +188,61 @@ class AnthropicAdapter(LLMAdapter):
         """Separate system prompt from conversation messages.
 
         Anthropic requires the system prompt as a separate parameter,
-        not in the messages array.
+        not in the messages array. The last message carrying cache
+        boundaries is split into content blocks with a cache breakpoint
+        at its final boundary, so the stable transcript prefix is cached.
         """
         system_prompt = ""
         api_messages = []
+        cached = max(
+            (i for i, msg in enumerate(messages) if msg.cache_boundaries),
+            default=-1,
+        )
 
-        for msg in messages:
+        for i, msg in enumerate(messages):
             if msg.role == MessageRole.SYSTEM:
                 system_prompt = msg.content
             else:
                 api_messages.append({
                     "role": msg.role.value,
-                    "content": msg.content,
+                    "content": _cached_blocks(msg) if i == cached else msg.content,
                 })
 
         return system_prompt, api_messages
+
+
+def _timeout_params(config: GenerationConfig) -> dict:
+    """Request options for ``config.timeout``; omitted to keep the SDK default."""
+    return {"timeout": config.timeout} if config.timeout is not None else {}
+
+
+def _system_blocks(system_prompt: str) -> str | list[dict]:
+    """Mark the system prompt as a cache breakpoint."""
+    if not system_prompt:
+        return system_prompt
+    return [{"type": "text", "text": system_prompt, "cache_control": _EPHEMERAL}]
+
+
+def _cached_blocks(message: Message) -> str | list[dict]:
+    """Split a message into text blocks at its latest cache boundaries.
+
+    The breakpoint goes on the block ending at the last boundary; the
+    earlier block boundaries let the next turn's request find the cache
+    entry this one writes.
+    """
+    content = message.content
+    cuts = [b for b in message.cache_boundaries if 0 < b <= len(content)]
+    if not cuts:
+        return content
+    cuts = cuts[-CACHE_LOOKBACK_BLOCKS:]
+    blocks = []
+    start = 0
+    for cut in cuts:
+        if cut > start:
+            blocks.append({"type": "text", "text": content[start:cut]})
+            start = cut
+    if blocks:
+        blocks[-1]["cache_control"] = _EPHEMERAL
+    if start < len(content):
+        blocks.append({"type": "text", "text": content[start:]})
+    return blocks
@@ -2,10 +2,23 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import inspect
+import logging
+import random
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
 from enum import Enum
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, Callable, Mapping, Union
+
+from .circuit import BreakerState, breakers
+from .ratelimit import Reservation, rate_limiter
+from .timing import StreamTimer, StreamTiming, stream_timings
+
+logger = logging.getLogger(__name__)
 
 
 class MessageRole(str, Enum):
@@ -20,6 +33,10 @@ class Message:
 
     role: MessageRole
     content: str
+    # Ascending character offsets into ``content`` where a prefix ends that
+    # later requests will repeat verbatim. Adapters with explicit prompt
+    # caching place their cache breakpoints on these boundaries.
+    cache_boundaries: tuple[int, ...] = ()
 
 
 @dataclass
@@ -30,6 +47,12 @@ class GenerationConfig:
     max_tokens: int = 1024
     temperature: float = 0.7
     stop_sequences: list[str] = field(default_factory=list)
+    # Stable identifier shared by requests with a common prompt prefix, so
+    # providers that support it route them to the same prompt cache.
+    cache_key: str = ""
+    # Seconds the provider may go without sending anything (connecting,
+    # before the first byte, or between chunks). None keeps the SDK default.
+    timeout: float | None = None
 
 
 @dataclass
@@ -41,12 +64,353 @@ class GenerationResult:
     output_tokens: int = 0
     model: str = ""
     finish_reason: str = ""
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
+
+
+@dataclass
+class StreamUsage:
+    """Usage record yielded as the final item of a generation stream.
+
+    Adapters emit exactly one of these after the last text chunk when the
+    provider reports usage, so callers get real token counts instead of
+    estimating them from the streamed text. ``input_tokens`` is the whole
+    prompt; ``cache_read_tokens`` of it were served from the provider's
+    prompt cache and ``cache_write_tokens`` were written to it.
+    ``timing`` is filled in by ``guarded_stream``.
+    """
+
+    input_tokens: int = 0
+    output_tokens: int = 0
+    model: str = ""
+    finish_reason: str = ""
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
+    timing: StreamTiming | None = field(default=None, compare=False)
+
+
+StreamChunk = Union[str, StreamUsage]
+
+
+# ---------------------------------------------------------------------------
+# Typed provider errors
+# ---------------------------------------------------------------------------
+
+class ProviderError(RuntimeError):
+    """Base class for failures reported by an LLM provider.
+
+    Subclasses mark whether the failure is worth retrying; ``retry_after``
+    carries the provider's requested wait in seconds, when it sent one.
+    """
+
+    retryable: bool = False
+
+    def __init__(
+        self,
+        message: str,
+        *,
+        provider: str = "",
+        retry_after: float | None = None,
+    ):
+        super().__init__(message)
+        self.provider = provider
+        self.retry_after = retry_after
+
+
+class RateLimitedError(ProviderError):
+    """The provider rejected the request with HTTP 429."""
+
+    retryable = True
+
+
+class ProviderOverloadedError(ProviderError):
+    """The provider is temporarily overloaded or unavailable (503/529)."""
+
+    retryable = True
+
+
+class TransientNetworkError(ProviderError):
+    """Connection failures, timeouts and transient 5xx responses."""
+
+    retryable = True
+
+
+class ProviderAuthError(ProviderError, ValueError):
+    """The API key was rejected (401/403). Never retried."""
+
+
+class ContextTooLongError(ProviderError):
+    """The prompt exceeds the model's context window. Never retried."""
+
+
+def parse_retry_after(headers: Mapping[str, str] | None) -> float | None:
+    """Read a Retry-After hint (seconds or HTTP date) from response headers."""
+    if not headers:
+        return None
+    millis = headers.get("retry-after-ms")
+    if millis:
+        try:
+            return max(0.0, float(millis) / 1000)
+        except ValueError:
+            pass
+    value = headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def error_from_status(
+    label: str,
+    status: int,
+    detail: str = "",
+    retry_after: float | None = None,
+) -> ProviderError:
+    """Map an HTTP status from a provider onto the typed error hierarchy."""
+    kwargs = {"provider": label, "retry_after": retry_after}
+    if status in (401, 403):
+        return ProviderAuthError(f"Invalid {label} API key", **kwargs)
+    if status == 429:
+        return RateLimitedError(
+            f"{label} rate limit exceeded. Please wait and retry.", **kwargs
+        )
+    if status == 413:
+        return ContextTooLongError(
+            f"{label} rejected the prompt as too long: {detail}", **kwargs
+        )
+    if status in (503, 529):
+        return ProviderOverloadedError(
+            f"{label} is overloaded. Please try again shortly.", **kwargs
+        )
+    if status == 408 or status >= 500:
+        return TransientNetworkError(f"{label} API error ({status}): {detail}", **kwargs)
+    return ProviderError(f"{label} API error ({status}): {detail}", **kwargs)
+
+
+# ---------------------------------------------------------------------------
+# Retry policy
+# ---------------------------------------------------------------------------
+
+@dataclass
+class RetryPolicy:
+    """Exponential backoff with full jitter for retryable provider errors.
+
+    ``budget`` caps the total time spent waiting between attempts of a
+    single call, so one turn cannot stall a debate indefinitely.
+    """
+
+    max_attempts: int = 4
+    base_delay: float = 1.0
+    max_delay: float = 20.0
+    budget: float = 45.0
+
+    def next_delay(self, attempt: int, error: ProviderError, waited: float) -> float | None:
+        """Return how long to wait before attempt ``attempt + 1``.
+
+        Returns None when the error is not retryable or the attempt
+        count or wait budget is exhausted.
+        """
+        if not error.retryable or attempt + 1 >= self.max_attempts:
+            return None
+        backoff = min(self.max_delay, self.base_delay * (2 ** attempt))
+        delay = random.uniform(0, backoff)
+        if error.retry_after is not None:
+            delay = max(delay, error.retry_after)
+        if waited + delay > self.budget:
+            return None
+        return delay
+
+
+DEFAULT_RETRY_POLICY = RetryPolicy()
+
+
+def estimate_request_tokens(
+    messages: list[Message] | None, config: GenerationConfig | None
+) -> int:
+    """Rough upper bound on a call's token spend (~4 chars per token)."""
+    prompt = sum(len(m.content) for m in messages or []) // 4
+    return prompt + (config.max_tokens if config else 1)
+
+
+class CircuitOpenError(ProviderError):
+    """The (provider, model) circuit breaker is open; the call was not sent."""
+
+
+def _counts_against_breaker(error: ProviderError) -> bool:
+    """Only provider-side degradation trips breakers, not caller mistakes."""
+    return isinstance(error, (ProviderOverloadedError, TransientNetworkError))
+
+
+class _GuardedCall:
+    """Shared per-call state for ``guarded_stream``/``guarded_call``."""
+
+    def __init__(self, adapter: "LLMAdapter", arguments: Mapping[str, Any]):
+        self.adapter = adapter
+        self.api_key: str = arguments["api_key"]
+        self.messages: list[Message] | None = arguments.get("messages")
+        config: GenerationConfig | None = arguments.get("config")
+        self.config = config
+        # Key validation has no model, so it bypasses the breakers
+        self.breaker = breakers.get(adapter.provider_name, config.model) if config else None
+
+    async def admit(self) -> Reservation | None:
+        """Gate one attempt on the breaker, then wait for rate-limit capacity."""
+        if self.breaker is not None and not self.breaker.allow_request():
+            raise CircuitOpenError(
+                f"{self.adapter.label} model '{self.config.model}' is temporarily "
+                f"unavailable ({self.breaker.last_error or 'circuit open'}).",
+                provider=self.adapter.label,
+            )
+        if not self.adapter.rate_limited:
+            return None
+        tokens = estimate_request_tokens(self.messages, self.config)
+        try:
+            return await rate_limiter.acquire(self.adapter.provider_name, self.api_key, tokens)
+        except BaseException:
+            # A half-open trial claimed above must not outlive a cancelled wait
+            self.finished()
+            raise
+
+    def succeeded(self, latency: float | None = None) -> None:
+        if self.breaker is not None:
+            self.breaker.record_success(latency)
+
+    def failed(self, error: ProviderError) -> None:
+        if self.breaker is None:
+            return
+        # A failed half-open trial reopens the breaker whatever the error;
+        # otherwise it would stay half-open with nothing to close it
+        if _counts_against_breaker(error) or self.breaker.state == BreakerState.HALF_OPEN:
+            self.breaker.record_failure(str(error))
+
+    def finished(self) -> None:
+        if self.breaker is not None:
+            self.breaker.release_trial()
+
+
+def guarded_stream(method: Callable[..., AsyncGenerator[StreamChunk, None]]):
+    """Apply breakers, rate limiting and retries to a ``generate_stream``.
+
+    Every attempt is gated by the (provider, model) circuit breaker and
+    waits for the key's rate-limit budget. Retries happen only before the
+    first chunk has been yielded, so a caller never sees duplicated
+    output from a restarted stream. Each stream is timed; the timing is
+    attached to its ``StreamUsage`` and recorded in ``stream_timings``.
+    """
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    async def wrapper(self: "LLMAdapter", *args: Any, **kwargs: Any):
+        call = _GuardedCall(self, signature.bind(self, *args, **kwargs).arguments)
+        timer = StreamTimer(self.provider_name, call.config.model if call.config else "")
+        policy = self.retry_policy
+        attempt = 0
+        waited = 0.0
+        while True:
+            reservation = await call.admit()
+            timer.attempt(reservation.waited if reservation else 0.0)
+            first_chunk_at: float | None = None
+            requested_at = time.monotonic()
+            stream = method(self, *args, **kwargs)
+            try:
+                async for chunk in stream:
+                    if first_chunk_at is None:
+                        first_chunk_at = time.monotonic()
+                    if isinstance(chunk, StreamUsage):
+                        if reservation:
+                            reservation.settle(chunk.input_tokens + chunk.output_tokens)
+                        chunk.timing = timer.finish(chunk.output_tokens)
+                        yield chunk
+                        continue
+                    timer.received()
+                    yield chunk
+                    timer.released()
+                call.succeeded((first_chunk_at or time.monotonic()) - requested_at)
+                stream_timings.record(timer.finish())
+                return
+            except ProviderError as e:
+                call.failed(e)
+                started = first_chunk_at is not None
+                delay = None if started else policy.next_delay(attempt, e, waited)
+                if delay is None:
+                    stream_timings.record_error(timer.provider, timer.model)
+                    raise
+                logger.warning(
+                    f"{self.provider_name} attempt {attempt + 1} failed ({e}); "
+                    f"retrying in {delay:.1f}s"
+                )
+            finally:
+                call.finished()
+                await stream.aclose()
+            await asyncio.sleep(delay)
+            waited += delay
+            attempt += 1
+
+    return wrapper
+
+
+def guarded_call(method: Callable[..., Any]):
+    """Apply breakers, rate limiting and retries to ``generate``/``validate_key``."""
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    async def wrapper(self: "LLMAdapter", *args: Any, **kwargs: Any):
+        call = _GuardedCall(self, signature.bind(self, *args, **kwargs).arguments)
+        policy = self.retry_policy
+        attempt = 0
+        waited = 0.0
+        while True:
+            reservation = await call.admit()
+            try:
+                result = await method(self, *args, **kwargs)
+                if reservation and isinstance(result, GenerationResult):
+                    reservation.settle(result.input_tokens + result.output_tokens)
+                # Only stream TTFT feeds the slow-call check
+                call.succeeded()
+                return result
+            except ProviderError as e:
+                call.failed(e)
+                delay = policy.next_delay(attempt, e, waited)
+                if delay is None:
+                    raise
+                logger.warning(
+                    f"{self.provider_name} attempt {attempt + 1} failed ({e}); "
+                    f"retrying in {delay:.1f}s"
+                )
+            finally:
+                call.finished()
+            await asyncio.sleep(delay)
+            waited += delay
+            attempt += 1
+
+    return wrapper
 
 
 class LLMAdapter(ABC):
-    """Abstract base class that all LLM provider adapters must implement."""
+    """Abstract base class that all LLM provider adapters must implement.
+
+    Implementations raise ProviderError subclasses and decorate their
+    network-facing methods with ``guarded_stream``/``guarded_call`` so
+    calls share the circuit breakers, the process-wide rate limiter and
+    ``retry_policy``.
+    """
 
     provider_name: str = "base"
+    # Human-readable provider name used in error messages
+    provider_label: str = ""
+    retry_policy: RetryPolicy = DEFAULT_RETRY_POLICY
+    # Whether calls wait on the per-key limiter in ``ratelimit.rate_limiter``
+    rate_limited: bool = True
+
+    @property
+    def label(self) -> str:
+        return self.provider_label or self.provider_name
 
     @abstractmethod
     async def generate_stream(
@@ -54,7 +418,7 @@ class LLMAdapter(ABC):
         messages: list[Message],
         config: GenerationConfig,
         api_key: str,
-    ) -> AsyncGenerator[str, None]:
+    ) -> AsyncGenerator[StreamChunk, None]:
         """Stream tokens from the LLM one at a time.
 
         Args:
@@ -63,7 +427,8 @@ class LLMAdapter(ABC):
             api_key: The user's API key for this provider.
 
         Yields:
-            Individual text tokens/chunks as they arrive.
+            Individual text tokens/chunks as they arrive, followed by a
+            single StreamUsage record when the provider reports usage.
         """
         ...  # pragma: no cover
         yield ""  # Make this a valid async generator for type checking
@@ -98,6 +463,9 @@ class LLMAdapter(ABC):
 
         Returns:
             True if the key is valid, False otherwise.
+
+        Raises:
+            ProviderError: For non-auth failures (network, rate limit).
         """
         ...
 
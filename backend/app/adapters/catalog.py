@@ -0,0 +1,80 @@
+"""Model catalog for every supported provider.
+
+Kept free of SDK imports so provider/model listings stay cheap; adapter
+classes (and their SDKs) are only loaded when first requested through
+``factory.get_adapter``.
+"""
+
+# Anthropic
+ANTHROPIC_MODELS = [
+    "claude-opus-4-6",
+    "claude-sonnet-4-6",
+    "claude-haiku-4-5-20251001",
+]
+
+# OpenAI
+OPENAI_MODELS = [
+    "gpt-5.2",
+    "gpt-4o",
+    "gpt-4o-mini",
+]
+
+# Google
+GEMINI_MODELS = [
+    "gemini-3-pro-preview",
+    "gemini-2.5-pro-preview-06-05",
+    "gemini-2.0-flash",
+    "gemini-2.0-flash-lite",
+]
+
+# xAI
+XAI_MODELS = [
+    "grok-3",
+    "grok-3-mini",
+    "grok-2",
+    "grok-2-mini",
+]
+
+# DeepSeek
+DEEPSEEK_MODELS = [
+    "deepseek-chat",
+    "deepseek-reasoner",
+]
+
+# Kimi (Moonshot)
+KIMI_MODELS = [
+    "moonshot-v1-128k",
+    "moonshot-v1-32k",
+    "moonshot-v1-8k",
+]
+
+# Qwen (Alibaba)
+QWEN_MODELS = [
+    "qwen3-max",
+    "qwen3.5-plus",
+    "qwen-plus",
+]
+
+# GLM (Zhipu)
+GLM_MODELS = [
+    "glm-5",
+    "glm-4-plus",
+]
+
+# Fake provider for load testing. Deliberately left out of PROVIDER_MODELS
+# so it is never offered in the UI; any model name is accepted.
+FAKE_MODELS = [
+    "fake-model",
+]
+
+# Map of provider -> list of supported models
+PROVIDER_MODELS: dict[str, list[str]] = {
+    "anthropic": ANTHROPIC_MODELS,
+    "openai": OPENAI_MODELS,
+    "google": GEMINI_MODELS,
+    "xai": XAI_MODELS,
+    "deepseek": DEEPSEEK_MODELS,
+    "kimi": KIMI_MODELS,
+    "qwen": QWEN_MODELS,
+    "glm": GLM_MODELS,
+}
@@ -0,0 +1,161 @@
+"""Circuit breakers per (provider, model).
+
+When a provider degrades, every call against it would otherwise wait for
+a full timeout or error. A breaker watches a rolling window of call
+outcomes and trips open on a high error rate or on slow responses; while
+open, calls fail fast so the orchestrator can route to a fallback model.
+After a cooldown the breaker turns half-open and lets a single trial
+call (usually a background probe) decide whether to close again.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+
+logger = logging.getLogger(__name__)
+
+
+class BreakerState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass(frozen=True)
+class BreakerSettings:
+    """Thresholds for tripping a breaker."""
+
+    window: int = 10  # Number of recent calls considered
+    min_calls: int = 4  # Don't judge a model on fewer calls than this
+    failure_ratio: float = 0.5  # Trip when this share of calls failed or was slow
+    slow_call_seconds: float = 30.0  # Time to first token counted as a slow call
+    cooldown: float = 30.0  # Seconds open before allowing a trial call
+
+
+class CircuitBreaker:
+    """Rolling-window circuit breaker for one (provider, model)."""
+
+    def __init__(self, settings: BreakerSettings | None = None):
+        self.settings = settings or BreakerSettings()
+        self._outcomes: deque[bool] = deque(maxlen=self.settings.window)
+        self._state = BreakerState.CLOSED
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self.last_error = ""
+
+    @property
+    def state(self) -> BreakerState:
+        if (
+            self._state == BreakerState.OPEN
+            and time.monotonic() - self._opened_at >= self.settings.cooldown
+        ):
+            self._state = BreakerState.HALF_OPEN
+        return self._state
+
+    @property
+    def reopens_in(self) -> float:
+        """Seconds until an open breaker allows a trial call."""
+        if self.state != BreakerState.OPEN:
+            return 0.0
+        return max(0.0, self.settings.cooldown - (time.monotonic() - self._opened_at))
+
+    def is_available(self) -> bool:
+        """Whether regular traffic should be routed here."""
+        return self.state == BreakerState.CLOSED
+
+    def allow_request(self) -> bool:
+        """Admit a call: always when closed, one trial at a time when half-open."""
+        state = self.state
+        if state == BreakerState.CLOSED:
+            return True
+        if state == BreakerState.HALF_OPEN and not self._trial_in_flight:
+            self._trial_in_flight = True
+            return True
+        return False
+
+    def record_success(self, latency: float | None = None) -> None:
+        """Record a completed call.
+
+        ``latency`` is a stream's time to first token, which may count the
+        call as slow. Non-streaming calls pass none: their total duration
+        says little about the model's health.
+        """
+        if self._state == BreakerState.HALF_OPEN:
+            self._close()
+            return
+        slow = latency is not None and latency >= self.settings.slow_call_seconds
+        self._record(ok=not slow, reason=f"slow response ({latency or 0:.1f}s)")
+
+    def record_failure(self, error: str) -> None:
+        self.last_error = error
+        if self._state == BreakerState.HALF_OPEN:
+            self._open()
+            return
+        self._record(ok=False, reason=error)
+
+    def release_trial(self) -> None:
+        """Forget a trial call that ended without a verdict (e.g. cancelled)."""
+        self._trial_in_flight = False
+
+    def _record(self, ok: bool, reason: str) -> None:
+        self._outcomes.append(ok)
+        if self._state != BreakerState.CLOSED:
+            return
+        if len(self._outcomes) < self.settings.min_calls:
+            return
+        bad = self._outcomes.count(False) / len(self._outcomes)
+        if bad >= self.settings.failure_ratio:
+            self.last_error = reason
+            self._open()
+
+    def _open(self) -> None:
+        self._state = BreakerState.OPEN
+        self._opened_at = time.monotonic()
+        self._trial_in_flight = False
+
+    def _close(self) -> None:
+        self._state = BreakerState.CLOSED
+        self._outcomes.clear()
+        self._trial_in_flight = False
+        self.last_error = ""
+
+
+class BreakerRegistry:
+    """Circuit breakers keyed by (provider, model)."""
+
+    def __init__(self, settings: BreakerSettings | None = None):
+        self._settings = settings or BreakerSettings()
+        self._breakers: dict[tuple[str, str], CircuitBreaker] = {}
+
+    def get(self, provider: str, model: str) -> CircuitBreaker:
+        key = (provider, model)
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            breaker = self._breakers[key] = CircuitBreaker(self._settings)
+        return breaker
+
+    def is_available(self, provider: str, model: str) -> bool:
+        breaker = self._breakers.get((provider, model))
+        return breaker is None or breaker.is_available()
+
+    def snapshot(self) -> list[dict]:
+        return [
+            {
+                "provider": provider,
+                "model": model,
+                "state": breaker.state.value,
+                "last_error": breaker.last_error,
+            }
+            for (provider, model), breaker in self._breakers.items()
+        ]
+
+    def clear(self) -> None:
+        self._breakers.clear()
+
+
+# Global singleton
+breakers = BreakerRegistry()
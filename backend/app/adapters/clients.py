@@ -0,0 +1,210 @@
+"""Process-wide pool of reusable provider SDK clients.
+
+Each SDK client owns an HTTP connection pool, so building a fresh client
+per call pays for new TCP+TLS handshakes on every debate turn. Adapters
+lease their clients from this pool instead, keyed by provider, base URL
+and a hash of the API key (raw keys are never used as dict keys).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import inspect
+import logging
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of live clients kept in the pool
+DEFAULT_MAX_CLIENTS = 64
+
+# Clients unused for this long are closed and evicted (seconds)
+DEFAULT_IDLE_TIMEOUT = 10 * 60
+
+
+def hash_api_key(api_key: str) -> str:
+    """Return a stable, non-reversible fingerprint for an API key."""
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()
+
+
+PoolKey = tuple[str, str, str]  # (provider, base_url, key_hash)
+
+
+@dataclass
+class _PooledClient:
+    client: Any
+    pool_key: PoolKey
+    last_used: float
+    leases: int = 0  # Calls currently using the client
+    retired: bool = False  # Dropped from the pool while leased; closed on release
+
+
+class ClientPool:
+    """LRU pool of SDK clients with idle eviction and a size cap.
+
+    Clients are kept alive between calls so their HTTP keep-alive
+    connections are reused across turns and sessions. A client leased by
+    a call in progress is never closed under it: idle eviction and the
+    size cap pass it over, and a purge closes it once the call ends.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_MAX_CLIENTS,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+    ):
+        self._max_size = max_size
+        self._idle_timeout = idle_timeout
+        self._clients: OrderedDict[PoolKey, _PooledClient] = OrderedDict()
+        # Pending async closes, kept so they are not garbage collected
+        self._closing: set[asyncio.Task] = set()
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    @contextmanager
+    def lease(
+        self,
+        provider: str,
+        base_url: str | None,
+        api_key: str,
+        factory: Callable[[], Any],
+    ) -> Iterator[Any]:
+        """Borrow a pooled client for one call, creating it with ``factory`` on a miss."""
+        entry = self._checkout(provider, base_url, api_key, factory)
+        entry.leases += 1
+        try:
+            yield entry.client
+        finally:
+            entry.leases -= 1
+            entry.last_used = time.monotonic()
+            if entry.retired:
+                if not entry.leases:
+                    self._close(entry.client)
+            elif self._clients.get(entry.pool_key) is entry:
+                self._clients.move_to_end(entry.pool_key)
+
+    def _checkout(
+        self,
+        provider: str,
+        base_url: str | None,
+        api_key: str,
+        factory: Callable[[], Any],
+    ) -> _PooledClient:
+        now = time.monotonic()
+        self._evict_idle(now)
+
+        pool_key = (provider, base_url or "", hash_api_key(api_key))
+        entry = self._clients.get(pool_key)
+        if entry is not None:
+            entry.last_used = now
+            self._clients.move_to_end(pool_key)
+            return entry
+
+        entry = _PooledClient(client=factory(), pool_key=pool_key, last_used=now)
+        self._clients[pool_key] = entry
+        # Least recently used first; clients in use are passed over, so the
+        # pool can briefly run over its cap
+        excess = len(self._clients) - self._max_size
+        for stale_key, stale in list(self._clients.items()):
+            if excess <= 0:
+                break
+            if stale.leases or stale is entry:
+                continue
+            del self._clients[stale_key]
+            self._close(stale.client)
+            excess -= 1
+        return entry
+
+    def purge_key(self, api_key: str) -> int:
+        """Close and drop every client built for ``api_key``.
+
+        Clients still in use are closed when their call ends.
+
+        Returns:
+            The number of clients removed.
+        """
+        key_hash = hash_api_key(api_key)
+        stale = [k for k in self._clients if k[2] == key_hash]
+        for pool_key in stale:
+            self._retire(self._clients.pop(pool_key))
+        return len(stale)
+
+    def clear(self) -> None:
+        """Close and drop all pooled clients."""
+        while self._clients:
+            _, entry = self._clients.popitem()
+            self._retire(entry)
+
+    async def aclose(self) -> None:
+        """Close all pooled clients, waiting for their connections to drain."""
+        entries = list(self._clients.values())
+        self._clients.clear()
+        for entry in entries:
+            close = _get_closer(entry.client)
+            try:
+                result = close() if close else None
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                logger.debug(f"Error closing pooled client: {e}")
+        if self._closing:
+            await asyncio.gather(*self._closing, return_exceptions=True)
+
+    def _evict_idle(self, now: float) -> None:
+        # OrderedDict is kept in LRU order, so idle entries are at the front
+        for pool_key, entry in list(self._clients.items()):
+            if now - entry.last_used <= self._idle_timeout:
+                break
+            if entry.leases:
+                continue  # Busy with a long call, not idle
+            del self._clients[pool_key]
+            self._close(entry.client)
+
+    def _retire(self, entry: _PooledClient) -> None:
+        if entry.leases:
+            entry.retired = True
+        else:
+            self._close(entry.client)
+
+    def _close(self, client: Any) -> None:
+        """Release a client's connections without blocking the caller."""
+        close = _get_closer(client)
+        if close is None:
+            return
+        try:
+            if inspect.iscoroutinefunction(close):
+                try:
+                    loop = asyncio.get_running_loop()
+                except RuntimeError:
+                    asyncio.run(close())
+                else:
+                    task = loop.create_task(_await_close(close))
+                    self._closing.add(task)
+                    task.add_done_callback(self._closing.discard)
+            else:
+                close()
+        except Exception as e:
+            logger.debug(f"Error closing pooled client: {e}")
+
+
+def _get_closer(client: Any) -> Callable[[], Any] | None:
+    """Find the method that releases a client's HTTP connections."""
+    aio = getattr(client, "aio", None)  # google-genai exposes an async twin
+    return getattr(aio, "aclose", None) or getattr(client, "close", None)
+
+
+async def _await_close(close: Callable[[], Any]) -> None:
+    try:
+        await close()
+    except Exception as e:
+        logger.debug(f"Error closing pooled client: {e}")
+
+
+# Global singleton
+client_pool = ClientPool()
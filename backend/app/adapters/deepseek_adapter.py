@@ -2,15 +2,11 @@
 
 from __future__ import annotations
 
+from .catalog import DEEPSEEK_MODELS
 from .openai_adapter import OpenAIAdapter
 
 DEEPSEEK_BASE_URL = "https://api.deepseek.com"
 
-DEEPSEEK_MODELS = [
-    "deepseek-chat",
-    "deepseek-reasoner",
-]
-
 
 class DeepSeekAdapter(OpenAIAdapter):
     """Adapter for DeepSeek models.
@@ -20,10 +16,12 @@ class DeepSeekAdapter(OpenAIAdapter):
     """
 
     provider_name = "deepseek"
+    provider_label = "DeepSeek"
     _token_limit_param = "max_tokens"
+    _prompt_cache_key = False
 
-    def __init__(self):
-        super().__init__(base_url=DEEPSEEK_BASE_URL)
+    def __init__(self, base_url: str | None = None):
+        super().__init__(base_url=base_url or DEEPSEEK_BASE_URL)
 
     def get_available_models(self) -> list[str]:
         return DEEPSEEK_MODELS.copy()
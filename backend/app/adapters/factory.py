@@ -1,56 +1,91 @@
-"""Factory for creating LLM adapters by provider name."""
+"""Factory for creating LLM adapters by provider name.
+
+Adapter classes are resolved lazily: importing this module (or listing
+PROVIDER_MODELS) never imports a provider SDK. The adapter module and
+its SDK are loaded on the first ``get_adapter(provider)`` call.
+"""
 
 from __future__ import annotations
 
-from .anthropic_adapter import ANTHROPIC_MODELS, AnthropicAdapter
+import importlib
+import logging
+import os
+
 from .base import LLMAdapter
-from .deepseek_adapter import DEEPSEEK_MODELS, DeepSeekAdapter
-from .gemini_adapter import GEMINI_MODELS, GeminiAdapter
-from .glm_adapter import GLM_MODELS, GLMAdapter
-from .kimi_adapter import KIMI_MODELS, KimiAdapter
-from .openai_adapter import OPENAI_MODELS, OpenAIAdapter
-from .qwen_adapter import QWEN_MODELS, QwenAdapter
-from .xai_adapter import XAI_MODELS, XAIAdapter
-
-# Map of provider -> list of supported models
-PROVIDER_MODELS: dict[str, list[str]] = {
-    "anthropic": ANTHROPIC_MODELS,
-    "openai": OPENAI_MODELS,
-    "google": GEMINI_MODELS,
-    "xai": XAI_MODELS,
-    "deepseek": DEEPSEEK_MODELS,
-    "kimi": KIMI_MODELS,
-    "qwen": QWEN_MODELS,
-    "glm": GLM_MODELS,
-}
+from .catalog import PROVIDER_MODELS
 
-_ADAPTER_REGISTRY: dict[str, type[LLMAdapter]] = {
-    "anthropic": AnthropicAdapter,
-    "openai": OpenAIAdapter,
-    "google": GeminiAdapter,
-    "xai": XAIAdapter,
-    "deepseek": DeepSeekAdapter,
-    "kimi": KimiAdapter,
-    "qwen": QwenAdapter,
-    "glm": GLMAdapter,
+__all__ = ["PROVIDER_MODELS", "get_adapter"]
+
+logger = logging.getLogger(__name__)
+
+# Map of provider -> (module within this package, adapter class name)
+_ADAPTER_REGISTRY: dict[str, tuple[str, str]] = {
+    "anthropic": ("anthropic_adapter", "AnthropicAdapter"),
+    "openai": ("openai_adapter", "OpenAIAdapter"),
+    "google": ("gemini_adapter", "GeminiAdapter"),
+    "xai": ("xai_adapter", "XAIAdapter"),
+    "deepseek": ("deepseek_adapter", "DeepSeekAdapter"),
+    "kimi": ("kimi_adapter", "KimiAdapter"),
+    "qwen": ("qwen_adapter", "QwenAdapter"),
+    "glm": ("glm_adapter", "GLMAdapter"),
+    # In-process stand-in for load and latency tests; see fake_adapter
+    "fake": ("fake_adapter", "FakeAdapter"),
 }
 
+# Base URL overrides, e.g. to point adapters at a local stub server:
+# PROVIDER_BASE_URLS="openai=http://127.0.0.1:8900/v1,anthropic=http://127.0.0.1:8900"
+PROVIDER_BASE_URLS: dict[str, str] = {}
+
+
+def _load_env_base_urls() -> None:
+    spec = os.environ.get("PROVIDER_BASE_URLS", "")
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        provider, sep, url = item.partition("=")
+        if not sep or not url.strip():
+            logger.warning(f"Ignoring malformed PROVIDER_BASE_URLS entry: {item!r}")
+            continue
+        PROVIDER_BASE_URLS[provider.strip()] = url.strip()
+
+
+_load_env_base_urls()
+
+# Adapters are stateless apart from their base URL, so one shared instance
+# per provider is enough; SDK clients are pooled in ``clients.client_pool``.
+_ADAPTER_INSTANCES: dict[str, LLMAdapter] = {}
+
+
+def get_adapter_class(provider: str) -> type[LLMAdapter]:
+    """Import and return the adapter class for ``provider``.
+
+    Raises:
+        ValueError: If the provider is not supported.
+    """
+    entry = _ADAPTER_REGISTRY.get(provider)
+    if entry is None:
+        supported = ", ".join(_ADAPTER_REGISTRY.keys())
+        raise ValueError(f"Unknown provider '{provider}'. Supported: {supported}")
+    module_name, class_name = entry
+    module = importlib.import_module(f".{module_name}", __package__)
+    return getattr(module, class_name)
+
 
 def get_adapter(provider: str) -> LLMAdapter:
     """Get an LLM adapter instance for the given provider.
 
     Args:
         provider: Provider name (anthropic, openai, google, xai,
-                  deepseek, kimi, qwen, glm).
+                  deepseek, kimi, qwen, glm, fake).
 
     Returns:
-        An instance of the appropriate LLMAdapter subclass.
+        The shared instance of the appropriate LLMAdapter subclass.
 
     Raises:
         ValueError: If the provider is not supported.
     """
-    adapter_cls = _ADAPTER_REGISTRY.get(provider)
-    if adapter_cls is None:
-        supported = ", ".join(_ADAPTER_REGISTRY.keys())
-        raise ValueError(f"Unknown provider '{provider}'. Supported: {supported}")
-    return adapter_cls()
+    adapter = _ADAPTER_INSTANCES.get(provider)
+    if adapter is None:
+        adapter_class = get_adapter_class(provider)
+        base_url = PROVIDER_BASE_URLS.get(provider)
+        adapter = adapter_class(base_url=base_url) if base_url else adapter_class()
+        _ADAPTER_INSTANCES[provider] = adapter
+    return adapter
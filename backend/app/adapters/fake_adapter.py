@@ -0,0 +1,328 @@
+"""Deterministic in-process fake provider for load and latency testing.
+
+The fake provider never leaves the process, so the orchestrator, the
+Socket.IO handlers and the SSE endpoints can be driven by hundreds of
+concurrent debates without paid keys, and whatever time is measured is
+the server's own overhead plus latency the test asked for.
+
+The "API key" is the configuration. It must start with ``fake`` and may
+carry ``;``-separated options after a colon::
+
+    fake
+    fake:ttft=0.8;tps=40;jitter=0.3;seed=7
+    fake:rate_limit=0.1;fail=0.05;clock=virtual
+
+Options:
+    ttft        Median time to first token in seconds (default 0.5).
+    tps         Median streaming rate in tokens per second (default 50).
+    jitter      Log-normal sigma applied to every delay; 0 disables (0.25).
+    tokens      Median response length in tokens, capped by max_tokens (200).
+    seed        Seed for content, latency and faults (0).
+    rate_limit  Probability that an attempt is rejected with a 429 (0).
+    retry_after Retry-After sent with injected 429s, in seconds (0.5).
+    fail        Probability that a stream breaks after its first token (0).
+    clock       "real" (default) or "virtual"; see ``VirtualClock``.
+
+Content and latency are drawn from an RNG seeded by the seed and the
+request itself, so the same prompt always gets the same answer at the
+same pace. Faults are drawn from one RNG per key, in call order, so a
+retried request is not doomed to fail the same way again.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import heapq
+import json
+import random
+import time
+from dataclasses import dataclass, fields
+from typing import AsyncGenerator
+
+from .base import (
+    GenerationConfig,
+    GenerationResult,
+    LLMAdapter,
+    Message,
+    ProviderAuthError,
+    RateLimitedError,
+    StreamChunk,
+    StreamUsage,
+    TransientNetworkError,
+    guarded_call,
+    guarded_stream,
+)
+from .catalog import FAKE_MODELS
+
+KEY_PREFIX = "fake"
+
+# Words the generated arguments are assembled from
+_VOCABULARY = (
+    "virtue justice reason the of and a is that we must consider whether "
+    "argument premise conclusion evidence citizens polis law freedom truth "
+    "knowledge opinion however therefore indeed because yet surely perhaps "
+    "good common wisdom courage temperance rhetoric dialectic agree disagree"
+).split()
+
+# Turns ending with one of these make the agreement heuristics fire
+_CLOSINGS = (
+    "I agree with much of this.",
+    "I must disagree on this point.",
+    "We have found common ground.",
+    "The question remains open.",
+)
+
+
+@dataclass(frozen=True)
+class FakeProfile:
+    """Latency, content and fault settings parsed from a fake API key."""
+
+    ttft: float = 0.5
+    tps: float = 50.0
+    jitter: float = 0.25
+    tokens: int = 200
+    seed: int = 0
+    rate_limit: float = 0.0
+    retry_after: float = 0.5
+    fail: float = 0.0
+    clock: str = "real"
+
+    @classmethod
+    def parse(cls, api_key: str) -> "FakeProfile":
+        """Parse an API key of the form ``fake[:name=value;...]``.
+
+        Raises:
+            ValueError: If the key is not a fake key or an option is invalid.
+        """
+        prefix, _, spec = api_key.partition(":")
+        if prefix.strip() != KEY_PREFIX:
+            raise ValueError(f"Fake keys start with '{KEY_PREFIX}'")
+        types = {f.name: f.type for f in fields(cls)}
+        values: dict[str, object] = {}
+        for item in filter(None, (part.strip() for part in spec.split(";"))):
+            name, _, raw = item.partition("=")
+            name = name.strip()
+            if name not in types:
+                raise ValueError(f"Unknown fake option '{name}'")
+            kind = {"float": float, "int": int, "str": str}[types[name]]
+            try:
+                values[name] = kind(raw.strip())
+            except ValueError:
+                raise ValueError(f"Invalid value for fake option '{name}': {raw!r}") from None
+        profile = cls(**values)
+        if profile.clock not in ("real", "virtual"):
+            raise ValueError(f"Unknown fake clock '{profile.clock}'")
+        if profile.tps <= 0 or profile.tokens < 1:
+            raise ValueError("Fake tps and tokens must be positive")
+        return profile
+
+
+class VirtualClock:
+    """A discrete-event clock: sleeping advances time instead of waiting.
+
+    Sleepers are woken in deadline order. Time jumps to the earliest
+    deadline once the event loop has gone ``settle_passes`` iterations
+    without anyone starting a new sleep, so work triggered by one wake-up
+    is scheduled before the clock moves on. Time spent outside the clock
+    (real I/O, ``asyncio.sleep``) is not accounted for.
+    """
+
+    def __init__(self, start: float = 0.0, settle_passes: int = 3):
+        self._now = start
+        self._settle_passes = settle_passes
+        self._sleepers: list[tuple[float, int, asyncio.Future[None]]] = []
+        self._counter = 0
+        self._idle_passes = 0
+        self._ticking = False
+
+    def time(self) -> float:
+        return self._now
+
+    async def sleep(self, delay: float) -> None:
+        if delay <= 0:
+            await asyncio.sleep(0)
+            return
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[None] = loop.create_future()
+        heapq.heappush(self._sleepers, (self._now + delay, self._counter, future))
+        self._counter += 1
+        self._idle_passes = 0
+        if not self._ticking:
+            self._ticking = True
+            loop.call_soon(self._tick, loop)
+        await future
+
+    def _tick(self, loop: asyncio.AbstractEventLoop) -> None:
+        while self._sleepers and self._sleepers[0][2].done():
+            heapq.heappop(self._sleepers)  # Cancelled sleeper
+        if not self._sleepers:
+            self._ticking = False
+            return
+        if self._idle_passes < self._settle_passes:
+            self._idle_passes += 1
+        else:
+            deadline = self._sleepers[0][0]
+            self._now = max(self._now, deadline)
+            while self._sleepers and self._sleepers[0][0] <= deadline:
+                _, _, future = heapq.heappop(self._sleepers)
+                if not future.done():
+                    future.set_result(None)
+            self._idle_passes = 0
+        loop.call_soon(self._tick, loop)
+
+
+class _RealClock:
+    def time(self) -> float:
+        return time.monotonic()
+
+    async def sleep(self, delay: float) -> None:
+        await asyncio.sleep(delay)
+
+
+# Shared by every fake key with clock=virtual
+virtual_clock = VirtualClock()
+
+
+class FakeAdapter(LLMAdapter):
+    """Streams seeded filler text with configurable latency and faults.
+
+    Calls go through the circuit breakers and retry policy like any other
+    adapter, but skip the per-key rate limiter so measured latency is
+    only what the profile asked for.
+    """
+
+    provider_name = "fake"
+    provider_label = "Fake"
+    rate_limited = False
+
+    def __init__(self, clock: VirtualClock | None = None):
+        # Overrides the key's clock option; tests pass their own VirtualClock
+        self._clock = clock
+        self._fault_rngs: dict[str, random.Random] = {}
+
+    def _profile(self, api_key: str) -> FakeProfile:
+        try:
+            return FakeProfile.parse(api_key)
+        except ValueError as e:
+            raise ProviderAuthError(f"Invalid Fake API key: {e}", provider=self.label) from None
+
+    def clock_for(self, profile: FakeProfile) -> VirtualClock | _RealClock:
+        if self._clock is not None:
+            return self._clock
+        return virtual_clock if profile.clock == "virtual" else _RealClock()
+
+    def _fault_rng(self, api_key: str, profile: FakeProfile) -> random.Random:
+        rng = self._fault_rngs.get(api_key)
+        if rng is None:
+            rng = self._fault_rngs[api_key] = random.Random(f"faults:{profile.seed}")
+        return rng
+
+    @staticmethod
+    def _request_rng(
+        profile: FakeProfile, messages: list[Message], config: GenerationConfig
+    ) -> random.Random:
+        digest = hashlib.sha256(f"{profile.seed}\0{config.model}".encode("utf-8"))
+        for message in messages:
+            digest.update(f"\0{message.role.value}\0{message.content}".encode("utf-8"))
+        return random.Random(digest.digest())
+
+    @staticmethod
+    def _delay(rng: random.Random, median: float, jitter: float) -> float:
+        if median <= 0:
+            return 0.0
+        return median * rng.lognormvariate(0.0, jitter) if jitter > 0 else median
+
+    @staticmethod
+    def _tokens(rng: random.Random, messages: list[Message], limit: int, length: int) -> list[str]:
+        prompt = messages[-1].content if messages else ""
+        if '"consensus_score"' in prompt:
+            # Consensus extraction expects a JSON report
+            report = json.dumps({
+                "consensus_score": round(rng.random(), 2),
+                "agreed_points": [],
+                "contested_points": [],
+                "stagnation": False,
+                "summary": "The speakers continue to deliberate.",
+            })
+            return [report]
+        count = max(1, min(limit, round(length * rng.lognormvariate(0.0, 0.2))))
+        words = [rng.choice(_VOCABULARY) for _ in range(count)]
+        if count == limit:
+            return [w + " " for w in words]
+        closing = rng.choice(_CLOSINGS).split()
+        words[-len(closing):] = closing
+        return [w + " " for w in words[:-1]] + [words[-1]]
+
+    @guarded_stream
+    async def generate_stream(
+        self,
+        messages: list[Message],
+        config: GenerationConfig,
+        api_key: str,
+    ) -> AsyncGenerator[StreamChunk, None]:
+        profile = self._profile(api_key)
+        clock = self.clock_for(profile)
+        faults = self._fault_rng(api_key, profile)
+        rng = self._request_rng(profile, messages, config)
+
+        await clock.sleep(self._delay(rng, profile.ttft, profile.jitter))
+        if faults.random() < profile.rate_limit:
+            raise RateLimitedError(
+                "Fake rate limit exceeded. Please wait and retry.",
+                provider=self.label,
+                retry_after=profile.retry_after,
+            )
+        tokens = self._tokens(rng, messages, config.max_tokens, profile.tokens)
+        break_at = None
+        if faults.random() < profile.fail and len(tokens) > 1:
+            break_at = faults.randint(1, len(tokens) - 1)
+        interval = 1.0 / profile.tps
+        for i, token in enumerate(tokens):
+            if i:
+                await clock.sleep(self._delay(rng, interval, profile.jitter))
+            if i == break_at:
+                raise TransientNetworkError(
+                    "Fake stream interrupted mid-response.", provider=self.label
+                )
+            yield token
+
+        yield StreamUsage(
+            input_tokens=sum(len(m.content) for m in messages) // 4,
+            output_tokens=len(tokens),
+            model=config.model,
+            finish_reason="length" if len(tokens) >= config.max_tokens else "stop",
+        )
+
+    @guarded_call
+    async def generate(
+        self,
+        messages: list[Message],
+        config: GenerationConfig,
+        api_key: str,
+    ) -> GenerationResult:
+        parts: list[str] = []
+        usage = StreamUsage()
+        # The guarded stream retries on its own; this call must not retry again
+        async for chunk in self.generate_stream.__wrapped__(self, messages, config, api_key):
+            if isinstance(chunk, StreamUsage):
+                usage = chunk
+            else:
+                parts.append(chunk)
+        return GenerationResult(
+            content="".join(parts),
+            input_tokens=usage.input_tokens,
+            output_tokens=usage.output_tokens,
+            model=usage.model,
+            finish_reason=usage.finish_reason,
+        )
+
+    async def validate_key(self, api_key: str) -> bool:
+        try:
+            FakeProfile.parse(api_key)
+        except ValueError:
+            return False
+        return True
+
+    def get_available_models(self) -> list[str]:
+        return FAKE_MODELS.copy()
@@ -2,118 +2,273 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from typing import AsyncGenerator
 
+import httpx
 from google import genai
+from google.genai import errors as genai_errors
 from google.genai import types
 
-from .base import GenerationConfig, GenerationResult, LLMAdapter, Message, MessageRole
+from .base import (
+    ContextTooLongError,
+    GenerationConfig,
+    GenerationResult,
+    LLMAdapter,
+    Message,
+    MessageRole,
+    ProviderAuthError,
+    ProviderError,
+    StreamChunk,
+    StreamUsage,
+    TransientNetworkError,
+    error_from_status,
+    guarded_call,
+    guarded_stream,
+    parse_retry_after,
+)
+from .catalog import GEMINI_MODELS
+from .clients import client_pool, hash_api_key
 
 logger = logging.getLogger(__name__)
 
-GEMINI_MODELS = [
-    "gemini-3-pro-preview",
-    "gemini-2.5-pro-preview-06-05",
-    "gemini-2.0-flash",
-    "gemini-2.0-flash-lite",
-]
+# Explicit context caches are only created for stable prefixes at least
+# this long (~8k tokens, above every model's minimum cacheable size).
+# Shorter prompts rely on Gemini's implicit prefix caching.
+CONTEXT_CACHE_MIN_CHARS = 32_000
+
+# A new cache covering the latest prefix is created once this much stable
+# text has accumulated past the current cache.
+CONTEXT_CACHE_STEP_CHARS = 16_000
+
+CONTEXT_CACHE_TTL = 10 * 60  # seconds
 
 
 class GeminiAdapter(LLMAdapter):
-    """Adapter for Google's Gemini models via the Google GenAI SDK."""
+    """Adapter for Google's Gemini models via the Google GenAI SDK.
+
+    All calls go through the SDK's async surface (``client.aio``) so a
+    Gemini turn never blocks the event loop shared by other debates.
+    """
 
     provider_name = "google"
+    provider_label = "Google"
 
+    def __init__(self, base_url: str | None = None):
+        """Initialize with an optional base URL, e.g. a local stub server."""
+        self._base_url = base_url
+
+    @guarded_stream
     async def generate_stream(
         self,
         messages: list[Message],
         config: GenerationConfig,
         api_key: str,
-    ) -> AsyncGenerator[str, None]:
-        client = genai.Client(api_key=api_key)
-        system_instruction, contents = self._prepare_messages(messages)
-
-        try:
-            response = client.models.generate_content_stream(
-                model=config.model,
-                contents=contents,
-                config=types.GenerateContentConfig(
-                    system_instruction=system_instruction,
-                    max_output_tokens=config.max_tokens,
-                    temperature=config.temperature,
-                ),
-            )
-            for chunk in response:
-                if chunk.text:
-                    yield chunk.text
-        except Exception as e:
-            error_str = str(e).lower()
-            if "api key" in error_str or "permission" in error_str or "403" in error_str:
-                raise ValueError("Invalid Google API key")
-            elif "quota" in error_str or "429" in error_str:
-                raise RuntimeError("Google API rate limit exceeded. Please wait and retry.")
-            else:
-                raise RuntimeError(f"Google API error: {e}")
+    ) -> AsyncGenerator[StreamChunk, None]:
+        with self._client(api_key) as client:
+            try:
+                request = await self._cached_request(client, api_key, config.model, messages)
+                response = await client.aio.models.generate_content_stream(
+                    model=config.model,
+                    contents=request.contents,
+                    config=types.GenerateContentConfig(
+                        system_instruction=request.system_instruction,
+                        cached_content=request.cached_content,
+                        max_output_tokens=config.max_tokens,
+                        temperature=config.temperature,
+                        http_options=_http_options(config),
+                    ),
+                )
+                usage = None
+                finish_reason = ""
+                async for chunk in response:
+                    if chunk.text:
+                        yield chunk.text
+                    # Each chunk carries cumulative usage; the last one is final
+                    if getattr(chunk, "usage_metadata", None):
+                        usage = chunk.usage_metadata
+                    candidates = getattr(chunk, "candidates", None)
+                    if candidates and candidates[0].finish_reason:
+                        finish_reason = _finish_reason(candidates[0].finish_reason)
+                if usage is not None:
+                    yield StreamUsage(
+                        input_tokens=usage.prompt_token_count or 0,
+                        output_tokens=usage.candidates_token_count or 0,
+                        model=config.model,
+                        finish_reason=finish_reason,
+                        cache_read_tokens=usage.cached_content_token_count or 0,
+                        cache_write_tokens=request.cache_write_tokens,
+                    )
+            except Exception as e:
+                raise self._translate_error(e) from e
 
+    @guarded_call
     async def generate(
         self,
         messages: list[Message],
         config: GenerationConfig,
         api_key: str,
     ) -> GenerationResult:
-        client = genai.Client(api_key=api_key)
-        system_instruction, contents = self._prepare_messages(messages)
-
-        try:
-            response = client.models.generate_content(
-                model=config.model,
-                contents=contents,
-                config=types.GenerateContentConfig(
-                    system_instruction=system_instruction,
-                    max_output_tokens=config.max_tokens,
-                    temperature=config.temperature,
-                ),
-            )
-            usage = response.usage_metadata
-            return GenerationResult(
-                content=response.text or "",
-                input_tokens=usage.prompt_token_count if usage else 0,
-                output_tokens=usage.candidates_token_count if usage else 0,
-                model=config.model,
-                finish_reason="stop",
-            )
-        except Exception as e:
-            error_str = str(e).lower()
-            if "api key" in error_str or "permission" in error_str or "403" in error_str:
-                raise ValueError("Invalid Google API key")
-            elif "quota" in error_str or "429" in error_str:
-                raise RuntimeError("Google API rate limit exceeded. Please wait and retry.")
-            else:
-                raise RuntimeError(f"Google API error: {e}")
+        with self._client(api_key) as client:
+            try:
+                request = await self._cached_request(client, api_key, config.model, messages)
+                response = await client.aio.models.generate_content(
+                    model=config.model,
+                    contents=request.contents,
+                    config=types.GenerateContentConfig(
+                        system_instruction=request.system_instruction,
+                        cached_content=request.cached_content,
+                        max_output_tokens=config.max_tokens,
+                        temperature=config.temperature,
+                        http_options=_http_options(config),
+                    ),
+                )
+                usage = response.usage_metadata
+                return GenerationResult(
+                    content=response.text or "",
+                    input_tokens=usage.prompt_token_count if usage else 0,
+                    output_tokens=usage.candidates_token_count if usage else 0,
+                    model=config.model,
+                    finish_reason="stop",
+                    cache_read_tokens=(usage.cached_content_token_count or 0) if usage else 0,
+                    cache_write_tokens=request.cache_write_tokens,
+                )
+            except Exception as e:
+                raise self._translate_error(e) from e
 
+    @guarded_call
     async def validate_key(self, api_key: str) -> bool:
-        client = genai.Client(api_key=api_key)
-        try:
-            # Minimal call to verify the key
-            client.models.generate_content(
-                model="gemini-2.0-flash",
-                contents="hi",
-                config=types.GenerateContentConfig(max_output_tokens=1),
-            )
-            return True
-        except Exception as e:
-            error_str = str(e).lower()
-            if "api key" in error_str or "permission" in error_str or "403" in error_str:
-                return False
-            elif "quota" in error_str or "429" in error_str:
-                raise RuntimeError("Rate limited. Please wait a moment and try again.")
-            else:
-                raise RuntimeError(f"Google API error: {e}")
+        with self._client(api_key) as client:
+            try:
+                # Listing models authenticates the key without billing a generation
+                await client.aio.models.list(config={"page_size": 1})
+                return True
+            except Exception as e:
+                error = self._translate_error(e)
+                if isinstance(error, ProviderAuthError):
+                    return False
+                raise error from e
 
     def get_available_models(self) -> list[str]:
         return GEMINI_MODELS.copy()
 
+    def _client(self, api_key: str) -> genai.Client:
+        """Lease a pooled client so keep-alive connections are reused."""
+        return client_pool.lease(
+            self.provider_name,
+            self._base_url,
+            api_key,
+            lambda: genai.Client(
+                api_key=api_key,
+                http_options=types.HttpOptions(base_url=self._base_url) if self._base_url else None,
+            ),
+        )
+
+    async def _cached_request(
+        self,
+        client: genai.Client,
+        api_key: str,
+        model: str,
+        messages: list[Message],
+    ) -> _GeminiRequest:
+        """Lay out a request, moving a long stable prefix into a context cache.
+
+        The prefix covers the conversation up to the last cache boundary.
+        An existing cache is reused while it is still a prefix of the
+        request; a fresh one is created once enough new stable text has
+        accumulated past it. Any caching failure falls back to sending
+        the whole prompt.
+        """
+        system_instruction, segments, stable = _segments(messages)
+        stable = min(stable, len(segments) - 1)  # A request needs some contents
+        stable_chars = len(system_instruction or "") + sum(
+            len(seg.text) for seg in segments[:stable]
+        )
+        if stable_chars < CONTEXT_CACHE_MIN_CHARS or model in context_caches.unsupported:
+            return _GeminiRequest(*self._prepare_messages(messages))
+
+        key = (hash_api_key(api_key), model, _digest(system_instruction or ""))
+        entry = context_caches.lookup(key)
+        if entry is not None and (
+            entry.segments > stable
+            or _digest_segments(segments[: entry.segments]) != entry.digest
+        ):
+            entry = None  # No longer a prefix of this request
+
+        cache_write_tokens = 0
+        if entry is None or stable_chars - entry.chars >= CONTEXT_CACHE_STEP_CHARS:
+            try:
+                cached = await client.aio.caches.create(
+                    model=model,
+                    config=types.CreateCachedContentConfig(
+                        system_instruction=system_instruction,
+                        contents=_contents(segments[:stable]),
+                        ttl=f"{CONTEXT_CACHE_TTL}s",
+                    ),
+                )
+            except genai_errors.APIError as e:
+                if e.code == 400:
+                    # Model without explicit caching, or prefix too short
+                    context_caches.unsupported.add(model)
+                logger.info(f"Gemini context cache not created for {model}: {e}")
+                if entry is None:
+                    return _GeminiRequest(*self._prepare_messages(messages))
+            else:
+                replaced = context_caches.store(key, _ContextCache(
+                    name=cached.name,
+                    segments=stable,
+                    chars=stable_chars,
+                    digest=_digest_segments(segments[:stable]),
+                    expires_at=time.monotonic() + CONTEXT_CACHE_TTL - 30,
+                ))
+                if replaced is not None:
+                    context_caches.discard_remote(client, replaced.name)
+                usage = cached.usage_metadata
+                cache_write_tokens = (usage.total_token_count or 0) if usage else 0
+                entry = context_caches.lookup(key)
+
+        return _GeminiRequest(
+            system_instruction=None,  # Part of the cached content
+            contents=_contents(segments[entry.segments:]),
+            cached_content=entry.name,
+            cache_write_tokens=cache_write_tokens,
+        )
+
+    def _translate_error(self, e: Exception) -> ProviderError:
+        """Convert a google-genai exception into a typed ProviderError.
+
+        Classification uses the HTTP code and the structured error details
+        rather than the exception text.
+        """
+        if isinstance(e, genai_errors.APIError):
+            body = e.details if isinstance(e.details, dict) else {}
+            error = body.get("error", body)
+            details = [d for d in error.get("details", []) if isinstance(d, dict)]
+            if any(d.get("reason") == "API_KEY_INVALID" for d in details):
+                return ProviderAuthError("Invalid Google API key", provider=self.label)
+            message = e.message or ""
+            if e.code == 400 and "token count" in message.lower():
+                return ContextTooLongError(
+                    f"Google rejected the prompt as too long: {message}",
+                    provider=self.label,
+                )
+            retry_after = _retry_delay(details)
+            if retry_after is None:
+                retry_after = parse_retry_after(getattr(e.response, "headers", None))
+            return error_from_status(self.label, e.code or 0, message, retry_after)
+        if isinstance(e, (httpx.TransportError, ConnectionError, TimeoutError)):
+            return TransientNetworkError(
+                "Could not connect to the Google API. "
+                "Check your network connection.",
+                provider=self.label,
+            )
+        return ProviderError(f"Google API error: {e}", provider=self.label)
+
     @staticmethod
     def _prepare_messages(
         messages: list[Message],
@@ -139,3 +294,156 @@ class GeminiAdapter(LLMAdapter):
                 )
 
         return system_instruction, contents
+
+
+def _http_options(config: GenerationConfig) -> types.HttpOptions | None:
+    """Per-request HTTP options for ``config.timeout`` (milliseconds in the SDK)."""
+    if config.timeout is None:
+        return None
+    return types.HttpOptions(timeout=int(config.timeout * 1000))
+
+
+def _finish_reason(reason: object) -> str:
+    """Normalize a Gemini FinishReason enum to a lowercase string."""
+    value = getattr(reason, "value", reason)
+    return str(value).lower()
+
+
+def _retry_delay(details: list[dict]) -> float | None:
+    """Extract the google.rpc.RetryInfo delay (e.g. "12s") from error details."""
+    for detail in details:
+        if detail.get("@type", "").endswith("google.rpc.RetryInfo"):
+            delay = str(detail.get("retryDelay", "")).rstrip("s")
+            try:
+                return float(delay)
+            except ValueError:
+                return None
+    return None
+
+
+@dataclass
+class _Segment:
+    """A run of message text; one message splits at its cache boundaries."""
+
+    message: int  # Index of the source message
+    role: str
+    text: str
+
+
+@dataclass
+class _GeminiRequest:
+    system_instruction: str | None
+    contents: list[types.Content]
+    cached_content: str | None = None
+    cache_write_tokens: int = 0
+
+
+@dataclass
+class _ContextCache:
+    name: str
+    segments: int  # Number of leading segments held by the cache
+    chars: int
+    digest: str
+    expires_at: float
+
+
+class ContextCacheRegistry:
+    """Live Gemini context caches keyed by (key hash, model, system prompt)."""
+
+    def __init__(self, max_entries: int = 128):
+        self._max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, str, str], _ContextCache] = OrderedDict()
+        self._pending_deletes: set[asyncio.Task] = set()
+        self.unsupported: set[str] = set()  # Models that rejected cache creation
+
+    def lookup(self, key: tuple[str, str, str]) -> _ContextCache | None:
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        return entry
+
+    def store(self, key: tuple[str, str, str], entry: _ContextCache) -> _ContextCache | None:
+        """Record a new cache; return the entry it replaces, if any."""
+        replaced = self._entries.pop(key, None)
+        self._entries[key] = entry
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)  # Left to expire on its TTL
+        return replaced
+
+    def discard_remote(self, client: genai.Client, name: str) -> None:
+        """Delete a superseded cache in the background instead of paying to store it."""
+        task = asyncio.ensure_future(_delete_cache(client, name))
+        self._pending_deletes.add(task)
+        task.add_done_callback(self._pending_deletes.discard)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.unsupported.clear()
+
+
+async def _delete_cache(client: genai.Client, name: str) -> None:
+    try:
+        await client.aio.caches.delete(name=name)
+    except Exception as e:
+        logger.debug(f"Could not delete Gemini context cache {name}: {e}")
+
+
+def _segments(messages: list[Message]) -> tuple[str | None, list[_Segment], int]:
+    """Flatten messages into segments and count the stable leading ones.
+
+    The last message with cache boundaries is split at them; everything
+    up to its final boundary is stable across turns.
+    """
+    system_instruction = None
+    segments: list[_Segment] = []
+    stable = 0
+    cached = max(
+        (i for i, msg in enumerate(messages) if msg.cache_boundaries),
+        default=-1,
+    )
+    for i, msg in enumerate(messages):
+        if msg.role == MessageRole.SYSTEM:
+            system_instruction = msg.content
+            continue
+        role = "model" if msg.role == MessageRole.ASSISTANT else "user"
+        if i != cached:
+            segments.append(_Segment(i, role, msg.content))
+            continue
+        start = 0
+        for cut in msg.cache_boundaries:
+            if start < cut <= len(msg.content):
+                segments.append(_Segment(i, role, msg.content[start:cut]))
+                start = cut
+        stable = len(segments)
+        if start < len(msg.content):
+            segments.append(_Segment(i, role, msg.content[start:]))
+    return system_instruction, segments, stable
+
+
+def _contents(segments: list[_Segment]) -> list[types.Content]:
+    """Rejoin segments into one Content per source message."""
+    contents: list[types.Content] = []
+    last_message = -1
+    for seg in segments:
+        if seg.message == last_message:
+            contents[-1].parts[0].text += seg.text
+        else:
+            contents.append(types.Content(role=seg.role, parts=[types.Part(text=seg.text)]))
+            last_message = seg.message
+    return contents
+
+
+def _digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _digest_segments(segments: list[_Segment]) -> str:
+    h = hashlib.sha256()
+    for seg in segments:
+        h.update(f"{seg.message}\0{seg.role}\0{seg.text}\0".encode("utf-8"))
+    return h.hexdigest()
+
+
+# Global singleton
+context_caches = ContextCacheRegistry()
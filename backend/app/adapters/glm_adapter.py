@@ -6,15 +6,11 @@ may need updating as Zhipu evolves their API.
 
 from __future__ import annotations
 
+from .catalog import GLM_MODELS
 from .openai_adapter import OpenAIAdapter
 
 GLM_BASE_URL = "https://open.bigmodel.cn/api/paas/v4"
 
-GLM_MODELS = [
-    "glm-5",
-    "glm-4-plus",
-]
-
 
 class GLMAdapter(OpenAIAdapter):
     """Adapter for Zhipu AI GLM models.
@@ -24,10 +20,12 @@ class GLMAdapter(OpenAIAdapter):
     """
 
     provider_name = "glm"
+    provider_label = "GLM"
     _token_limit_param = "max_tokens"
+    _prompt_cache_key = False
 
-    def __init__(self):
-        super().__init__(base_url=GLM_BASE_URL)
+    def __init__(self, base_url: str | None = None):
+        super().__init__(base_url=base_url or GLM_BASE_URL)
 
     def get_available_models(self) -> list[str]:
         return GLM_MODELS.copy()
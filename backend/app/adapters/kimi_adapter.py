@@ -6,16 +6,11 @@ may need updating as Moonshot evolves their API.
 
 from __future__ import annotations
 
+from .catalog import KIMI_MODELS
 from .openai_adapter import OpenAIAdapter
 
 KIMI_BASE_URL = "https://api.moonshot.cn/v1"
 
-KIMI_MODELS = [
-    "moonshot-v1-128k",
-    "moonshot-v1-32k",
-    "moonshot-v1-8k",
-]
-
 
 class KimiAdapter(OpenAIAdapter):
     """Adapter for Kimi / Moonshot AI models.
@@ -25,10 +20,12 @@ class KimiAdapter(OpenAIAdapter):
     """
 
     provider_name = "kimi"
+    provider_label = "Kimi"
     _token_limit_param = "max_tokens"
+    _prompt_cache_key = False
 
-    def __init__(self):
-        super().__init__(base_url=KIMI_BASE_URL)
+    def __init__(self, base_url: str | None = None):
+        super().__init__(base_url=base_url or KIMI_BASE_URL)
 
     def get_available_models(self) -> list[str]:
         return KIMI_MODELS.copy()
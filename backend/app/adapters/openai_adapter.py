@@ -3,123 +3,216 @@
 from __future__ import annotations
 
 import logging
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator
 
 import openai
 
-from .base import GenerationConfig, GenerationResult, LLMAdapter, Message
+from .base import (
+    ContextTooLongError,
+    GenerationConfig,
+    GenerationResult,
+    LLMAdapter,
+    Message,
+    ProviderAuthError,
+    ProviderError,
+    StreamChunk,
+    StreamUsage,
+    TransientNetworkError,
+    error_from_status,
+    guarded_call,
+    guarded_stream,
+    parse_retry_after,
+)
+from .catalog import OPENAI_MODELS
+from .clients import client_pool
 
 logger = logging.getLogger(__name__)
 
-OPENAI_MODELS = [
-    "gpt-5.2",
-    "gpt-4o",
-    "gpt-4o-mini",
-]
-
 
 class OpenAIAdapter(LLMAdapter):
     """Adapter for OpenAI's GPT models via the Chat Completions API."""
 
     provider_name = "openai"
+    provider_label = "OpenAI"
     # Newer OpenAI models (GPT-5.2, o-series) require 'max_completion_tokens'
     # instead of 'max_tokens'. Third-party OpenAI-compatible providers that
     # don't yet support this parameter can override with "max_tokens".
     _token_limit_param = "max_completion_tokens"
+    # Ask for a trailing usage chunk on streams (stream_options.include_usage).
+    # Compatible providers that reject stream_options can turn this off.
+    _stream_usage = True
+    # Send GenerationConfig.cache_key as prompt_cache_key so requests that
+    # share a prefix land on the same cache shard. OpenAI's caching is
+    # automatic and prefix-based; compatible providers cache on their own
+    # and may reject the parameter.
+    _prompt_cache_key = True
 
     def __init__(self, base_url: str | None = None):
-        """Initialize with optional custom base URL (used by xAI adapter)."""
+        """Initialize with optional custom base URL (used by compatible providers)."""
         self._base_url = base_url
 
+    @guarded_stream
     async def generate_stream(
         self,
         messages: list[Message],
         config: GenerationConfig,
         api_key: str,
-    ) -> AsyncGenerator[str, None]:
-        client = openai.AsyncOpenAI(api_key=api_key, base_url=self._base_url)
-        api_messages = self._prepare_messages(messages)
-
-        try:
-            stream = await client.chat.completions.create(
-                model=config.model,
-                messages=api_messages,
-                temperature=config.temperature,
-                stream=True,
-                **{self._token_limit_param: config.max_tokens},
-            )
-            async for chunk in stream:
-                if chunk.choices and chunk.choices[0].delta.content:
-                    yield chunk.choices[0].delta.content
-        except openai.AuthenticationError:
-            raise ValueError("Invalid OpenAI API key")
-        except openai.NotFoundError:
-            raise RuntimeError(
-                f"Model '{config.model}' was not found or is not a chat model. "
-                "Please check the model name and try a different one."
-            )
-        except openai.RateLimitError:
-            raise RuntimeError("OpenAI rate limit exceeded. Please wait and retry.")
-        except openai.APIError as e:
-            raise RuntimeError(f"OpenAI API error: {e}")
-
+    ) -> AsyncGenerator[StreamChunk, None]:
+        with self._client(api_key) as client:
+            api_messages = self._prepare_messages(messages)
+            extra = self._request_params(config)
+            if self._stream_usage:
+                extra["stream_options"] = {"include_usage": True}
+
+            try:
+                stream = await client.chat.completions.create(
+                    model=config.model,
+                    messages=api_messages,
+                    temperature=config.temperature,
+                    stream=True,
+                    **{self._token_limit_param: config.max_tokens},
+                    **extra,
+                )
+                usage = None
+                model = config.model
+                finish_reason = ""
+                async for chunk in stream:
+                    if chunk.choices:
+                        choice = chunk.choices[0]
+                        if choice.delta and choice.delta.content:
+                            yield choice.delta.content
+                        if choice.finish_reason:
+                            finish_reason = choice.finish_reason
+                    if chunk.usage:
+                        usage = chunk.usage
+                    model = chunk.model or model
+                if usage is not None:
+                    cache_read, cache_write = _cache_usage(usage)
+                    yield StreamUsage(
+                        input_tokens=usage.prompt_tokens or 0,
+                        output_tokens=usage.completion_tokens or 0,
+                        model=model,
+                        finish_reason=finish_reason,
+                        cache_read_tokens=cache_read,
+                        cache_write_tokens=cache_write,
+                    )
+            except openai.APIError as e:
+                raise self._translate_error(e, config.model) from e
+
+    @guarded_call
     async def generate(
         self,
         messages: list[Message],
         config: GenerationConfig,
         api_key: str,
     ) -> GenerationResult:
-        client = openai.AsyncOpenAI(api_key=api_key, base_url=self._base_url)
-        api_messages = self._prepare_messages(messages)
-
-        try:
-            response = await client.chat.completions.create(
-                model=config.model,
-                messages=api_messages,
-                temperature=config.temperature,
-                **{self._token_limit_param: config.max_tokens},
-            )
-            choice = response.choices[0]
-            return GenerationResult(
-                content=choice.message.content or "",
-                input_tokens=response.usage.prompt_tokens if response.usage else 0,
-                output_tokens=response.usage.completion_tokens if response.usage else 0,
-                model=response.model,
-                finish_reason=choice.finish_reason or "",
-            )
-        except openai.AuthenticationError:
-            raise ValueError("Invalid OpenAI API key")
-        except openai.NotFoundError:
-            raise RuntimeError(
-                f"Model '{config.model}' was not found or is not a chat model. "
-                "Please check the model name and try a different one."
-            )
-        except openai.RateLimitError:
-            raise RuntimeError("OpenAI rate limit exceeded. Please wait and retry.")
-        except openai.APIError as e:
-            raise RuntimeError(f"OpenAI API error: {e}")
-
+        with self._client(api_key) as client:
+            api_messages = self._prepare_messages(messages)
+
+            try:
+                response = await client.chat.completions.create(
+                    model=config.model,
+                    messages=api_messages,
+                    temperature=config.temperature,
+                    **{self._token_limit_param: config.max_tokens},
+                    **self._request_params(config),
+                )
+                choice = response.choices[0]
+                usage = response.usage
+                cache_read, cache_write = _cache_usage(usage) if usage else (0, 0)
+                return GenerationResult(
+                    content=choice.message.content or "",
+                    input_tokens=usage.prompt_tokens if usage else 0,
+                    output_tokens=usage.completion_tokens if usage else 0,
+                    model=response.model,
+                    finish_reason=choice.finish_reason or "",
+                    cache_read_tokens=cache_read,
+                    cache_write_tokens=cache_write,
+                )
+            except openai.APIError as e:
+                raise self._translate_error(e, config.model) from e
+
+    @guarded_call
     async def validate_key(self, api_key: str) -> bool:
-        client = openai.AsyncOpenAI(api_key=api_key, base_url=self._base_url)
-        try:
-            await client.models.list()
-            return True
-        except openai.AuthenticationError:
-            return False
-        except openai.RateLimitError:
-            raise RuntimeError("Rate limited. Please wait a moment and try again.")
-        except openai.APIConnectionError:
-            raise RuntimeError(
-                f"Could not connect to the {self.provider_name} API. "
-                "Check your network connection."
-            )
-        except openai.APIError as e:
-            raise RuntimeError(f"API error from {self.provider_name}: {e.message}")
+        with self._client(api_key) as client:
+            try:
+                await client.models.list()
+                return True
+            except openai.APIError as e:
+                error = self._translate_error(e)
+                if isinstance(error, ProviderAuthError):
+                    return False
+                raise error from e
 
     def get_available_models(self) -> list[str]:
         return OPENAI_MODELS.copy()
 
+    def _request_params(self, config: GenerationConfig) -> dict:
+        params = {}
+        if self._prompt_cache_key and config.cache_key:
+            params["prompt_cache_key"] = config.cache_key
+        if config.timeout is not None:
+            params["timeout"] = config.timeout
+        return params
+
+    def _client(self, api_key: str) -> openai.AsyncOpenAI:
+        """Lease a pooled client so keep-alive connections are reused."""
+        return client_pool.lease(
+            self.provider_name,
+            self._base_url,
+            api_key,
+            # Retries are handled by guarded_stream/guarded_call
+            lambda: openai.AsyncOpenAI(
+                api_key=api_key, base_url=self._base_url, max_retries=0
+            ),
+        )
+
+    def _translate_error(self, e: openai.APIError, model: str = "") -> ProviderError:
+        """Convert an OpenAI SDK exception into a typed ProviderError."""
+        if isinstance(e, openai.APIConnectionError):  # Includes timeouts
+            return TransientNetworkError(
+                f"Could not connect to the {self.label} API. "
+                "Check your network connection.",
+                provider=self.label,
+            )
+        if isinstance(e, openai.NotFoundError) and model:
+            return ProviderError(
+                f"Model '{model}' was not found or is not a chat model. "
+                "Please check the model name and try a different one.",
+                provider=self.label,
+            )
+        if isinstance(e, openai.APIStatusError):
+            if e.code == "context_length_exceeded":
+                return ContextTooLongError(
+                    f"{self.label} rejected the prompt as too long: {e.message}",
+                    provider=self.label,
+                )
+            return error_from_status(
+                self.label,
+                e.status_code,
+                e.message,
+                parse_retry_after(e.response.headers),
+            )
+        return ProviderError(f"{self.label} API error: {e}", provider=self.label)
+
     @staticmethod
     def _prepare_messages(messages: list[Message]) -> list[dict]:
         """Convert our Message objects to OpenAI's format."""
         return [{"role": msg.role.value, "content": msg.content} for msg in messages]
+
+
+def _cache_usage(usage: Any) -> tuple[int, int]:
+    """Return (cache read, cache write) prompt tokens from a usage object.
+
+    OpenAI reports cache hits in prompt_tokens_details; DeepSeek and Kimi
+    use their own top-level fields.
+    """
+    details = getattr(usage, "prompt_tokens_details", None)
+    read = (
+        getattr(details, "cached_tokens", None)
+        or getattr(usage, "prompt_cache_hit_tokens", None)  # DeepSeek
+        or getattr(usage, "cached_tokens", None)  # Kimi
+        or 0
+    )
+    write = getattr(details, "cache_write_tokens", None) or 0
+    return int(read), int(write)
@@ -6,18 +6,13 @@ may need updating as Alibaba evolves their API.
 
 from __future__ import annotations
 
+from .catalog import QWEN_MODELS
 from .openai_adapter import OpenAIAdapter
 
 # International endpoint; use https://dashscope.aliyuncs.com/compatible-mode/v1
 # for China mainland.
 QWEN_BASE_URL = "https://dashscope-intl.aliyuncs.com/compatible-mode/v1"
 
-QWEN_MODELS = [
-    "qwen3-max",
-    "qwen3.5-plus",
-    "qwen-plus",
-]
-
 
 class QwenAdapter(OpenAIAdapter):
     """Adapter for Alibaba Qwen models via DashScope.
@@ -27,10 +22,12 @@ class QwenAdapter(OpenAIAdapter):
     """
 
     provider_name = "qwen"
+    provider_label = "Qwen"
     _token_limit_param = "max_tokens"
+    _prompt_cache_key = False
 
-    def __init__(self):
-        super().__init__(base_url=QWEN_BASE_URL)
+    def __init__(self, base_url: str | None = None):
+        super().__init__(base_url=base_url or QWEN_BASE_URL)
 
     def get_available_models(self) -> list[str]:
         return QWEN_MODELS.copy()
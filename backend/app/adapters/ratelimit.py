@@ -0,0 +1,186 @@
+"""Process-wide client-side rate limiting per provider API key.
+
+Several debates often share one provider key. Without client-side
+budgeting they stampede into 429s, so every adapter call first waits for
+capacity in a requests-per-minute and a tokens-per-minute token bucket
+keyed by (provider, key hash). Waits are recorded so quotas can be sized.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+
+from .clients import hash_api_key
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ProviderLimits:
+    """Per-key budgets for one provider."""
+
+    requests_per_minute: int
+    tokens_per_minute: int
+
+
+# Defaults sized for typical entry-level API tiers; override per provider
+# with RATE_LIMITS="openai=500:800000,anthropic=50:40000" (rpm:tpm).
+DEFAULT_LIMITS = ProviderLimits(requests_per_minute=60, tokens_per_minute=200_000)
+
+PROVIDER_LIMITS: dict[str, ProviderLimits] = {
+    "anthropic": ProviderLimits(50, 80_000),
+    "openai": ProviderLimits(500, 500_000),
+    "google": ProviderLimits(150, 1_000_000),
+}
+
+
+def _load_env_limits() -> None:
+    spec = os.environ.get("RATE_LIMITS", "")
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        try:
+            provider, values = item.split("=", 1)
+            rpm, tpm = values.split(":", 1)
+            PROVIDER_LIMITS[provider.strip()] = ProviderLimits(int(rpm), int(tpm))
+        except ValueError:
+            logger.warning(f"Ignoring malformed RATE_LIMITS entry: {item!r}")
+
+
+_load_env_limits()
+
+
+class TokenBucket:
+    """Async token bucket that refills continuously.
+
+    Waiters are served in FIFO order. The balance may go negative when a
+    reservation is settled above its estimate; later callers then wait
+    for the debt to refill.
+    """
+
+    def __init__(self, per_minute: int):
+        self.capacity = float(max(per_minute, 1))
+        self.rate = self.capacity / 60.0  # tokens per second
+        self.tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self, amount: float) -> float:
+        """Take ``amount`` from the bucket, waiting for capacity.
+
+        Returns:
+            Seconds spent waiting.
+        """
+        amount = min(amount, self.capacity)  # Oversized requests wait for a full bucket
+        started = time.monotonic()
+        async with self._lock:
+            while True:
+                self._refill()
+                if self.tokens >= amount:
+                    self.tokens -= amount
+                    return time.monotonic() - started
+                await asyncio.sleep((amount - self.tokens) / self.rate)
+
+    def adjust(self, delta: float) -> None:
+        """Debit (positive) or refund (negative) tokens after the fact."""
+        self._refill()
+        self.tokens = min(self.capacity, self.tokens - delta)
+
+
+@dataclass
+class WaitStats:
+    """Queueing statistics for one (provider, key) limiter."""
+
+    requests: int = 0
+    delayed: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+    waiting: int = 0
+
+    def to_dict(self) -> dict:
+        return {
+            "requests": self.requests,
+            "delayed": self.delayed,
+            "waiting": self.waiting,
+            "total_wait_seconds": round(self.total_wait, 3),
+            "avg_wait_seconds": round(self.total_wait / self.requests, 3)
+            if self.requests else 0.0,
+            "max_wait_seconds": round(self.max_wait, 3),
+        }
+
+
+@dataclass
+class _KeyLimiter:
+    requests: TokenBucket
+    tokens: TokenBucket
+    stats: WaitStats = field(default_factory=WaitStats)
+
+
+@dataclass
+class Reservation:
+    """Handle for settling a call's estimated token spend."""
+
+    limiter: _KeyLimiter
+    estimated_tokens: int
+    waited: float
+
+    def settle(self, actual_tokens: int) -> None:
+        """Correct the token bucket once real usage is known."""
+        self.limiter.tokens.adjust(actual_tokens - self.estimated_tokens)
+
+
+class RateLimiterRegistry:
+    """Rate limiters keyed by (provider, API key hash)."""
+
+    def __init__(self):
+        self._limiters: dict[tuple[str, str], _KeyLimiter] = {}
+
+    def _limiter(self, provider: str, api_key: str) -> _KeyLimiter:
+        key = (provider, hash_api_key(api_key))
+        limiter = self._limiters.get(key)
+        if limiter is None:
+            limits = PROVIDER_LIMITS.get(provider, DEFAULT_LIMITS)
+            limiter = self._limiters[key] = _KeyLimiter(
+                requests=TokenBucket(limits.requests_per_minute),
+                tokens=TokenBucket(limits.tokens_per_minute),
+            )
+        return limiter
+
+    async def acquire(self, provider: str, api_key: str, tokens: int) -> Reservation:
+        """Wait until one request and ``tokens`` tokens fit the key's budget."""
+        limiter = self._limiter(provider, api_key)
+        stats = limiter.stats
+        stats.waiting += 1
+        try:
+            waited = await limiter.requests.acquire(1)
+            waited += await limiter.tokens.acquire(tokens)
+        finally:
+            stats.waiting -= 1
+        stats.requests += 1
+        stats.total_wait += waited
+        stats.max_wait = max(stats.max_wait, waited)
+        if waited > 0.01:
+            stats.delayed += 1
+            logger.info(f"{provider} call waited {waited:.2f}s for rate-limit capacity")
+        return Reservation(limiter=limiter, estimated_tokens=tokens, waited=waited)
+
+    def snapshot(self) -> list[dict]:
+        """Per-limiter queue statistics, identified by a short key hash."""
+        return [
+            {"provider": provider, "key": key_hash[:8], **limiter.stats.to_dict()}
+            for (provider, key_hash), limiter in self._limiters.items()
+        ]
+
+    def clear(self) -> None:
+        self._limiters.clear()
+
+
+# Global singleton
+rate_limiter = RateLimiterRegistry()
@@ -0,0 +1,215 @@
+"""Stream timing per (provider, model).
+
+A slow debate turn can come from three places: waiting in the rate
+limiter or the provider's queue (time to first token), slow generation
+(tokens per second), or our own handling of each chunk. The last one is
+time the caller spends between receiving a chunk and asking for the
+next, such as emitting events. ``guarded_stream`` times every stream with
+a ``StreamTimer``. The result is attached to the stream's ``StreamUsage``
+and recorded here, so recent percentiles are available per model.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from dataclasses import dataclass, field
+
+# Recent streams kept per (provider, model) for percentiles
+SAMPLE_SIZE = 256
+
+# Fewer recent streams than this give no usable percentile
+MIN_SAMPLES = 5
+
+
+@dataclass
+class StreamTiming:
+    """Timing of one completed generation stream, in seconds."""
+
+    provider: str
+    model: str
+    attempts: int = 1
+    queued: float = 0.0  # Waiting for client-side rate-limit capacity
+    ttft: float = 0.0  # Request sent (final attempt) to first text chunk
+    generation: float = 0.0  # First to last chunk, excluding caller time
+    duration: float = 0.0  # Whole call, retries and waits included
+    chunks: int = 0
+    output_tokens: int = 0
+    gap_mean: float = 0.0  # Provider-side wait between chunks
+    gap_max: float = 0.0
+    consumer: float = 0.0  # Caller time between receiving and requesting chunks
+
+    @property
+    def tokens_per_second(self) -> float:
+        return self.output_tokens / self.generation if self.generation > 0 else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "provider": self.provider,
+            "model": self.model,
+            "attempts": self.attempts,
+            "queued_seconds": round(self.queued, 4),
+            "ttft_seconds": round(self.ttft, 4),
+            "generation_seconds": round(self.generation, 4),
+            "duration_seconds": round(self.duration, 4),
+            "chunks": self.chunks,
+            "output_tokens": self.output_tokens,
+            "tokens_per_second": round(self.tokens_per_second, 1),
+            "gap_mean_seconds": round(self.gap_mean, 4),
+            "gap_max_seconds": round(self.gap_max, 4),
+            "consumer_seconds": round(self.consumer, 4),
+        }
+
+
+class StreamTimer:
+    """Collects the timing of one guarded stream across its attempts."""
+
+    def __init__(self, provider: str, model: str):
+        self.provider = provider
+        self.model = model
+        self.started = time.monotonic()
+        self.attempts = 0
+        self.queued = 0.0
+        self._requested = self.started
+        self._first: float | None = None
+        self._last: float | None = None
+        self._released: float | None = None
+        self._chunks = 0
+        self._gap_total = 0.0
+        self._gap_max = 0.0
+        self._consumer = 0.0
+        self._timing: StreamTiming | None = None
+
+    def attempt(self, queued: float) -> None:
+        """Mark a request as sent after ``queued`` seconds of rate limiting."""
+        self.attempts += 1
+        self.queued += queued
+        self._requested = time.monotonic()
+        self._first = self._last = self._released = None
+        self._chunks = 0
+        self._gap_total = self._gap_max = self._consumer = 0.0
+
+    def received(self) -> None:
+        """Mark a text chunk as received from the provider."""
+        now = time.monotonic()
+        if self._first is None:
+            self._first = now
+        elif self._released is not None:
+            # Time since the caller asked for this chunk
+            gap = now - self._released
+            self._gap_total += gap
+            self._gap_max = max(self._gap_max, gap)
+        self._last = now
+        self._chunks += 1
+
+    def released(self) -> None:
+        """Mark the caller as done with the last chunk."""
+        self._released = time.monotonic()
+        if self._last is not None:
+            self._consumer += self._released - self._last
+
+    def finish(self, output_tokens: int | None = None) -> StreamTiming:
+        """Return the stream's timing; the first call fixes it."""
+        if self._timing is None:
+            now = time.monotonic()
+            first = self._first if self._first is not None else now
+            last = self._last if self._last is not None else first
+            # The caller's time with the last chunk isn't generation time
+            consumer = self._consumer
+            if self._released is not None and self._last is not None and self._released >= self._last:
+                consumer -= self._released - self._last
+            self._timing = StreamTiming(
+                provider=self.provider,
+                model=self.model,
+                attempts=self.attempts,
+                queued=self.queued,
+                ttft=first - self._requested,
+                generation=max(0.0, last - first - consumer),
+                duration=now - self.started,
+                chunks=self._chunks,
+                output_tokens=self._chunks if output_tokens is None else output_tokens,
+                gap_mean=self._gap_total / (self._chunks - 1) if self._chunks > 1 else 0.0,
+                gap_max=self._gap_max,
+                consumer=self._consumer,
+            )
+        return self._timing
+
+
+@dataclass
+class _ModelTimings:
+    streams: int = 0
+    errors: int = 0
+    samples: deque[StreamTiming] = field(default_factory=lambda: deque(maxlen=SAMPLE_SIZE))
+
+    def to_dict(self) -> dict:
+        samples = list(self.samples)
+        ttft = sorted(s.ttft for s in samples)
+        rates = sorted(s.tokens_per_second for s in samples if s.generation > 0)
+        durations = sorted(s.duration for s in samples)
+        return {
+            "streams": self.streams,
+            "errors": self.errors,
+            "samples": len(samples),
+            "ttft_p50_seconds": round(_percentile(ttft, 0.5), 4),
+            "ttft_p95_seconds": round(_percentile(ttft, 0.95), 4),
+            "tokens_per_second_p50": round(_percentile(rates, 0.5), 1),
+            "tokens_per_second_p5": round(_percentile(rates, 0.05), 1),
+            "duration_p50_seconds": round(_percentile(durations, 0.5), 4),
+            "duration_p95_seconds": round(_percentile(durations, 0.95), 4),
+            "queued_avg_seconds": round(_mean([s.queued for s in samples]), 4),
+            "gap_max_seconds": round(max((s.gap_max for s in samples), default=0.0), 4),
+            "consumer_avg_seconds": round(_mean([s.consumer for s in samples]), 4),
+        }
+
+
+class TimingRegistry:
+    """Recent stream timings keyed by (provider, model)."""
+
+    def __init__(self):
+        self._models: dict[tuple[str, str], _ModelTimings] = {}
+
+    def _entry(self, provider: str, model: str) -> _ModelTimings:
+        key = (provider, model)
+        entry = self._models.get(key)
+        if entry is None:
+            entry = self._models[key] = _ModelTimings()
+        return entry
+
+    def record(self, timing: StreamTiming) -> None:
+        entry = self._entry(timing.provider, timing.model)
+        entry.streams += 1
+        entry.samples.append(timing)
+
+    def record_error(self, provider: str, model: str) -> None:
+        self._entry(provider, model).errors += 1
+
+    def ttft_quantile(self, provider: str, model: str, q: float) -> float | None:
+        """Return the ``q`` quantile of recent TTFTs, or None with too few samples."""
+        entry = self._models.get((provider, model))
+        if entry is None or len(entry.samples) < MIN_SAMPLES:
+            return None
+        return _percentile(sorted(s.ttft for s in entry.samples), q)
+
+    def snapshot(self) -> list[dict]:
+        return [
+            {"provider": provider, "model": model, **entry.to_dict()}
+            for (provider, model), entry in self._models.items()
+        ]
+
+    def clear(self) -> None:
+        self._models.clear()
+
+
+def _percentile(ordered: list[float], q: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def _mean(values: list[float]) -> float:
+    return sum(values) / len(values) if values else 0.0
+
+
+# Global singleton
+stream_timings = TimingRegistry()
@@ -2,17 +2,11 @@
 
 from __future__ import annotations
 
+from .catalog import XAI_MODELS
 from .openai_adapter import OpenAIAdapter
 
 XAI_BASE_URL = "https://api.x.ai/v1"
 
-XAI_MODELS = [
-    "grok-3",
-    "grok-3-mini",
-    "grok-2",
-    "grok-2-mini",
-]
-
 
 class XAIAdapter(OpenAIAdapter):
     """Adapter for xAI's Grok models.
@@ -22,10 +16,12 @@ class XAIAdapter(OpenAIAdapter):
     """
 
     provider_name = "xai"
+    provider_label = "xAI"
     _token_limit_param = "max_tokens"
+    _prompt_cache_key = False
 
-    def __init__(self):
-        super().__init__(base_url=XAI_BASE_URL)
+    def __init__(self, base_url: str | None = None):
+        super().__init__(base_url=base_url or XAI_BASE_URL)
 
     def get_available_models(self) -> list[str]:
         return XAI_MODELS.copy()
@@ -4,20 +4,27 @@ from __future__ import annotations
 
 import json
 import logging
+import uuid
 from typing import AsyncGenerator
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Header, HTTPException
 from fastapi.responses import StreamingResponse
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
-from ..adapters.base import GenerationConfig, Message, MessageRole
+from ..adapters.base import GenerationConfig, Message, MessageRole, StreamUsage
 from ..adapters.factory import get_adapter
-from ..orchestrator.consensus import compute_consensus
-from ..orchestrator.prompts import (
-    build_conspectus_prompt,
-    build_system_prompt,
-    build_turn_prompt,
+from ..models.debate import PromptLayout
+from ..orchestrator.coalesce import (
+    DEFAULT_MAX_BYTES,
+    DEFAULT_WINDOW_MS,
+    CoalescePolicy,
+    coalesce_chunks,
 )
+from ..orchestrator.consensus import compute_consensus
+from ..orchestrator.prompts import build_cache_key, build_conspectus_prompt
+from ..orchestrator.transcript import TranscriptRenderer
+from ..services.hub import sse_frame
+from ..services.tasks import debate_tasks
 
 logger = logging.getLogger(__name__)
 
@@ -36,13 +43,24 @@ class ParticipantPayload(BaseModel):
     temperature: float = 0.45
 
 
-class TurnRequest(BaseModel):
+class StreamCadence(BaseModel):
+    """How token text is batched into SSE frames for this client."""
+
+    token_flush_ms: int = Field(default=DEFAULT_WINDOW_MS, ge=0, le=1000)  # 0 sends every chunk
+    token_flush_bytes: int = Field(default=DEFAULT_MAX_BYTES, ge=1)
+
+    def coalesce_policy(self) -> CoalescePolicy:
+        return CoalescePolicy.from_options(self.token_flush_ms, self.token_flush_bytes)
+
+
+class TurnRequest(StreamCadence):
     topic: str
     participant: ParticipantPayload
     transcript: list[dict]  # [{"speaker": "...", "content": "..."}]
     api_key: str
     max_tokens: int = 1024
     temperature: float = 0.45
+    prompt_layout: PromptLayout = PromptLayout.TRANSCRIPT
 
 
 class ConsensusRequest(BaseModel):
@@ -54,7 +72,7 @@ class ConsensusRequest(BaseModel):
     adapter_api_key: str | None = None
 
 
-class ConspectusRequest(BaseModel):
+class ConspectusRequest(StreamCadence):
     topic: str
     transcript: list[dict]
     participants: list[str]
@@ -75,35 +93,48 @@ async def debate_turn(request: TurnRequest) -> StreamingResponse:
 
     adapter = get_adapter(request.participant.provider)
 
-    system_prompt = build_system_prompt(
+    renderer = TranscriptRenderer(request.topic)
+    for entry in request.transcript:
+        renderer.append(entry["speaker"], entry["content"], entry.get("round", 0))
+    messages = renderer.turn_messages(
         request.participant.display_name,
         request.participant.persona,
+        request.prompt_layout,
     )
-    turn_prompt = build_turn_prompt(request.topic, request.transcript)
-
-    messages = [
-        Message(role=MessageRole.SYSTEM, content=system_prompt),
-        Message(role=MessageRole.USER, content=turn_prompt),
-    ]
     config = GenerationConfig(
         model=request.participant.model,
         max_tokens=request.max_tokens,
         temperature=request.temperature,
+        cache_key=build_cache_key(request.topic, request.participant.display_name),
     )
 
     async def stream() -> AsyncGenerator[str, None]:
         full_content = ""
+        usage: StreamUsage | None = None
         try:
-            async for token in adapter.generate_stream(
-                messages, config, request.api_key
+            async for chunk in coalesce_chunks(
+                adapter.generate_stream(messages, config, request.api_key),
+                request.coalesce_policy(),
             ):
-                full_content += token
-                yield f"data: {json.dumps({'type': 'token', 'content': token})}\n\n"
-
-            token_count = len(full_content.split())
-            yield (
-                f"data: {json.dumps({'type': 'done', 'content': full_content, 'token_count': token_count})}\n\n"
-            )
+                if isinstance(chunk, StreamUsage):
+                    usage = chunk
+                    continue
+                full_content += chunk
+                yield f"data: {json.dumps({'type': 'token', 'content': chunk})}\n\n"
+
+            done = {
+                "type": "done",
+                "content": full_content,
+                "token_count": (
+                    usage.output_tokens if usage else len(full_content.split())
+                ),
+                "input_tokens": usage.input_tokens if usage else 0,
+                "cache_read_tokens": usage.cache_read_tokens if usage else 0,
+                "cache_write_tokens": usage.cache_write_tokens if usage else 0,
+                "finish_reason": usage.finish_reason if usage else "",
+                "timing": usage.timing.to_dict() if usage and usage.timing else None,
+            }
+            yield f"data: {json.dumps(done)}\n\n"
         except Exception as e:
             logger.error(f"Turn error for {request.participant.display_name}: {e}")
             yield f"data: {json.dumps({'type': 'error', 'error': str(e)})}\n\n"
@@ -158,14 +189,77 @@ async def debate_conspectus(request: ConspectusRequest) -> StreamingResponse:
     async def stream() -> AsyncGenerator[str, None]:
         full_content = ""
         try:
-            async for token in adapter.generate_stream(
-                messages, config, request.api_key
+            async for chunk in coalesce_chunks(
+                adapter.generate_stream(messages, config, request.api_key),
+                request.coalesce_policy(),
             ):
-                full_content += token
-                yield f"data: {json.dumps({'type': 'token', 'content': token})}\n\n"
+                if isinstance(chunk, StreamUsage):
+                    continue
+                full_content += chunk
+                yield f"data: {json.dumps({'type': 'token', 'content': chunk})}\n\n"
             yield f"data: {json.dumps({'type': 'done', 'content': full_content})}\n\n"
         except Exception as e:
             logger.error(f"Conspectus error: {e}")
             yield f"data: {json.dumps({'type': 'error', 'error': str(e)})}\n\n"
 
     return StreamingResponse(stream(), media_type="text/event-stream")
+
+
+@router.get("/{session_id}/events")
+async def debate_events(
+    session_id: str,
+    after_seq: int | None = None,
+    last_event_id: str | None = Header(default=None),
+) -> StreamingResponse:
+    """Watch a running debate as SSE.
+
+    The stream opens with a ``debate:snapshot`` of the debate so far,
+    replays the events of the turns in progress, then follows the live
+    events until the debate ends. Each frame's id is its event's seq.
+    A reconnecting client (``Last-Event-ID``, or ``after_seq``) gets only
+    the events it missed, or a snapshot if the log no longer has them.
+    A debate that already ended with nobody watching sends its
+    ``debate:results`` instead.
+    """
+    if after_seq is None and last_event_id and last_event_id.isdigit():
+        after_seq = int(last_event_id)
+    debate = debate_tasks.find(session_id)
+    if debate is None or debate.hub is None:
+        results = debate_tasks.results(session_id)
+        if results is None:
+            raise HTTPException(status_code=404, detail="Unknown debate")
+
+        async def finished() -> AsyncGenerator[str, None]:
+            yield sse_frame("debate:results", {"session_id": session_id, "session": results})
+
+        return StreamingResponse(finished(), media_type="text/event-stream")
+
+    viewer = f"sse:{uuid.uuid4()}"
+
+    async def stream() -> AsyncGenerator[str, None]:
+        # Joined only once the response is streaming, so a client that
+        # drops before then leaves nothing behind
+        subscription = None
+        try:
+            # Spectators count as viewers, so a watched debate is never abandoned
+            debate = debate_tasks.join(session_id, viewer)
+            if debate is None:  # Ended in the meantime
+                results = debate_tasks.results(session_id)
+                if results is not None:
+                    yield sse_frame(
+                        "debate:results", {"session_id": session_id, "session": results}
+                    )
+                return
+            subscription = debate.hub.subscribe(after_seq)
+            if subscription.snapshot is not None:
+                yield sse_frame("debate:snapshot", subscription.snapshot)
+            for frame in subscription.replay:
+                yield frame.sse
+            async for frame in subscription:
+                yield frame.sse
+        finally:
+            if subscription is not None:
+                debate.hub.unsubscribe(subscription)
+            debate_tasks.leave(viewer)
+
+    return StreamingResponse(stream(), media_type="text/event-stream")
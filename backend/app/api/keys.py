@@ -4,8 +4,14 @@ from __future__ import annotations
 
 from fastapi import APIRouter
 
-from ..adapters.factory import PROVIDER_MODELS, get_adapter
-from ..models.providers import KeyValidationRequest, KeyValidationResponse
+from ..adapters.factory import PROVIDER_MODELS
+from ..models.providers import (
+    KeyValidationBatchRequest,
+    KeyValidationBatchResponse,
+    KeyValidationRequest,
+    KeyValidationResponse,
+)
+from ..services.validation import key_validator
 
 router = APIRouter(prefix="/api/keys", tags=["keys"])
 
@@ -14,41 +20,21 @@ router = APIRouter(prefix="/api/keys", tags=["keys"])
 async def validate_key(request: KeyValidationRequest) -> KeyValidationResponse:
     """Validate an API key for a given provider.
 
-    Makes a minimal API call to verify the key is functional.
-    The key is NOT stored — it's used only for this validation call.
+    Makes a minimal API call to verify the key is functional, unless the
+    same key was validated recently. The key is NOT stored — only a
+    salted hash of it is kept alongside the cached outcome.
     """
-    try:
-        adapter = get_adapter(request.provider.value)
-    except ValueError as e:
-        return KeyValidationResponse(
-            provider=request.provider,
-            valid=False,
-            message=str(e),
-        )
-
-    try:
-        is_valid = await adapter.validate_key(request.api_key)
-    except RuntimeError as e:
-        # Non-auth failures (network, rate limit, API errors)
-        return KeyValidationResponse(
-            provider=request.provider,
-            valid=False,
-            message=str(e),
-        )
-
-    if is_valid:
-        return KeyValidationResponse(
-            provider=request.provider,
-            valid=True,
-            message="API key is valid.",
-            available_models=PROVIDER_MODELS.get(request.provider.value, []),
-        )
-    else:
-        return KeyValidationResponse(
-            provider=request.provider,
-            valid=False,
-            message="Invalid API key. Please check your key and try again.",
-        )
+    return await key_validator.validate(request)
+
+
+@router.post("/validate-batch", response_model=KeyValidationBatchResponse)
+async def validate_keys(request: KeyValidationBatchRequest) -> KeyValidationBatchResponse:
+    """Validate several API keys concurrently.
+
+    Each provider call is bounded by its own timeout, so one slow
+    provider can't hold up the others' results.
+    """
+    return KeyValidationBatchResponse(results=await key_validator.validate_many(request.keys))
 
 
 @router.get("/providers")
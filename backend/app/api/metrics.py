@@ -0,0 +1,43 @@
+"""Operational metrics endpoints."""
+
+from __future__ import annotations
+
+from fastapi import APIRouter
+
+from ..adapters.circuit import breakers
+from ..adapters.ratelimit import rate_limiter
+from ..adapters.timing import stream_timings
+from ..services.tasks import debate_tasks
+from ..ws.emitter import emitters
+
+router = APIRouter(prefix="/api/metrics", tags=["metrics"])
+
+
+@router.get("/rate-limits")
+async def rate_limit_metrics() -> dict:
+    """Queue wait statistics for each (provider, API key) rate limiter."""
+    return {"limiters": rate_limiter.snapshot()}
+
+
+@router.get("/breakers")
+async def breaker_metrics() -> dict:
+    """Circuit breaker state for each (provider, model) seen so far."""
+    return {"breakers": breakers.snapshot()}
+
+
+@router.get("/streams")
+async def stream_metrics() -> dict:
+    """Recent time-to-first-token, throughput and duration per (provider, model)."""
+    return {"streams": stream_timings.snapshot()}
+
+
+@router.get("/debates")
+async def debate_metrics() -> dict:
+    """Debates currently running as background tasks."""
+    return {"debates": debate_tasks.snapshot()}
+
+
+@router.get("/emitters")
+async def emitter_metrics() -> dict:
+    """Queue depth, lag and overflow counts for each live debate's event emitter."""
+    return {"emitters": emitters.snapshot()}
@@ -9,10 +9,13 @@ import socketio
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from .adapters.clients import client_pool
 from .api.debate import router as debate_router
 from .api.keys import router as keys_router
+from .api.metrics import router as metrics_router
 from .config import config
 from .services.session import session_manager
+from .services.tasks import debate_tasks
 from .ws.debate import register_debate_events
 
 logging.basicConfig(
@@ -29,7 +32,9 @@ async def lifespan(app: FastAPI):
     await session_manager.start_cleanup_loop()
     yield
     logger.info("Shutting down...")
+    await debate_tasks.shutdown()
     await session_manager.stop_cleanup_loop()
+    await client_pool.aclose()
 
 
 # Create Socket.IO server
@@ -61,6 +66,7 @@ app.add_middleware(
 # Include REST API routers
 app.include_router(keys_router)
 app.include_router(debate_router)
+app.include_router(metrics_router)
 
 
 # Health check
@@ -16,6 +16,7 @@ class Provider(str, Enum):
     KIMI = "kimi"
     QWEN = "qwen"
     GLM = "glm"
+    FAKE = "fake"  # In-process fake for load testing
 
 
 class MessageRole(str, Enum):
@@ -33,7 +34,11 @@ class DebateMessage(BaseModel):
     role: MessageRole = MessageRole.ASSISTANT
     content: str = ""
     round_number: int
-    token_count: int = 0
+    token_count: int = 0  # Output tokens (provider-reported when available)
+    input_tokens: int = 0
+    cache_read_tokens: int = 0  # Input tokens served from the provider's prompt cache
+    cache_write_tokens: int = 0  # Input tokens written to the prompt cache
+    truncated: bool = False  # Cut off by a deadline; content is the partial output
 
 
 class Participant(BaseModel):
@@ -44,6 +49,34 @@ class Participant(BaseModel):
     display_name: str
     persona: str = ""  # Optional role/perspective assignment
     temperature: float = Field(default=0.45, ge=0.0, le=2.0)
+    # Used while this participant's model is circuit-broken. Defaults to the
+    # next model in PROVIDER_MODELS for the same provider.
+    fallback_provider: Provider | None = None
+    fallback_model: str | None = None
+    # Target of hedged requests when DebateConfig.hedge_requests is on.
+    # Defaults to this participant's own model.
+    hedge_provider: Provider | None = None
+    hedge_model: str | None = None
+
+
+class PromptLayout(str, Enum):
+    """How the debate so far is presented to each speaker."""
+
+    # One user message holding the whole transcript
+    TRANSCRIPT = "transcript"
+    # The speaker's own turns as assistant messages, everyone else's as user
+    # messages. Each speaker's message prefix is byte-stable between turns.
+    CONVERSATION = "conversation"
+
+
+class RoundStrategy(str, Enum):
+    """How participants take their turns within a round."""
+
+    # One after another; each speaker sees the earlier turns of the round
+    SEQUENTIAL = "sequential"
+    # All at once against the transcript as of the previous round. A round
+    # takes as long as its slowest speaker rather than all of them together.
+    SIMULTANEOUS = "simultaneous"
 
 
 class DebateConfig(BaseModel):
@@ -54,6 +87,22 @@ class DebateConfig(BaseModel):
     max_rounds: int = Field(default=10, ge=1, le=50)
     max_tokens_per_turn: int = Field(default=1024, ge=100, le=4096)
     consensus_threshold: float = Field(default=0.8, ge=0.0, le=1.0)
+    prompt_layout: PromptLayout = PromptLayout.TRANSCRIPT
+    round_strategy: RoundStrategy = RoundStrategy.SEQUENTIAL
+    # Start the next round while the last one's consensus check runs; if the
+    # check ends the debate, the early turns are cancelled and dropped
+    speculative_consensus: bool = False
+    # Re-issue a turn whose first token takes longer than this percentile of
+    # the model's recent TTFTs, keeping whichever request starts first
+    hedge_requests: bool = False
+    hedge_percentile: float = Field(default=0.95, ge=0.5, le=0.99)
+    hedge_budget_usd: float = Field(default=0.25, ge=0.0)  # Cap on extra spend per debate
+    # Deadlines in seconds, not counting time spent paused. A turn cut off by
+    # one keeps its partial output, marked truncated, and the debate moves on.
+    first_token_timeout_seconds: float = Field(default=60.0, gt=0)
+    turn_timeout_seconds: float = Field(default=300.0, gt=0)
+    round_timeout_seconds: float | None = Field(default=None, gt=0)
+    debate_timeout_seconds: float | None = Field(default=None, gt=0)
 
 
 class DebateStatus(str, Enum):
@@ -84,7 +133,10 @@ class DebateSession(BaseModel):
     consensus_history: list[ConsensusResult] = Field(default_factory=list)
     api_keys: dict[str, str] = Field(default_factory=dict)  # provider -> key
     conspectus: str = ""
-    token_usage: dict[str, int] = Field(default_factory=dict)  # speaker -> total tokens
+    token_usage: dict[str, int] = Field(default_factory=dict)  # speaker -> output tokens
+    input_token_usage: dict[str, int] = Field(default_factory=dict)  # speaker -> input tokens
+    hedged_turns: int = 0  # Turns that issued a hedged request
+    hedge_cost_usd: float = 0.0  # Estimated extra spend on hedged requests
 
     model_config = ConfigDict(json_encoders={})
 
@@ -21,3 +21,16 @@ class KeyValidationResponse(BaseModel):
     valid: bool
     message: str = ""
     available_models: list[str] = []
+    cached: bool = False  # Answered from the recent-validation cache
+
+
+class KeyValidationBatchRequest(BaseModel):
+    """Request to validate several provider keys at once."""
+
+    keys: list[KeyValidationRequest]
+
+
+class KeyValidationBatchResponse(BaseModel):
+    """Per-key validation results, in request order."""
+
+    results: list[KeyValidationResponse]
@@ -0,0 +1,153 @@
+"""Coalescing of streamed token text before it reaches a transport.
+
+Providers stream a few characters per chunk, and sending each chunk as
+its own Socket.IO emit or SSE frame costs a socket write and a JSON
+encoding per chunk. Clients only repaint at about 20 fps anyway. This
+stage holds token text back for a short window and sends it as one
+frame. A frame is sent when the window closes or enough text has built
+up. Buffered text is always sent before any other event, so turn
+boundaries are never reordered.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from typing import AsyncGenerator, AsyncIterator, Callable, TypeVar
+
+from ..adapters.base import StreamChunk
+from .engine import DebateEvent
+
+T = TypeVar("T")
+
+# Default cadence: one frame per 50ms (20 fps) or per 1KB of text
+DEFAULT_WINDOW_MS = 50
+DEFAULT_MAX_BYTES = 1024
+
+
+@dataclass(frozen=True)
+class CoalescePolicy:
+    """How long token text may be held back, and how much of it."""
+
+    window: float = DEFAULT_WINDOW_MS / 1000  # Seconds; 0 sends every chunk as is
+    max_bytes: int = DEFAULT_MAX_BYTES
+
+    @classmethod
+    def from_options(cls, window_ms: int | None, max_bytes: int | None) -> CoalescePolicy:
+        """Build a policy from client options, using defaults for missing ones."""
+        return cls(
+            window=max(0, DEFAULT_WINDOW_MS if window_ms is None else window_ms) / 1000,
+            max_bytes=max(1, max_bytes or DEFAULT_MAX_BYTES),
+        )
+
+
+async def coalesce_events(
+    events: AsyncIterator[DebateEvent], policy: CoalescePolicy
+) -> AsyncGenerator[DebateEvent, None]:
+    """Merge consecutive ``debate:token_stream`` events per speaker."""
+
+    def split(event: DebateEvent) -> tuple[str, str] | None:
+        if event.event_type != "debate:token_stream":
+            return None
+        return event.data["speaker"], event.data["token"]
+
+    def join(speaker: str, text: str) -> DebateEvent:
+        return DebateEvent("debate:token_stream", {"speaker": speaker, "token": text})
+
+    async for event in _coalesce(events, policy, split, join):
+        yield event
+
+
+async def coalesce_chunks(
+    chunks: AsyncIterator[StreamChunk], policy: CoalescePolicy
+) -> AsyncGenerator[StreamChunk, None]:
+    """Merge consecutive text chunks of one generation stream."""
+
+    def split(chunk: StreamChunk) -> tuple[str, str] | None:
+        return ("", chunk) if isinstance(chunk, str) else None
+
+    async for chunk in _coalesce(chunks, policy, split, lambda _, text: text):
+        yield chunk
+
+
+async def _coalesce(
+    source: AsyncIterator[T],
+    policy: CoalescePolicy,
+    split: Callable[[T], tuple[str, str] | None],
+    join: Callable[[str, str], T],
+) -> AsyncGenerator[T, None]:
+    """Buffer the text items of ``source`` by key, passing others through.
+
+    ``split`` returns an item's ``(key, text)``, or None for items that
+    are passed through as is. ``join`` builds one item from a key and its
+    buffered text.
+    """
+    if policy.window <= 0:
+        async for item in source:
+            yield item
+        return
+
+    loop = asyncio.get_running_loop()
+    buffers: dict[str, list[str]] = {}
+    size = 0
+    flush_at = 0.0
+    # Read of the next item, kept across a timed flush
+    pending: asyncio.Future | None = None
+
+    def flush() -> list[T]:
+        nonlocal size
+        items = [join(key, "".join(parts)) for key, parts in buffers.items()]
+        buffers.clear()
+        size = 0
+        return items
+
+    try:
+        while True:
+            if not buffers and pending is None:
+                # Nothing held back: no timer needed
+                try:
+                    item = await anext(source)
+                except StopAsyncIteration:
+                    break
+            else:
+                if pending is None:
+                    pending = asyncio.ensure_future(anext(source))
+                if buffers:
+                    await asyncio.wait([pending], timeout=max(0.0, flush_at - loop.time()))
+                    if not pending.done():
+                        for flushed in flush():
+                            yield flushed
+                        continue
+                else:
+                    await asyncio.wait([pending])
+                read, pending = pending, None
+                try:
+                    item = read.result()
+                except StopAsyncIteration:
+                    break
+                except BaseException:
+                    for flushed in flush():
+                        yield flushed
+                    raise
+
+            token = split(item)
+            if token is None:
+                for flushed in flush():
+                    yield flushed
+                yield item
+                continue
+            key, text = token
+            if not buffers:
+                flush_at = loop.time() + policy.window
+            buffers.setdefault(key, []).append(text)
+            size += len(text.encode())
+            if size >= policy.max_bytes:
+                for flushed in flush():
+                    yield flushed
+
+        for flushed in flush():
+            yield flushed
+    finally:
+        if pending is not None:
+            pending.cancel()
+            await asyncio.gather(pending, return_exceptions=True)
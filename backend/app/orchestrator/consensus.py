@@ -98,13 +98,18 @@ async def evaluate_consensus_with_llm(
     adapter: LLMAdapter,
     api_key: str,
     model: str,
+    prompt: str | None = None,
 ) -> dict:
     """Use an LLM to evaluate the consensus state.
 
+    ``prompt`` is the pre-rendered consensus prompt, when the caller keeps
+    one; otherwise it is built from ``round_transcript``.
+
     Returns a dict with consensus_score, agreed_points, contested_points,
     stagnation, and summary.
     """
-    prompt = build_consensus_prompt(topic, round_transcript)
+    if prompt is None:
+        prompt = build_consensus_prompt(topic, round_transcript)
     messages = [
         Message(role=MessageRole.USER, content=prompt),
     ]
@@ -140,6 +145,7 @@ async def compute_consensus(
     adapter: LLMAdapter | None = None,
     api_key: str = "",
     model: str = "",
+    prompt: str | None = None,
 ) -> dict:
     """Compute the composite consensus score using multiple signals.
 
@@ -160,7 +166,7 @@ async def compute_consensus(
     llm_score = 0.5
     if adapter and api_key and model:
         llm_analysis = await evaluate_consensus_with_llm(
-            topic, round_transcript, adapter, api_key, model
+            topic, round_transcript, adapter, api_key, model, prompt
         )
         llm_score = llm_analysis.get("consensus_score", 0.5)
 
@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
+from dataclasses import dataclass, replace
 from typing import AsyncGenerator
 
-from ..adapters.base import GenerationConfig, Message, MessageRole
-from ..adapters.factory import get_adapter
+from ..adapters.base import GenerationConfig, Message, MessageRole, StreamChunk, StreamUsage
+from ..adapters.circuit import BreakerState, breakers
+from ..adapters.factory import PROVIDER_MODELS, get_adapter
 from ..models.debate import (
     ConsensusResult,
     DebateConfig,
@@ -14,12 +18,65 @@ from ..models.debate import (
     DebateSession,
     DebateStatus,
     Participant,
+    Provider,
+    RoundStrategy,
 )
+from ..services.cost import estimate_cost
 from .consensus import compute_consensus
-from .prompts import build_system_prompt, build_turn_prompt
+from .hedging import HedgeOutcome, hedge_delay, hedged_stream
+from .prompts import build_cache_key
+from .transcript import TranscriptRenderer
 
 logger = logging.getLogger(__name__)
 
+# Trial calls a debate sends to a tripped model before leaving it tripped
+MAX_PROBES = 5
+
+# Least seconds between checks of a tripped model's breaker
+PROBE_INTERVAL = 1.0
+
+
+def _prompt_cost(model: str, messages: list[Message]) -> float:
+    """Estimated USD cost of sending ``messages`` to ``model`` (~4 chars per token)."""
+    return estimate_cost(model, sum(len(m.content) for m in messages) // 4, 0)
+
+
+class _TurnInterrupted(Exception):
+    """Raised inside a turn cut short by stop() or a restarting pause()."""
+
+    def __init__(self, reason: str):
+        super().__init__(reason)
+        self.reason = reason  # "stopped" or "paused"
+
+
+class _DeadlineExceeded(Exception):
+    """Raised when a turn, round or debate deadline passes mid-call."""
+
+    def __init__(self, scope: str):
+        super().__init__(scope)
+        self.scope = scope  # "first_token", "turn", "round" or "debate"
+
+
+@dataclass
+class _Turn:
+    """One participant's turn in a round, filled in by ``_take_turn``."""
+
+    participant: Participant
+    started: bool = False
+    chunks: int = 0  # Text chunks streamed by the current attempt
+    chars: int = 0  # Text characters streamed by the current attempt
+    prompt_tokens: int = 0  # Estimated size of the current attempt's prompt
+    message: DebateMessage | None = None
+    # Scope of a round or debate deadline that cut the turn off
+    expired: str | None = None
+
+
+@dataclass
+class _Verdict:
+    """Outcome of a round's consensus check, set by ``_judge_round``."""
+
+    conclude: bool = False
+
 
 class DebateEvent:
     """Events emitted during the debate."""
@@ -37,17 +94,58 @@ class DebateOrchestrator:
 
     def __init__(self, session: DebateSession):
         self.session = session
-        self._paused = False
+        # Rendered prompt pieces, extended once per finished turn
+        self.transcript = TranscriptRenderer(session.config.topic, session.transcript)
         self._stopped = False
-
-    def pause(self) -> None:
-        self._paused = True
+        # Set while running; cleared by pause() so turns stop pulling chunks
+        self._resumed = asyncio.Event()
+        self._resumed.set()
+        # Resolved by stop(), and by pause(restart_turn=True) for turns in flight
+        self._stopping: asyncio.Future | None = None
+        self._restarts: set[asyncio.Future] = set()
+        # Deadlines are measured on _clock(), which stands still while paused
+        self._paused_at: float | None = None
+        self._paused_total = 0.0
+        self._debate_started = 0.0
+        self._round_started = 0.0
+        # Consecutive rounds judged as stagnating
+        self._stagnation_count = 0
+        # Speakers currently routed to a fallback model
+        self._degraded: set[str] = set()
+        # Background half-open probes keyed by (provider, model)
+        self._probes: dict[tuple[str, str], asyncio.Task] = {}
+
+    def pause(self, restart_turn: bool = False) -> None:
+        """Stop consuming turn streams until ``resume()``.
+
+        Provider streams are held open and pick up where they left off.
+        With ``restart_turn`` the turns in flight are cancelled instead,
+        their partial output dropped, and they start over once resumed.
+        """
+        self._resumed.clear()
+        if self._paused_at is None:
+            self._paused_at = time.monotonic()
+        if self.session.status == DebateStatus.RUNNING:
+            self.session.status = DebateStatus.PAUSED
+        if restart_turn:
+            for restart in self._restarts:
+                if not restart.done():
+                    restart.set_result(None)
 
     def resume(self) -> None:
-        self._paused = False
+        if self._paused_at is not None:
+            self._paused_total += time.monotonic() - self._paused_at
+            self._paused_at = None
+        if self.session.status == DebateStatus.PAUSED:
+            self.session.status = DebateStatus.RUNNING
+        self._resumed.set()
 
     def stop(self) -> None:
+        """End the debate, aborting any in-flight provider request."""
         self._stopped = True
+        self._resumed.set()
+        if self._stopping is not None and not self._stopping.done():
+            self._stopping.set_result(None)
 
     async def run(self) -> AsyncGenerator[DebateEvent, None]:
         """Run the debate, yielding events as they occur.
@@ -58,6 +156,19 @@ class DebateOrchestrator:
         Yields:
             DebateEvent objects for each significant state change.
         """
+        try:
+            async for event in self._run():
+                yield event
+        finally:
+            for probe in self._probes.values():
+                probe.cancel()
+            self._probes.clear()
+
+    async def _run(self) -> AsyncGenerator[DebateEvent, None]:
+        self._stopping = asyncio.get_running_loop().create_future()
+        if self._stopped:
+            self._stopping.set_result(None)
+        self._debate_started = self._clock()
         self.session.status = DebateStatus.RUNNING
         yield DebateEvent("debate:started", {
             "session_id": self.session.session_id,
@@ -65,187 +176,730 @@ class DebateOrchestrator:
             "participants": [p.display_name for p in self.session.config.participants],
         })
 
+        config = self.session.config
         previous_round_responses: list[str] | None = None
-        stagnation_count = 0
+        simultaneous = config.round_strategy == RoundStrategy.SIMULTANEOUS
+        # This round's turns, started early while the last consensus check ran
+        ahead: list[_Turn] = []
 
-        for round_num in range(1, self.session.config.max_rounds + 1):
+        for round_num in range(1, config.max_rounds + 1):
             if self._stopped:
                 break
 
-            self.session.current_round = round_num
-            yield DebateEvent("debate:round_start", {"round": round_num})
+            if not ahead:
+                self.session.current_round = round_num
+                self._round_started = self._clock()
+                yield DebateEvent("debate:round_start", {"round": round_num})
+            turns = ahead or [_Turn(participant) for participant in config.participants]
+            ahead = []
+            # Scope of a round or debate deadline that ended this round early
+            expired: str | None = None
+
+            if simultaneous:
+                # Everyone answers the transcript as of the end of the last
+                # round; messages are recorded in participant order afterwards
+                if not turns[0].started:
+                    expired = self._expired()
+                    if expired:
+                        yield self._deadline_event(expired, round_num)
+                    else:
+                        async for _, event in self._merge(
+                            [self._take_turn(turn, round_num) for turn in turns]
+                        ):
+                            if event is not None:
+                                yield event
+                for turn in turns:
+                    if turn.message is not None:
+                        self._record(turn.message)
+            else:
+                # Each participant takes a turn (round-robin)
+                for turn in turns:
+                    if self._stopped:
+                        break
+                    if not turn.started:
+                        expired = self._expired()
+                        if expired:
+                            yield self._deadline_event(expired, round_num)
+                            break
+                        async for event in self._take_turn(turn, round_num):
+                            yield event
+                    if turn.message is not None:
+                        self._record(turn.message)
+                    if turn.expired:
+                        break
+
+            scopes = {turn.expired for turn in turns}
+            if "debate" in scopes:
+                expired = "debate"
+            finished = [turn.message for turn in turns if turn.message is not None]
+            round_responses = [message.content for message in finished]
+            round_transcript = [
+                {"speaker": message.speaker, "content": message.content, "round": round_num}
+                for message in finished
+            ]
+
+            if self._stopped or expired == "debate":
+                break
 
-            round_responses: list[str] = []
-            round_transcript: list[dict] = []
+            # Consensus check after each round, overlapping the next round's
+            # opening turns when the debate speculates past it
+            verdict = _Verdict()
+            judge = self._judge_round(
+                round_num, round_transcript, previous_round_responses, verdict
+            )
+            if config.speculative_consensus and round_num < config.max_rounds:
+                ahead = [_Turn(participant) for participant in config.participants]
+                async for event in self._speculate(
+                    judge, ahead if simultaneous else ahead[:1], round_num + 1, verdict
+                ):
+                    yield event
+            else:
+                async for event in judge:
+                    yield event
+            if verdict.conclude:
+                break
 
-            # Each participant takes a turn (round-robin)
-            for participant in self.session.config.participants:
-                if self._stopped:
-                    break
+            previous_round_responses = round_responses
 
-                # Wait while paused
-                while self._paused and not self._stopped:
-                    import asyncio
-                    await asyncio.sleep(0.5)
+        # Debate concluded
+        self.session.status = DebateStatus.CONCLUDED
+        yield DebateEvent("debate:concluded", {
+            "session_id": self.session.session_id,
+            "total_rounds": self.session.current_round,
+            "final_consensus": (
+                self.session.consensus_history[-1].score
+                if self.session.consensus_history
+                else 0.0
+            ),
+            "token_usage": self.session.token_usage,
+            "input_token_usage": self.session.input_token_usage,
+            "hedged_turns": self.session.hedged_turns,
+            "hedge_cost_usd": round(self.session.hedge_cost_usd, 6),
+        })
 
-                if self._stopped:
-                    break
+    async def _judge_round(
+        self,
+        round_num: int,
+        round_transcript: list[dict],
+        previous_round_responses: list[str] | None,
+        verdict: _Verdict,
+    ) -> AsyncGenerator[DebateEvent, None]:
+        """Check a finished round for consensus, yielding the outcome events.
 
-                yield DebateEvent("debate:turn_start", {
-                    "speaker": participant.display_name,
-                    "provider": participant.provider.value,
+        ``verdict.conclude`` is set when the debate should end.
+        """
+        try:
+            consensus_result = await self._race(
+                self._check_consensus(round_num, round_transcript, previous_round_responses),
+                *self._deadline(round_limit=False),
+            )
+        except _TurnInterrupted:
+            verdict.conclude = True
+            return
+        except _DeadlineExceeded as exceeded:
+            verdict.conclude = True
+            yield self._deadline_event(exceeded.scope, round_num)
+            return
+
+        self.session.consensus_history.append(ConsensusResult(
+            score=consensus_result["consensus_score"],
+            stagnation_detected=consensus_result["stagnation_detected"],
+            summary=consensus_result.get("summary", ""),
+        ))
+
+        yield DebateEvent("debate:consensus_check", {
+            "round": round_num,
+            "consensus_score": consensus_result["consensus_score"],
+            "stagnation_detected": consensus_result["stagnation_detected"],
+            "agreed_points": consensus_result.get("agreed_points", []),
+            "contested_points": consensus_result.get("contested_points", []),
+            "summary": consensus_result.get("summary", ""),
+        })
+
+        # Check termination conditions
+        if consensus_result["consensus_score"] >= self.session.config.consensus_threshold:
+            verdict.conclude = True
+            yield DebateEvent("debate:consensus_reached", {
+                "round": round_num,
+                "score": consensus_result["consensus_score"],
+            })
+            return
+
+        if consensus_result["stagnation_detected"]:
+            self._stagnation_count += 1
+            if self._stagnation_count >= 3:
+                verdict.conclude = True
+                yield DebateEvent("debate:stagnation", {
                     "round": round_num,
+                    "consecutive_stagnation_rounds": self._stagnation_count,
                 })
+        else:
+            self._stagnation_count = 0
+
+    async def _speculate(
+        self,
+        judge: AsyncGenerator[DebateEvent, None],
+        turns: list[_Turn],
+        round_num: int,
+        verdict: _Verdict,
+    ) -> AsyncGenerator[DebateEvent, None]:
+        """Run the last round's ``judge`` while round ``round_num``'s ``turns`` start.
+
+        If the verdict ends the debate, turns still streaming are cancelled
+        and dropped. What they already streamed is billed, not recorded.
+        """
+        last_round = self.session.current_round
+        self.session.current_round = round_num
+        self._round_started = self._clock()
+        yield DebateEvent("debate:round_start", {"round": round_num, "speculative": True})
+
+        merged = self._merge([judge, *(self._take_turn(turn, round_num) for turn in turns)])
+        try:
+            async for source, event in merged:
+                if event is not None:
+                    yield event
+                elif source == 0 and verdict.conclude and not self._stopped:
+                    break  # Judged; a stop lets the turns report their own cancellation
+        finally:
+            await merged.aclose()
+        if not verdict.conclude:
+            return
+
+        self.session.current_round = last_round
+        for turn in turns:
+            message, turn.message = turn.message, None
+            if not turn.started or (message is None and self._stopped):
+                continue  # Never started, or already reported as stopped
+            name = turn.participant.display_name
+            if message is not None:
+                self._bill(name, message.token_count, message.input_tokens)
+            else:
+                self._bill_discarded(turn)
+            yield DebateEvent("debate:turn_cancelled", {
+                "speaker": name,
+                "round": round_num,
+                "reason": "concluded",
+                "discarded_chunks": turn.chunks,
+            })
+
+    async def _take_turn(self, turn: _Turn, round_num: int) -> AsyncGenerator[DebateEvent, None]:
+        """Run one participant's turn, yielding its events.
+
+        The finished message is left on ``turn`` for the caller to record.
+        """
+        participant = turn.participant
+        await self._resumed.wait()
+        if self._stopped:
+            return
+        turn.started = True
+
+        provider, model = self._route(participant)
+        routing_event = self._routing_event(participant, provider, model)
+        if routing_event:
+            yield routing_event
+
+        yield DebateEvent("debate:turn_start", {
+            "speaker": participant.display_name,
+            "provider": provider,
+            "model": model,
+            "round": round_num,
+        })
 
+        try:
+            completed = truncated = False
+            while not completed:
+                full_response = ""
+                turn.chunks = turn.chars = 0
+                usage: StreamUsage | None = None
+                hedge = HedgeOutcome()
+                turn_started = self._clock()
                 try:
-                    full_response = ""
-                    async for token in self._generate_turn(participant, round_num):
-                        full_response += token
+                    async for chunk in self._interruptible(self._generate_turn(
+                        turn, round_num, provider, model, hedge
+                    ), turn_started):
+                        if isinstance(chunk, StreamUsage):
+                            usage = chunk
+                            continue
+                        full_response += chunk
+                        turn.chunks += 1
+                        turn.chars += len(chunk)
                         yield DebateEvent("debate:token_stream", {
                             "speaker": participant.display_name,
-                            "token": token,
+                            "token": chunk,
                         })
-
-                    # Record the message
-                    message = DebateMessage(
-                        speaker=participant.display_name,
-                        provider=participant.provider,
-                        model=participant.model,
-                        content=full_response,
-                        round_number=round_num,
-                        token_count=len(full_response.split()),  # Rough estimate
+                    completed = True
+                except _DeadlineExceeded as exceeded:
+                    # Keep what was said so far and move on
+                    completed = truncated = True
+                    if exceeded.scope in ("round", "debate"):
+                        turn.expired = exceeded.scope
+                    yield self._deadline_event(
+                        exceeded.scope, round_num, participant.display_name
                     )
-                    self.session.transcript.append(message)
-                    round_responses.append(full_response)
-                    round_transcript.append({
+                except _TurnInterrupted as interrupted:
+                    # The prompt and streamed text are paid for even though
+                    # the output is dropped
+                    self._bill_discarded(turn)
+                    yield DebateEvent("debate:turn_cancelled", {
                         "speaker": participant.display_name,
-                        "content": full_response,
                         "round": round_num,
+                        "reason": interrupted.reason,
+                        "discarded_chunks": turn.chunks,
                     })
-
-                    # Track token usage
-                    key = participant.display_name
-                    self.session.token_usage[key] = (
-                        self.session.token_usage.get(key, 0) + message.token_count
-                    )
-
-                    yield DebateEvent("debate:turn_end", {
+                    if self._stopped:
+                        return
+                    # Restarting pause: start the turn over once resumed
+                    await self._resumed.wait()
+                    if self._stopped:
+                        return
+                    yield DebateEvent("debate:turn_start", {
                         "speaker": participant.display_name,
+                        "provider": provider,
+                        "model": model,
                         "round": round_num,
-                        "token_count": message.token_count,
                     })
-
-                except Exception as e:
-                    logger.error(
-                        f"Error during {participant.display_name}'s turn: {e}"
-                    )
-                    yield DebateEvent("debate:error", {
-                        "speaker": participant.display_name,
-                        "error": str(e),
-                        "round": round_num,
-                    })
-                    # Skip this speaker and continue with next
-                    continue
-
-            if self._stopped:
-                break
-
-            # Consensus check after each round
-            consensus_result = await self._check_consensus(
-                round_transcript, previous_round_responses
+            if truncated and not full_response:
+                # Cut off before the first token: nothing to keep, but the
+                # turn that was started still needs its end
+                self._bill_discarded(turn)
+                yield DebateEvent("debate:turn_cancelled", {
+                    "speaker": participant.display_name,
+                    "round": round_num,
+                    "reason": "timeout",
+                    "discarded_chunks": 0,
+                })
+                return
+            if hedge.winner == "backup":
+                provider, model = hedge.provider, hedge.model
+
+            turn.message = message = DebateMessage(
+                speaker=participant.display_name,
+                provider=Provider(provider),
+                model=model,
+                content=full_response,
+                round_number=round_num,
+                token_count=(
+                    usage.output_tokens if usage
+                    else len(full_response.split())  # Rough estimate
+                ),
+                input_tokens=usage.input_tokens if usage else 0,
+                cache_read_tokens=usage.cache_read_tokens if usage else 0,
+                cache_write_tokens=usage.cache_write_tokens if usage else 0,
+                truncated=truncated,
             )
 
-            self.session.consensus_history.append(ConsensusResult(
-                score=consensus_result["consensus_score"],
-                stagnation_detected=consensus_result["stagnation_detected"],
-                summary=consensus_result.get("summary", ""),
-            ))
+            yield DebateEvent("debate:turn_end", {
+                "speaker": participant.display_name,
+                "round": round_num,
+                "token_count": message.token_count,
+                "input_tokens": message.input_tokens,
+                "cache_read_tokens": message.cache_read_tokens,
+                "cache_write_tokens": message.cache_write_tokens,
+                "finish_reason": (
+                    "timeout" if truncated else usage.finish_reason if usage else ""
+                ),
+                "truncated": truncated,
+                # TTFT, tokens/s and gaps for this turn's stream
+                "timing": usage.timing.to_dict() if usage and usage.timing else None,
+                "hedge": hedge.to_dict() if hedge.issued else None,
+            })
 
-            yield DebateEvent("debate:consensus_check", {
+        except Exception as e:
+            # Skip this speaker and continue with the next
+            logger.error(
+                f"Error during {participant.display_name}'s turn: {e}"
+            )
+            yield DebateEvent("debate:error", {
+                "speaker": participant.display_name,
+                "error": str(e),
                 "round": round_num,
-                "consensus_score": consensus_result["consensus_score"],
-                "stagnation_detected": consensus_result["stagnation_detected"],
-                "agreed_points": consensus_result.get("agreed_points", []),
-                "contested_points": consensus_result.get("contested_points", []),
-                "summary": consensus_result.get("summary", ""),
             })
 
-            # Check termination conditions
-            if consensus_result["consensus_score"] >= self.session.config.consensus_threshold:
-                yield DebateEvent("debate:consensus_reached", {
-                    "round": round_num,
-                    "score": consensus_result["consensus_score"],
-                })
-                break
+    def _record(self, message: DebateMessage) -> None:
+        """Add a finished turn to the transcript and token totals."""
+        self.session.transcript.append(message)
+        self.transcript.append(message.speaker, message.content, message.round_number)
+        self._bill(message.speaker, message.token_count, message.input_tokens)
 
-            if consensus_result["stagnation_detected"]:
-                stagnation_count += 1
-                if stagnation_count >= 3:
-                    yield DebateEvent("debate:stagnation", {
-                        "round": round_num,
-                        "consecutive_stagnation_rounds": stagnation_count,
-                    })
-                    break
+    def _bill(self, speaker: str, output_tokens: int, input_tokens: int = 0) -> None:
+        usage = self.session.token_usage
+        usage[speaker] = usage.get(speaker, 0) + output_tokens
+        usage = self.session.input_token_usage
+        usage[speaker] = usage.get(speaker, 0) + input_tokens
+
+    def _bill_discarded(self, turn: _Turn) -> None:
+        """Bill a cancelled attempt, which gets no usage report.
+
+        Both sides are estimated at ~4 chars per token: the prompt that
+        was sent and the text streamed before the cancellation.
+        """
+        self._bill(turn.participant.display_name, (turn.chars + 3) // 4, turn.prompt_tokens)
+
+    async def _merge(
+        self, sources: list[AsyncGenerator[DebateEvent, None]]
+    ) -> AsyncGenerator[tuple[int, DebateEvent | None], None]:
+        """Run ``sources`` concurrently, yielding ``(index, event)`` as events arrive.
+
+        ``(index, None)`` follows the last event of source ``index``.
+        """
+        queue: asyncio.Queue[tuple[int, DebateEvent | None]] = asyncio.Queue()
+
+        async def pump(index: int, source: AsyncGenerator[DebateEvent, None]) -> None:
+            try:
+                async for event in source:
+                    queue.put_nowait((index, event))
+            finally:
+                await source.aclose()
+                queue.put_nowait((index, None))
+
+        tasks = [asyncio.create_task(pump(i, source)) for i, source in enumerate(sources)]
+        try:
+            running = len(tasks)
+            while running:
+                item = await queue.get()
+                if item[1] is None:
+                    running -= 1
+                yield item
+            for task in tasks:
+                task.result()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _interruptible(
+        self, stream: AsyncGenerator[StreamChunk, None], turn_started: float
+    ) -> AsyncGenerator[StreamChunk, None]:
+        """Yield a turn's ``stream``, pulling no chunks while paused.
+
+        The stream is read by a single consumer task. stop() and
+        pause(restart_turn=True) cancel it, which closes the provider's
+        HTTP stream, and raise _TurnInterrupted. So does a passing
+        deadline, raising _DeadlineExceeded. Nothing is awaited per chunk
+        beyond the hand-off queue.
+        """
+        loop = asyncio.get_running_loop()
+        restart = loop.create_future()
+        self._restarts.add(restart)
+        chunks: asyncio.Queue[StreamChunk | None] = asyncio.Queue()
+        first_token = True
+        expired = ""
+
+        async def consume() -> None:
+            while True:
+                await self._resumed.wait()
+                try:
+                    chunk = await anext(stream)
+                except StopAsyncIteration:
+                    return
+                chunks.put_nowait(chunk)
+
+        consumer = asyncio.create_task(consume())
+        consumer.add_done_callback(lambda _: chunks.put_nowait(None))
+
+        def interrupt(_: asyncio.Future) -> None:
+            consumer.cancel()
+
+        def check_deadline() -> None:
+            # Rescheduled rather than fired while paused or once the first
+            # token lifts the first-token deadline
+            nonlocal timer, expired
+            deadline, scope = self._deadline(turn_started, first_token)
+            if deadline is None:
+                timer = None
+            elif deadline <= self._clock():
+                expired = scope
+                consumer.cancel()
             else:
-                stagnation_count = 0
+                timer = loop.call_later(deadline - self._clock(), check_deadline)
+
+        timer: asyncio.TimerHandle | None = None
+        check_deadline()
+        self._stopping.add_done_callback(interrupt)
+        restart.add_done_callback(interrupt)
+        try:
+            while True:
+                chunk = await chunks.get()
+                if self._stopping.done() or restart.done():
+                    raise _TurnInterrupted("stopped" if self._stopped else "paused")
+                if chunk is None:
+                    if consumer.cancelled():
+                        raise _DeadlineExceeded(expired)
+                    consumer.result()  # Re-raises the stream's error
+                    return
+                if not isinstance(chunk, StreamUsage):
+                    first_token = False
+                yield chunk
+        finally:
+            self._stopping.remove_done_callback(interrupt)
+            self._restarts.discard(restart)
+            if timer is not None:
+                timer.cancel()
+            if not consumer.done():
+                consumer.cancel()
+                await asyncio.gather(consumer, return_exceptions=True)
+            await stream.aclose()
+
+    async def _race(
+        self,
+        awaitable,
+        deadline: float | None = None,
+        scope: str = "",
+        restart: asyncio.Future | None = None,
+    ):
+        """Await ``awaitable``, cancelling it if interrupted first.
+
+        Interruptions are stop(), a restarting pause() resolving ``restart``,
+        and ``deadline`` (on ``_clock()``) passing.
+
+        Raises:
+            _TurnInterrupted: If stopped or restarted first.
+            _DeadlineExceeded: If ``deadline`` passed first.
+        """
+        step = asyncio.ensure_future(awaitable)
+        interrupts = [f for f in (self._stopping, restart) if f is not None]
+        timeout = None if deadline is None else max(0.0, deadline - self._clock())
+        try:
+            await asyncio.wait(
+                [step, *interrupts], timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+        finally:
+            if not step.done():
+                step.cancel()
+                await asyncio.gather(step, return_exceptions=True)
+        if step.cancelled():
+            if any(f.done() for f in interrupts):
+                raise _TurnInterrupted("stopped" if self._stopped else "paused")
+            raise _DeadlineExceeded(scope)
+        return step.result()
+
+    def _clock(self) -> float:
+        """Monotonic seconds, excluding time spent paused."""
+        now = time.monotonic()
+        paused = self._paused_total
+        if self._paused_at is not None:
+            paused += now - self._paused_at
+        return now - paused
+
+    def _deadline(
+        self,
+        turn_started: float | None = None,
+        first_token: bool = False,
+        round_limit: bool = True,
+    ) -> tuple[float | None, str]:
+        """Return the earliest deadline that applies now, and its scope."""
+        config = self.session.config
+        deadlines: list[tuple[float, str]] = []
+        if config.debate_timeout_seconds is not None:
+            deadlines.append((self._debate_started + config.debate_timeout_seconds, "debate"))
+        if round_limit and config.round_timeout_seconds is not None:
+            deadlines.append((self._round_started + config.round_timeout_seconds, "round"))
+        if turn_started is not None:
+            deadlines.append((turn_started + config.turn_timeout_seconds, "turn"))
+            if first_token:
+                deadlines.append((turn_started + config.first_token_timeout_seconds, "first_token"))
+        if not deadlines:
+            return None, ""
+        return min(deadlines)
+
+    def _expired(self) -> str | None:
+        """Return the scope of a round or debate deadline that has passed."""
+        deadline, scope = self._deadline()
+        return scope if deadline is not None and deadline <= self._clock() else None
+
+    def _deadline_event(self, scope: str, round_num: int, speaker: str | None = None) -> DebateEvent:
+        logger.info(f"Debate {self.session.session_id} hit its {scope} deadline in round {round_num}")
+        return DebateEvent("debate:deadline", {
+            "scope": scope,
+            "round": round_num,
+            "speaker": speaker,
+        })
 
-            previous_round_responses = round_responses
+    def _route(self, participant: Participant) -> tuple[str, str]:
+        """Pick the (provider, model) for a participant's next turn.
 
-        # Debate concluded
-        self.session.status = DebateStatus.CONCLUDED
-        yield DebateEvent("debate:concluded", {
-            "session_id": self.session.session_id,
-            "total_rounds": self.session.current_round,
-            "final_consensus": (
-                self.session.consensus_history[-1].score
-                if self.session.consensus_history
-                else 0.0
-            ),
-            "token_usage": self.session.token_usage,
+        The participant's own model is used unless its circuit breaker is
+        open; then the configured fallback is tried, followed by the other
+        models of the same provider in PROVIDER_MODELS order.
+        """
+        primary = (participant.provider.value, participant.model)
+        candidates = [primary]
+        if participant.fallback_provider or participant.fallback_model:
+            fallback_provider = (
+                participant.fallback_provider or participant.provider
+            ).value
+            fallback_models = PROVIDER_MODELS.get(fallback_provider, [])
+            fallback_model = participant.fallback_model or (
+                fallback_models[0] if fallback_models else ""
+            )
+            if fallback_model:
+                candidates.append((fallback_provider, fallback_model))
+        same_provider = PROVIDER_MODELS.get(primary[0], [])
+        if participant.model in same_provider:
+            start = same_provider.index(participant.model) + 1
+            candidates.extend((primary[0], m) for m in same_provider[start:])
+
+        for provider, model in candidates:
+            if provider in self.session.api_keys and breakers.is_available(provider, model):
+                return provider, model
+        return primary
+
+    def _routing_event(
+        self, participant: Participant, provider: str, model: str
+    ) -> DebateEvent | None:
+        """Report transitions into and out of fallback routing."""
+        name = participant.display_name
+        primary = (participant.provider.value, participant.model)
+        if breakers.is_available(*primary):
+            if name in self._degraded:
+                self._degraded.discard(name)
+                return DebateEvent("debate:participant_recovered", {
+                    "speaker": name,
+                    "provider": primary[0],
+                    "model": primary[1],
+                })
+            return None
+
+        self._ensure_probe(*primary)
+        if name in self._degraded:
+            return None
+        self._degraded.add(name)
+        rerouted = (provider, model) != primary
+        return DebateEvent("debate:participant_degraded", {
+            "speaker": name,
+            "provider": primary[0],
+            "model": primary[1],
+            "reason": breakers.get(*primary).last_error,
+            "fallback_provider": provider if rerouted else None,
+            "fallback_model": model if rerouted else None,
         })
 
+    def _ensure_probe(self, provider: str, model: str) -> None:
+        """Start a background half-open probe for a tripped model."""
+        task = self._probes.get((provider, model))
+        if task is None or task.done():
+            self._probes[(provider, model)] = asyncio.create_task(
+                self._probe(provider, model)
+            )
+
+    async def _probe(self, provider: str, model: str) -> None:
+        """Send minimal trial calls until the breaker closes again.
+
+        A failed trial reopens the breaker, so attempts are spaced by its
+        cooldown, and at most ``MAX_PROBES`` are sent.
+        """
+        api_key = self.session.api_keys.get(provider, "")
+        if not api_key:
+            return
+        adapter = get_adapter(provider)
+        breaker = breakers.get(provider, model)
+        messages = [Message(role=MessageRole.USER, content="ping")]
+        config = GenerationConfig(model=model, max_tokens=1, temperature=0.0)
+        probes = 0
+        while not self._stopped and breaker.state != BreakerState.CLOSED:
+            if probes >= MAX_PROBES:
+                logger.info(f"Giving up probing {provider}/{model} after {probes} trials")
+                return
+            await asyncio.sleep(max(breaker.reopens_in, PROBE_INTERVAL))
+            if breaker.state != BreakerState.HALF_OPEN:
+                continue
+            probes += 1
+            try:
+                await adapter.generate(messages, config, api_key)
+            except Exception as e:
+                logger.info(f"Probe for {provider}/{model} failed: {e}")
+
     async def _generate_turn(
-        self, participant: Participant, round_num: int
-    ) -> AsyncGenerator[str, None]:
-        """Generate a single speaker's response for the current turn."""
-        adapter = get_adapter(participant.provider.value)
-        api_key = self.session.api_keys.get(participant.provider.value, "")
+        self,
+        turn: _Turn,
+        round_num: int,
+        provider: str,
+        model: str,
+        hedge: HedgeOutcome | None = None,
+    ) -> AsyncGenerator[StreamChunk, None]:
+        """Generate a single speaker's response for the current turn.
+
+        With hedging on and a ``hedge`` to report into, a slow-starting
+        request is raced against a second one (see ``hedged_stream``).
+        """
+        participant = turn.participant
+        adapter = get_adapter(provider)
+        api_key = self.session.api_keys.get(provider, "")
 
         if not api_key:
             raise ValueError(
-                f"No API key provided for {participant.provider.value}"
+                f"No API key provided for {provider}"
             )
 
-        # Build the conversation messages
-        system_prompt = build_system_prompt(
-            participant.display_name, participant.persona
+        # Build the conversation messages from the incrementally rendered transcript
+        messages = self.transcript.turn_messages(
+            participant.display_name,
+            participant.persona,
+            self.session.config.prompt_layout,
         )
-
-        # Build transcript for context
-        transcript_entries = [
-            {"speaker": msg.speaker, "content": msg.content}
-            for msg in self.session.transcript
-        ]
-        turn_prompt = build_turn_prompt(
-            self.session.config.topic, transcript_entries
-        )
-
-        messages = [
-            Message(role=MessageRole.SYSTEM, content=system_prompt),
-            Message(role=MessageRole.USER, content=turn_prompt),
-        ]
+        turn.prompt_tokens = sum(len(m.content) for m in messages) // 4
 
         config = GenerationConfig(
-            model=participant.model,
+            model=model,
             max_tokens=self.session.config.max_tokens_per_turn,
             temperature=participant.temperature,
+            cache_key=build_cache_key(self.session.config.topic, participant.display_name),
+            # A stall longer than this fails at the HTTP layer as well; the
+            # turn and round deadlines are enforced by _interruptible
+            timeout=self.session.config.first_token_timeout_seconds,
         )
 
-        async for token in adapter.generate_stream(messages, config, api_key):
-            yield token
+        stream = adapter.generate_stream(messages, config, api_key)
+        target = self._hedge_target(participant, provider, model) if hedge is not None else None
+        if target is None:
+            async for chunk in stream:
+                yield chunk
+            return
+
+        hedge_provider, hedge_model = target
+
+        def start_backup() -> AsyncGenerator[StreamChunk, None] | None:
+            # Either request may turn out to be the wasted one
+            cost = max(
+                _prompt_cost(model, messages),
+                _prompt_cost(hedge_model, messages),
+            )
+            if self.session.hedge_cost_usd + cost > self.session.config.hedge_budget_usd:
+                logger.info(f"Hedge budget spent; not hedging {participant.display_name}'s turn")
+                return None
+            self.session.hedged_turns += 1
+            self.session.hedge_cost_usd += cost
+            hedge.provider, hedge.model, hedge.cost_usd = hedge_provider, hedge_model, cost
+            return get_adapter(hedge_provider).generate_stream(
+                messages,
+                replace(config, model=hedge_model),
+                self.session.api_keys[hedge_provider],
+            )
+
+        delay = hedge_delay(provider, model, self.session.config.hedge_percentile)
+        async for chunk in hedged_stream(stream, start_backup, delay, hedge):
+            yield chunk
+
+    def _hedge_target(
+        self, participant: Participant, provider: str, model: str
+    ) -> tuple[str, str] | None:
+        """Return the (provider, model) for a hedged request, if hedging applies.
+
+        Without a configured hedge target the request is repeated against
+        the same routed model, which still helps with a slow replica.
+        """
+        if not self.session.config.hedge_requests:
+            return None
+        if participant.hedge_provider is not None:
+            provider = participant.hedge_provider.value
+        model = participant.hedge_model or model
+        if provider not in self.session.api_keys or not breakers.is_available(provider, model):
+            return None
+        return provider, model
 
     async def _check_consensus(
         self,
+        round_num: int,
         round_transcript: list[dict],
         previous_round_responses: list[str] | None,
     ) -> dict:
@@ -273,4 +927,5 @@ class DebateOrchestrator:
             adapter=adapter,
             api_key=api_key,
             model=model,
+            prompt=self.transcript.consensus_prompt(round_num),
         )
@@ -0,0 +1,131 @@
+"""Hedged requests for turns that are slow to start.
+
+Time to first token has a long tail, and one turn that sits for twenty
+seconds before its first token stalls the whole round. With hedging on,
+a turn whose first chunk hasn't arrived within the model's usual TTFT
+(a high percentile of recent streams) gets a second request, for the
+same model or a configured alternate. Whichever stream produces a chunk
+first is used; the other is cancelled.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import AsyncGenerator, Callable
+
+from ..adapters.base import StreamChunk
+from ..adapters.timing import stream_timings
+
+logger = logging.getLogger(__name__)
+
+# Hedge delay when a model has too few recent streams to judge (seconds)
+DEFAULT_HEDGE_DELAY = 10.0
+
+# Bounds on the percentile-based delay (seconds)
+MIN_HEDGE_DELAY = 1.0
+MAX_HEDGE_DELAY = 30.0
+
+
+@dataclass
+class HedgeOutcome:
+    """What happened to one turn's hedge; filled in by ``hedged_stream``."""
+
+    issued: bool = False
+    winner: str = "primary"  # "primary" or "backup"
+    provider: str = ""  # Target of the backup request
+    model: str = ""
+    delay: float = 0.0  # Seconds waited before the backup was sent
+    cost_usd: float = 0.0  # Extra spend charged for the backup
+
+    def to_dict(self) -> dict:
+        return {
+            "issued": self.issued,
+            "winner": self.winner,
+            "provider": self.provider,
+            "model": self.model,
+            "delay_seconds": round(self.delay, 3),
+            "cost_usd": round(self.cost_usd, 6),
+        }
+
+
+def hedge_delay(provider: str, model: str, percentile: float) -> float:
+    """How long to wait for a first chunk before hedging a request."""
+    ttft = stream_timings.ttft_quantile(provider, model, percentile)
+    if ttft is None:
+        return DEFAULT_HEDGE_DELAY
+    return min(MAX_HEDGE_DELAY, max(MIN_HEDGE_DELAY, ttft))
+
+
+async def hedged_stream(
+    primary: AsyncGenerator[StreamChunk, None],
+    start_backup: Callable[[], AsyncGenerator[StreamChunk, None] | None],
+    delay: float,
+    outcome: HedgeOutcome,
+) -> AsyncGenerator[StreamChunk, None]:
+    """Yield ``primary``, racing a backup stream if it is slow to start.
+
+    ``start_backup`` is called once ``delay`` passes without a first chunk.
+    It returns the backup stream, or None when a hedge isn't allowed (for
+    example when the budget is spent). The first stream to produce a chunk
+    wins and the other one is cancelled and closed. If one stream fails
+    before producing anything, the other is awaited instead.
+    """
+    streams = {"primary": primary}
+    firsts = {"primary": asyncio.ensure_future(anext(primary))}
+    try:
+        done, _ = await asyncio.wait([firsts["primary"]], timeout=delay)
+        if not done:
+            backup = start_backup()
+            if backup is not None:
+                outcome.issued = True
+                outcome.delay = delay
+                streams["backup"] = backup
+                firsts["backup"] = asyncio.ensure_future(anext(backup))
+
+        winner = await _first_to_start(firsts)
+        outcome.winner = winner
+        if outcome.issued:
+            logger.info(f"Hedged turn won by the {winner} request after {delay:.1f}s")
+            # Stop paying for the loser right away, not when the turn ends
+            await _close({n: s for n, s in streams.items() if n != winner}, firsts)
+        try:
+            first = firsts[winner].result()
+        except StopAsyncIteration:
+            return
+        yield first
+        async for chunk in streams[winner]:
+            yield chunk
+    finally:
+        await _close(streams, firsts)
+
+
+async def _close(
+    streams: dict[str, AsyncGenerator[StreamChunk, None]],
+    firsts: dict[str, asyncio.Future],
+) -> None:
+    """Cancel the pending first-chunk reads of ``streams``, then close them."""
+    pending = [firsts[name] for name in streams if not firsts[name].done()]
+    for task in pending:
+        task.cancel()
+    await asyncio.gather(*pending, return_exceptions=True)
+    for stream in streams.values():
+        await stream.aclose()
+
+
+async def _first_to_start(firsts: dict[str, asyncio.Future]) -> str:
+    """Return the name of the first stream whose first chunk succeeded."""
+    pending = set(firsts.values())
+    errors: dict[str, BaseException] = {}
+    while pending:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        # Prefer the primary when both finish in the same iteration
+        for name, task in firsts.items():
+            if task not in done:
+                continue
+            error = task.exception()
+            if error is None or isinstance(error, StopAsyncIteration):
+                return name
+            errors[name] = error
+    raise errors.get("primary") or next(iter(errors.values()))
@@ -1,5 +1,7 @@
 """Prompt templates for the debate orchestrator."""
 
+import hashlib
+
 SPEAKER_SYSTEM_PROMPT = """\
 You are {display_name}, participating in a philosophical debate at the Agora — \
 a forum where great minds deliberate on important questions.
@@ -76,6 +78,11 @@ What wisdom did the assembly produce together?\
 """
 
 
+TRANSCRIPT_HEADER = "Debate so far:\n\n"
+ENTRY_SEPARATOR = "\n\n"
+OPENING_TURN_SECTION = "You are the first to speak. Open the debate with your position."
+
+
 def build_system_prompt(display_name: str, persona: str = "") -> str:
     """Build the system prompt for a debate participant."""
     persona_section = ""
@@ -95,28 +102,66 @@ def build_turn_prompt(topic: str, transcript: list[dict]) -> str:
         topic: The debate topic.
         transcript: List of dicts with 'speaker' and 'content' keys.
     """
-    if transcript:
-        lines = []
-        for entry in transcript:
-            lines.append(f"**{entry['speaker']}**: {entry['content']}")
-        transcript_section = "Debate so far:\n\n" + "\n\n".join(lines)
-    else:
-        transcript_section = (
-            "You are the first to speak. Open the debate with your position."
-        )
-
-    return SPEAKER_TURN_PROMPT.format(
-        topic=topic,
-        transcript_section=transcript_section,
-    )
+    return build_turn_prompt_parts(topic, transcript)[0]
+
+
+def build_turn_prompt_parts(
+    topic: str, transcript: list[dict]
+) -> tuple[str, tuple[int, ...]]:
+    """Build the turn prompt along with its prompt-cache boundaries.
+
+    The topic and transcript come first and each new turn only appends to
+    the transcript, so the text up to the end of every entry is repeated
+    verbatim by all later turn prompts. The returned offsets mark those
+    entry ends; the closing instruction after them is the only part that
+    never repeats.
+    """
+    head, tail = split_turn_prompt(topic)
+    if not transcript:
+        return head + OPENING_TURN_SECTION + tail, ()
+
+    parts = [head, TRANSCRIPT_HEADER]
+    offset = len(head) + len(TRANSCRIPT_HEADER)
+    boundaries: list[int] = []
+    for i, entry in enumerate(transcript):
+        line = format_entry(entry["speaker"], entry["content"])
+        if i:
+            parts.append(ENTRY_SEPARATOR)
+            offset += len(ENTRY_SEPARATOR)
+        parts.append(line)
+        offset += len(line)
+        boundaries.append(offset)
+    parts.append(tail)
+    return "".join(parts), tuple(boundaries)
+
+
+def split_turn_prompt(topic: str) -> tuple[str, str]:
+    """Return the turn prompt text before and after the transcript section."""
+    head, tail = SPEAKER_TURN_PROMPT.split("{transcript_section}")
+    return head.format(topic=topic), tail.format()
+
+
+def format_entry(speaker: str, content: str) -> str:
+    """Render one transcript entry as shown to speakers and the observer."""
+    return f"**{speaker}**: {content}"
+
+
+def format_conspectus_entry(speaker: str, round_number: object, content: str) -> str:
+    """Render one transcript entry, with its round, for the conspectus."""
+    return f"**{speaker}** (Round {round_number}): {content}"
+
+
+def build_cache_key(topic: str, display_name: str) -> str:
+    """Identify one speaker's turn prompts, which share a growing prefix."""
+    digest = hashlib.sha256(f"{topic}\0{display_name}".encode("utf-8"))
+    return digest.hexdigest()[:32]
 
 
 def build_consensus_prompt(topic: str, round_transcript: list[dict]) -> str:
     """Build the prompt for consensus evaluation."""
-    lines = []
-    for entry in round_transcript:
-        lines.append(f"**{entry['speaker']}**: {entry['content']}")
-    round_text = "\n\n".join(lines)
+    round_text = ENTRY_SEPARATOR.join(
+        format_entry(entry["speaker"], entry["content"]) for entry in round_transcript
+    )
 
     return CONSENSUS_EXTRACTION_PROMPT.format(
         topic=topic,
@@ -132,10 +177,10 @@ def build_conspectus_prompt(
     transcript: list[dict],
 ) -> str:
     """Build the prompt for generating the final conspectus."""
-    lines = []
-    for entry in transcript:
-        lines.append(f"**{entry['speaker']}** (Round {entry.get('round', '?')}): {entry['content']}")
-    transcript_text = "\n\n".join(lines)
+    transcript_text = ENTRY_SEPARATOR.join(
+        format_conspectus_entry(entry["speaker"], entry.get("round", "?"), entry["content"])
+        for entry in transcript
+    )
 
     return CONSPECTUS_PROMPT.format(
         topic=topic,
@@ -0,0 +1,191 @@
+"""Incremental prompt rendering for one debate session.
+
+Re-rendering the whole transcript for every turn makes each turn's prompt
+cost grow with the debate, so a debate costs O(n²) in formatting work.
+``TranscriptRenderer`` renders each finished message exactly once and
+keeps the pieces, so building a turn prompt is one join over pre-rendered
+strings. Consensus and conspectus prompts reuse the same pieces.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from ..adapters.base import Message, MessageRole
+from ..models.debate import DebateMessage, PromptLayout
+from .prompts import (
+    CONSENSUS_EXTRACTION_PROMPT,
+    CONSPECTUS_PROMPT,
+    ENTRY_SEPARATOR,
+    OPENING_TURN_SECTION,
+    TRANSCRIPT_HEADER,
+    build_system_prompt,
+    format_conspectus_entry,
+    format_entry,
+    split_turn_prompt,
+)
+
+
+@dataclass
+class _Conversation:
+    """One speaker's message history in the conversation layout."""
+
+    messages: list[Message] = field(default_factory=list)
+    # Others' rendered entries since the speaker last spoke
+    pending: list[str] = field(default_factory=list)
+    consumed: int = 0  # Transcript entries folded in so far
+
+
+class TranscriptRenderer:
+    """Renders a session's prompts from an append-only transcript.
+
+    Call ``append`` once per finished message. Prompts built from the same
+    transcript state are cached and returned by reference.
+    """
+
+    def __init__(self, topic: str, transcript: list[DebateMessage] | None = None):
+        self.topic = topic
+        self._head, self._tail = split_turn_prompt(topic)
+        # Pieces of the turn prompt: head, header, then entries and separators
+        self._parts: list[str] = [self._head, TRANSCRIPT_HEADER]
+        self._boundaries: list[int] = []
+        self._length = len(self._head) + len(TRANSCRIPT_HEADER)
+        self._lines: list[str] = []
+        self._speakers: list[str] = []
+        self._contents: list[str] = []
+        self._rounds: list[int] = []
+        self._round_starts: dict[int, int] = {}
+        self._conspectus_lines: list[str] = []
+        self._conversations: dict[str, _Conversation] = {}
+        self._system_prompts: dict[tuple[str, str], str] = {}
+        self._turn_prompt: tuple[str, tuple[int, ...]] | None = None
+        for message in transcript or []:
+            self.append(message.speaker, message.content, message.round_number)
+
+    def __len__(self) -> int:
+        return len(self._lines)
+
+    def append(self, speaker: str, content: str, round_number: int) -> None:
+        """Render a finished message once and add it to the transcript."""
+        line = format_entry(speaker, content)
+        if self._lines:
+            self._parts.append(ENTRY_SEPARATOR)
+            self._length += len(ENTRY_SEPARATOR)
+        self._parts.append(line)
+        self._length += len(line)
+        self._boundaries.append(self._length)
+        self._round_starts.setdefault(round_number, len(self._lines))
+        self._lines.append(line)
+        self._speakers.append(speaker)
+        self._contents.append(content)
+        self._rounds.append(round_number)
+        self._turn_prompt = None
+
+    def system_prompt(self, display_name: str, persona: str = "") -> str:
+        """Return a speaker's system prompt, rendered once per session."""
+        key = (display_name, persona)
+        prompt = self._system_prompts.get(key)
+        if prompt is None:
+            prompt = self._system_prompts[key] = build_system_prompt(*key)
+        return prompt
+
+    def turn_messages(
+        self,
+        display_name: str,
+        persona: str = "",
+        layout: PromptLayout = PromptLayout.TRANSCRIPT,
+    ) -> list[Message]:
+        """Return the full message list for a speaker's next turn."""
+        system = Message(role=MessageRole.SYSTEM, content=self.system_prompt(display_name, persona))
+        if layout == PromptLayout.CONVERSATION:
+            return [system, *self.conversation(display_name)]
+        prompt, boundaries = self.turn_prompt()
+        return [system, Message(role=MessageRole.USER, content=prompt, cache_boundaries=boundaries)]
+
+    def turn_prompt(self) -> tuple[str, tuple[int, ...]]:
+        """Return the next speaker's prompt and its cache boundaries.
+
+        Same output as ``build_turn_prompt_parts`` for this transcript.
+        """
+        if self._turn_prompt is None:
+            if not self._lines:
+                self._turn_prompt = (self._head + OPENING_TURN_SECTION + self._tail, ())
+            else:
+                self._parts.append(self._tail)
+                prompt = "".join(self._parts)
+                self._parts.pop()
+                self._turn_prompt = (prompt, tuple(self._boundaries))
+        return self._turn_prompt
+
+    def conversation(self, display_name: str) -> list[Message]:
+        """Return a speaker's turn as a multi-turn conversation.
+
+        The speaker's own past turns are assistant messages; the entries of
+        everyone else since its previous turn are grouped into one user
+        message, which ends with the same closing instruction every time.
+        Once the speaker has answered a group it never changes, so every
+        message before the last is byte-identical on the speaker's next turn.
+        """
+        conv = self._conversations.setdefault(display_name, _Conversation())
+        for i in range(conv.consumed, len(self._lines)):
+            if self._speakers[i] == display_name:
+                conv.messages.append(Message(
+                    role=MessageRole.USER,
+                    content=self._group(conv.pending, first=not conv.messages),
+                ))
+                conv.messages.append(Message(role=MessageRole.ASSISTANT, content=self._contents[i]))
+                conv.pending = []
+            else:
+                conv.pending.append(self._lines[i])
+        conv.consumed = len(self._lines)
+
+        prompt = self._group(conv.pending, first=not conv.messages)
+        # The whole history, this last group included, repeats on the next turn
+        return [
+            *conv.messages,
+            Message(role=MessageRole.USER, content=prompt, cache_boundaries=(len(prompt),)),
+        ]
+
+    def _group(self, entries: list[str], first: bool) -> str:
+        """Render one user message of the conversation layout."""
+        if first:
+            section = (
+                TRANSCRIPT_HEADER + ENTRY_SEPARATOR.join(entries)
+                if entries else OPENING_TURN_SECTION
+            )
+            return self._head + section + self._tail
+        if not entries:
+            return self._tail.lstrip()
+        return ENTRY_SEPARATOR.join(entries) + self._tail
+
+    def consensus_prompt(self, round_number: int) -> str:
+        """Return the consensus prompt for one round's entries."""
+        start = self._round_starts.get(round_number, len(self._lines))
+        end = len(self._lines)
+        for later, index in self._round_starts.items():
+            if later > round_number:
+                end = min(end, index)
+        return CONSENSUS_EXTRACTION_PROMPT.format(
+            topic=self.topic,
+            round_transcript=ENTRY_SEPARATOR.join(self._lines[start:end]),
+        )
+
+    def conspectus_prompt(
+        self,
+        participants: list[str],
+        rounds: int,
+        consensus_score: float,
+    ) -> str:
+        """Return the conspectus prompt over the whole transcript."""
+        # Entries are rendered with their round only once, on first use
+        for i in range(len(self._conspectus_lines), len(self._lines)):
+            self._conspectus_lines.append(
+                format_conspectus_entry(self._speakers[i], self._rounds[i], self._contents[i])
+            )
+        return CONSPECTUS_PROMPT.format(
+            topic=self.topic,
+            participants=", ".join(participants),
+            rounds=rounds,
+            consensus_score=consensus_score,
+            transcript=ENTRY_SEPARATOR.join(self._conspectus_lines),
+        )
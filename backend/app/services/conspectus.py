@@ -8,17 +8,23 @@ from ..adapters.base import GenerationConfig, Message, MessageRole
 from ..adapters.factory import get_adapter
 from ..models.debate import DebateSession
 from ..orchestrator.prompts import build_conspectus_prompt
+from ..orchestrator.transcript import TranscriptRenderer
 
 logger = logging.getLogger(__name__)
 
 
-async def generate_conspectus(session: DebateSession) -> str:
+async def generate_conspectus(
+    session: DebateSession,
+    transcript: TranscriptRenderer | None = None,
+) -> str:
     """Generate a conspectus (structured summary) of the completed debate.
 
     Uses the first available LLM adapter to produce the summary.
 
     Args:
         session: The completed debate session with full transcript.
+        transcript: The session's renderer, when the orchestrator kept one,
+            so already-rendered entries are reused.
 
     Returns:
         The conspectus as a markdown string.
@@ -38,16 +44,6 @@ async def generate_conspectus(session: DebateSession) -> str:
     if not adapter or not api_key:
         return "Unable to generate conspectus: no available LLM adapter."
 
-    # Build the transcript
-    transcript_entries = [
-        {
-            "speaker": msg.speaker,
-            "content": msg.content,
-            "round": msg.round_number,
-        }
-        for msg in session.transcript
-    ]
-
     participants = [p.display_name for p in session.config.participants]
     final_score = (
         session.consensus_history[-1].score
@@ -55,13 +51,27 @@ async def generate_conspectus(session: DebateSession) -> str:
         else 0.0
     )
 
-    prompt = build_conspectus_prompt(
-        topic=session.config.topic,
-        participants=participants,
-        rounds=session.current_round,
-        consensus_score=final_score,
-        transcript=transcript_entries,
-    )
+    if transcript is not None:
+        prompt = transcript.conspectus_prompt(
+            participants=participants,
+            rounds=session.current_round,
+            consensus_score=final_score,
+        )
+    else:
+        prompt = build_conspectus_prompt(
+            topic=session.config.topic,
+            participants=participants,
+            rounds=session.current_round,
+            consensus_score=final_score,
+            transcript=[
+                {
+                    "speaker": msg.speaker,
+                    "content": msg.content,
+                    "round": msg.round_number,
+                }
+                for msg in session.transcript
+            ],
+        )
 
     messages = [
         Message(role=MessageRole.USER, content=prompt),
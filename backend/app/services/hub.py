@@ -0,0 +1,236 @@
+"""Fan-out of a debate's events to spectators.
+
+Any number of clients can watch a running debate, over Socket.IO (the
+session room) or SSE. Socket.IO already encodes a room broadcast once
+for every member. SSE subscribers get the same treatment here: each
+event is encoded once into an SSE frame, and that frame is shared by
+every subscriber queue and by the replay buffer.
+
+Every published event gets the next sequence number (``seq``, from 1)
+in its payload, and the replay buffer doubles as the session's event
+log. A client that lost its connection asks to resume after the last
+``seq`` it saw and gets exactly the events it missed. If the log no
+longer reaches back that far, it gets a snapshot instead.
+
+A late joiner first receives a compact snapshot of the debate: finished
+turns, current round and consensus. Then it gets the buffered events of
+the turns still in progress, so the text streamed so far is not lost,
+and then live events. Snapshot and replay are taken from what the hub
+has already published, so they line up exactly with the live stream.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from collections import deque
+from dataclasses import dataclass
+from functools import cached_property
+from typing import AsyncIterator, Awaitable, Callable
+
+from ..models.debate import DebateSession
+
+logger = logging.getLogger(__name__)
+
+# Recent events kept per debate for late joiners and resyncs
+REPLAY_FRAMES = 1024
+
+# Frames an SSE subscriber may fall behind before it is dropped
+SUBSCRIBER_QUEUE = 256
+
+@dataclass
+class Frame:
+    """One published event, encoded for SSE at most once."""
+
+    event_type: str
+    data: dict  # Includes the event's seq
+
+    @property
+    def seq(self) -> int:
+        return self.data["seq"]
+
+    @property
+    def speaker(self) -> str | None:
+        return self.data.get("speaker")
+
+    @cached_property
+    def sse(self) -> str:
+        return sse_frame(self.event_type, self.data, self.seq)
+
+    def to_dict(self) -> dict:
+        return {"type": self.event_type, "data": self.data}
+
+
+def sse_frame(event_type: str, data: dict, seq: int | None = None) -> str:
+    """Encode an SSE frame; with ``seq`` as its id, so clients can resume."""
+    event_id = f"id: {seq}\n" if seq is not None else ""
+    return f"{event_id}data: {json.dumps({'type': event_type, 'data': data})}\n\n"
+
+
+class Subscription:
+    """An SSE subscriber's queue of live frames; ends when the hub closes.
+
+    ``snapshot`` is None when the subscriber resumed from the event log;
+    ``replay`` then holds every event it missed.
+    """
+
+    def __init__(self, snapshot: dict | None, replay: list[Frame]):
+        self.snapshot = snapshot
+        self.replay = replay
+        self.queue: asyncio.Queue[Frame | None] = asyncio.Queue(SUBSCRIBER_QUEUE)
+
+    async def __aiter__(self) -> AsyncIterator[Frame]:
+        while True:
+            frame = await self.queue.get()
+            if frame is None:
+                return
+            yield frame
+
+    def end(self) -> None:
+        """End the stream after the queued frames, or at once if the queue is full."""
+        try:
+            self.queue.put_nowait(None)
+        except asyncio.QueueFull:
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(None)
+
+
+class DebateHub:
+    """Publishes one debate's events to its room, SSE subscribers and replay buffer."""
+
+    def __init__(
+        self,
+        session: DebateSession,
+        broadcast: Callable[[str, dict], Awaitable[None]],
+        replay_frames: int | None = None,
+    ):
+        self.session = session
+        self._broadcast = broadcast
+        self._ring: deque[Frame] = deque(
+            maxlen=REPLAY_FRAMES if replay_frames is None else replay_frames
+        )
+        self._published = 0
+        # Speaker -> publish index of the turn_start of their turn in progress
+        self._open: dict[str, int] = {}
+        # Text published so far by each turn in progress
+        self._text: dict[str, list[str]] = {}
+        # Finished turns, for snapshots
+        self._turns: list[dict] = []
+        self._round = 0
+        self._consensus: float | None = None
+        self._subscribers: set[Subscription] = set()
+
+    @property
+    def subscribers(self) -> int:
+        return len(self._subscribers)
+
+    @property
+    def seq(self) -> int:
+        """Sequence number of the last published event."""
+        return self._published
+
+    async def publish(self, event_type: str, data: dict) -> None:
+        """Number an event, record it and send it to every spectator."""
+        self._published += 1
+        frame = Frame(event_type, {**data, "seq": self._published})
+        self._track(frame)
+        self._ring.append(frame)
+        for subscription in list(self._subscribers):
+            try:
+                subscription.queue.put_nowait(frame)
+            except asyncio.QueueFull:
+                logger.warning(
+                    f"Session {self.session.session_id}: dropping a lagging SSE spectator"
+                )
+                self.unsubscribe(subscription)
+                subscription.end()
+        await self._broadcast(event_type, frame.data)
+
+    def _track(self, frame: Frame) -> None:
+        data = frame.data
+        speaker = frame.speaker
+        if frame.event_type == "debate:turn_start":
+            self._open[speaker] = frame.seq
+            self._text[speaker] = []
+        elif frame.event_type == "debate:token_stream":
+            if speaker in self._text:
+                self._text[speaker].append(data["token"])
+        elif frame.event_type == "debate:turn_end":
+            # Built from the published text: simultaneous and speculative
+            # turns are recorded in the transcript only after their turn_end
+            self._open.pop(speaker, None)
+            content = "".join(self._text.pop(speaker, []))
+            self._turns.append({"speaker": speaker, "round": data["round"], "content": content})
+        elif frame.event_type == "debate:turn_cancelled":
+            self._open.pop(speaker, None)
+            self._text.pop(speaker, None)
+            # A speculative turn can end and then be dropped
+            self._turns = [
+                turn for turn in self._turns
+                if (turn["speaker"], turn["round"]) != (speaker, data["round"])
+            ]
+        elif frame.event_type == "debate:error" and speaker is not None:
+            # The speaker's turn was abandoned
+            self._open.pop(speaker, None)
+            self._text.pop(speaker, None)
+        elif frame.event_type == "debate:deadline" and speaker is not None:
+            # No longer in progress; the turn_end or turn_cancelled that
+            # follows settles its text
+            self._open.pop(speaker, None)
+        elif frame.event_type == "debate:round_start":
+            self._round = data["round"]
+        elif frame.event_type == "debate:consensus_check":
+            self._consensus = data["consensus_score"]
+
+    def since(self, seq: int) -> list[Frame] | None:
+        """Events after ``seq``, or None if the log no longer reaches back that far."""
+        oldest = self._published - len(self._ring) + 1
+        if seq < oldest - 1 or seq > self._published:
+            return None
+        return list(self._ring)[seq - oldest + 1:]
+
+    def catch_up(self, after_seq: int | None = None) -> tuple[dict | None, list[Frame]]:
+        """What a client needs before the live events.
+
+        Resuming after ``after_seq`` gives no snapshot and the missed
+        events, when the log still has them. Otherwise the result is a
+        snapshot of the debate so far and the events of its turns in
+        progress. The snapshot's ``seq`` is the last event it covers.
+        """
+        if after_seq is not None:
+            missed = self.since(after_seq)
+            if missed is not None:
+                return None, missed
+        config = self.session.config
+        snapshot = {
+            "session_id": self.session.session_id,
+            "seq": self._published,
+            "topic": config.topic,
+            "participants": [p.display_name for p in config.participants],
+            "status": self.session.status.value,
+            "round": self._round,
+            "consensus_score": self._consensus,
+            "transcript": list(self._turns),
+        }
+        replay = [
+            frame for frame in self._ring
+            if frame.speaker in self._open and frame.seq >= self._open[frame.speaker]
+        ]
+        return snapshot, replay
+
+    def subscribe(self, after_seq: int | None = None) -> Subscription:
+        """Add an SSE subscriber; its catch-up precedes its live frames."""
+        subscription = Subscription(*self.catch_up(after_seq))
+        self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        self._subscribers.discard(subscription)
+
+    def close(self) -> None:
+        """End every SSE subscription once the debate is over."""
+        for subscription in self._subscribers:
+            subscription.end()
+        self._subscribers.clear()
@@ -6,6 +6,7 @@ import asyncio
 import logging
 import time
 
+from ..adapters.clients import client_pool
 from ..models.debate import DebateSession
 
 logger = logging.getLogger(__name__)
@@ -18,12 +19,15 @@ class SessionManager:
     """Manages ephemeral debate sessions in memory.
 
     Sessions are stored in a dict and automatically cleaned up
-    after the timeout period. API keys are purged when sessions end.
+    after the timeout period, unless a running debate keeps them alive.
+    API keys are purged when sessions end.
     """
 
     def __init__(self):
         self._sessions: dict[str, DebateSession] = {}
         self._last_activity: dict[str, float] = {}
+        # Sessions of running debates, which end them when they finish
+        self._kept_alive: set[str] = set()
         self._cleanup_task: asyncio.Task | None = None
 
     def create_session(self, session: DebateSession) -> str:
@@ -40,11 +44,25 @@ class SessionManager:
             self._last_activity[session_id] = time.time()
         return session
 
+    def keep_alive(self, session_id: str) -> None:
+        """Exempt a session from expiry until it is ended."""
+        if session_id in self._sessions:
+            self._kept_alive.add(session_id)
+
     def end_session(self, session_id: str) -> None:
         """End a session and purge its API keys from memory."""
         session = self._sessions.pop(session_id, None)
         self._last_activity.pop(session_id, None)
+        self._kept_alive.discard(session_id)
         if session:
+            # Keep pooled clients that another live session still relies on
+            in_use = {
+                key for other in self._sessions.values()
+                for key in other.api_keys.values()
+            }
+            for api_key in session.api_keys.values():
+                if api_key not in in_use:
+                    client_pool.purge_key(api_key)
             session.api_keys.clear()
             logger.info(f"Session ended and keys purged: {session_id}")
 
@@ -65,20 +83,25 @@ class SessionManager:
             except asyncio.CancelledError:
                 pass
 
+    def expire(self, now: float | None = None) -> list[str]:
+        """End the sessions that have timed out and return their IDs."""
+        now = time.time() if now is None else now
+        expired = [
+            sid
+            for sid, last in self._last_activity.items()
+            if now - last > SESSION_TIMEOUT and sid not in self._kept_alive
+        ]
+        for sid in expired:
+            logger.info(f"Session expired: {sid}")
+            self.end_session(sid)
+        return expired
+
     async def _cleanup_expired(self) -> None:
         """Periodically remove sessions that have timed out."""
         while True:
             try:
                 await asyncio.sleep(60)  # Check every minute
-                now = time.time()
-                expired = [
-                    sid
-                    for sid, last in self._last_activity.items()
-                    if now - last > SESSION_TIMEOUT
-                ]
-                for sid in expired:
-                    logger.info(f"Session expired: {sid}")
-                    self.end_session(sid)
+                self.expire()
             except asyncio.CancelledError:
                 break
             except Exception as e:
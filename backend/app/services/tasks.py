@@ -0,0 +1,255 @@
+"""Supervised background tasks for running debates.
+
+A debate runs for minutes, far longer than a Socket.IO event handler
+should. The registry runs each debate as its own task, so the handler
+returns as soon as the debate is set up and one connection can run
+several debates side by side. Every task ends with the same cleanup,
+whether the debate concluded, failed or was cancelled: it leaves the
+registry and its session ends, purging the API keys. On shutdown the
+remaining debates are cancelled and awaited.
+
+The registry also tracks which clients are watching each debate. Once
+the last one disconnects, a debate would otherwise carry on spending
+the user's keys for nobody. After a grace period its abandon policy
+applies: pause it, stop it, or let it finish headless. A client that
+rejoins within the grace period (or while the debate is paused) picks it
+up where it was. Results of debates that end with nobody watching are
+kept for a while so a returning client can still fetch them.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import secrets
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Awaitable, Callable
+
+from ..models.debate import DebateStatus
+from ..orchestrator.engine import DebateOrchestrator
+from .hub import DebateHub
+from .session import SESSION_TIMEOUT, session_manager
+
+logger = logging.getLogger(__name__)
+
+# Seconds running debates get to unwind on shutdown
+SHUTDOWN_TIMEOUT = 10.0
+
+# Seconds a debate keeps running after its last viewer left
+DEFAULT_ABANDON_GRACE = 30.0
+
+# Results of unattended debates kept for returning clients
+MAX_RESULTS = 100
+
+
+class AbandonPolicy(str, Enum):
+    """What happens to a debate once nobody has watched it for the grace period."""
+
+    # Cancel the turn in flight and wait; stopped if nobody returns within
+    # the session timeout
+    PAUSE = "pause"
+    STOP = "stop"
+    # Finish the debate, conspectus included, and keep the results
+    CONTINUE = "continue"
+
+
+@dataclass
+class DebateTask:
+    """One running debate, the connection that started it and its viewers."""
+
+    orchestrator: DebateOrchestrator
+    owner: str  # Socket.IO sid of the client that started the debate
+    abandon: AbandonPolicy = AbandonPolicy.PAUSE
+    grace: float = DEFAULT_ABANDON_GRACE
+    viewers: set[str] = field(default_factory=set)
+    hub: DebateHub | None = None  # Publishes events to spectators
+    task: asyncio.Task | None = None
+    started: float = field(default_factory=time.monotonic)
+    # Counts down the grace period while nobody is watching
+    watchdog: asyncio.Task | None = None
+    # Set when the abandon policy paused the debate, so a rejoin resumes it
+    auto_paused: bool = False
+    # Lets the owner keep control of the debate from a new connection
+    control_token: str = field(default_factory=lambda: secrets.token_urlsafe(16))
+
+    @property
+    def attended(self) -> bool:
+        """Whether someone is watching, or the debate may run without them."""
+        return bool(self.viewers) or self.abandon == AbandonPolicy.CONTINUE
+
+    @property
+    def session_id(self) -> str:
+        return self.orchestrator.session.session_id
+
+    def to_dict(self) -> dict:
+        session = self.orchestrator.session
+        return {
+            "session_id": self.session_id,
+            "owner": self.owner,
+            "status": session.status.value,
+            "round": session.current_round,
+            "viewers": len(self.viewers),
+            "sse_subscribers": self.hub.subscribers if self.hub else 0,
+            "abandon": self.abandon.value,
+            "age_seconds": round(time.monotonic() - self.started, 1),
+        }
+
+
+class DebateTaskRegistry:
+    """Running debates keyed by session_id."""
+
+    def __init__(self):
+        self._debates: dict[str, DebateTask] = {}
+        # session_id -> (finished at, safe session dict)
+        self._results: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+
+    def spawn(
+        self,
+        orchestrator: DebateOrchestrator,
+        owner: str,
+        body: Callable[[DebateTask], Awaitable[None]],
+        abandon: AbandonPolicy = AbandonPolicy.PAUSE,
+        grace: float = DEFAULT_ABANDON_GRACE,
+        hub: DebateHub | None = None,
+    ) -> DebateTask:
+        """Run ``body`` as the task of ``orchestrator``'s debate."""
+        debate = DebateTask(orchestrator, owner, abandon, grace, viewers={owner}, hub=hub)
+        self._debates[debate.session_id] = debate
+        # Nothing refreshes a running debate's session, and expiry would
+        # purge the keys it still needs; the debate ends it instead
+        session_manager.keep_alive(debate.session_id)
+        debate.task = asyncio.create_task(
+            self._supervise(debate, body), name=f"debate-{debate.session_id}"
+        )
+        return debate
+
+    async def _supervise(
+        self, debate: DebateTask, body: Callable[[DebateTask], Awaitable[None]]
+    ) -> None:
+        try:
+            await body(debate)
+        except asyncio.CancelledError:
+            logger.info(f"Debate {debate.session_id} cancelled")
+            raise
+        except Exception:
+            logger.exception(f"Debate {debate.session_id} failed")
+        finally:
+            if debate.watchdog is not None:
+                debate.watchdog.cancel()
+            if not debate.viewers:
+                self._keep_results(debate)
+            if debate.hub is not None:
+                debate.hub.close()
+            self._debates.pop(debate.session_id, None)
+            session_manager.end_session(debate.session_id)
+
+    def join(self, session_id: str, sid: str) -> DebateTask | None:
+        """Add a viewer to a running debate, resuming it if it was abandoned."""
+        debate = self._debates.get(session_id)
+        if debate is None:
+            return None
+        debate.viewers.add(sid)
+        if debate.watchdog is not None:
+            debate.watchdog.cancel()
+            debate.watchdog = None
+        if debate.auto_paused:
+            logger.info(f"Debate {session_id} resumed by a returning viewer")
+            debate.auto_paused = False
+            debate.orchestrator.resume()
+        return debate
+
+    def leave(self, sid: str) -> None:
+        """Remove a disconnected client from every debate it was watching."""
+        for debate in self._debates.values():
+            if sid not in debate.viewers:
+                continue
+            debate.viewers.discard(sid)
+            if not debate.viewers and debate.watchdog is None:
+                debate.watchdog = asyncio.create_task(self._watch(debate))
+
+    async def _watch(self, debate: DebateTask) -> None:
+        """Apply the abandon policy once the grace period passes unwatched."""
+        await asyncio.sleep(debate.grace)
+        if debate.abandon == AbandonPolicy.CONTINUE:
+            logger.info(f"Debate {debate.session_id} continuing with nobody watching")
+            return
+        if debate.abandon == AbandonPolicy.STOP:
+            logger.info(f"Debate {debate.session_id} abandoned, stopping")
+            debate.orchestrator.stop()
+            return
+        # A debate the user paused stays paused on rejoin
+        if debate.orchestrator.session.status != DebateStatus.PAUSED:
+            logger.info(f"Debate {debate.session_id} abandoned, pausing")
+            debate.auto_paused = True
+            # Drop the turn in flight rather than hold its stream open
+            debate.orchestrator.pause(restart_turn=True)
+        await asyncio.sleep(SESSION_TIMEOUT)
+        logger.info(f"Debate {debate.session_id} not rejoined in time, stopping")
+        debate.orchestrator.stop()
+
+    def _keep_results(self, debate: DebateTask) -> None:
+        now = time.monotonic()
+        while self._results and (
+            len(self._results) >= MAX_RESULTS
+            or now - next(iter(self._results.values()))[0] > SESSION_TIMEOUT
+        ):
+            self._results.popitem(last=False)
+        self._results[debate.session_id] = (now, debate.orchestrator.session.to_safe_dict())
+
+    def results(self, session_id: str) -> dict | None:
+        """Final state of a debate that ended with nobody watching."""
+        kept = self._results.get(session_id)
+        if kept is None or time.monotonic() - kept[0] > SESSION_TIMEOUT:
+            return None
+        return kept[1]
+
+    def get(self, session_id: str) -> DebateOrchestrator | None:
+        debate = self._debates.get(session_id)
+        return debate.orchestrator if debate else None
+
+    def find(self, session_id: str) -> DebateTask | None:
+        return self._debates.get(session_id)
+
+    def control(
+        self, session_id: str, sid: str, control_token: str | None = None
+    ) -> DebateTask | None:
+        """The debate, if ``sid`` may pause, resume or stop it.
+
+        Only the owner may. A client presenting the debate's control token,
+        such as the owner after reconnecting, becomes its owner.
+        """
+        debate = self._debates.get(session_id)
+        if debate is None:
+            return None
+        if debate.owner != sid:
+            if not control_token or not secrets.compare_digest(
+                control_token, debate.control_token
+            ):
+                return None
+            debate.owner = sid
+        return debate
+
+    def owned_by(self, owner: str) -> list[DebateTask]:
+        return [debate for debate in self._debates.values() if debate.owner == owner]
+
+    def snapshot(self) -> list[dict]:
+        return [debate.to_dict() for debate in self._debates.values()]
+
+    async def shutdown(self, timeout: float = SHUTDOWN_TIMEOUT) -> None:
+        """Cancel every running debate and wait for its cleanup."""
+        tasks = [debate.task for debate in self._debates.values() if debate.task]
+        if not tasks:
+            return
+        logger.info(f"Cancelling {len(tasks)} running debate(s)")
+        for task in tasks:
+            task.cancel()
+        _, pending = await asyncio.wait(tasks, timeout=timeout)
+        if pending:
+            logger.warning(f"{len(pending)} debate(s) did not finish cancelling")
+
+
+# Global singleton
+debate_tasks = DebateTaskRegistry()
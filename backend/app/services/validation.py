@@ -0,0 +1,165 @@
+"""Cached, concurrent API key validation.
+
+Every validation is a live provider call, and the setup page re-validates
+all stored keys whenever it loads. Outcomes are therefore cached briefly
+in memory, keyed by a salted hash of (provider, key): good keys for a few
+minutes, rejected keys for a shorter while so a fixed key is picked up
+soon. Network errors and timeouts are never cached. Concurrent requests
+for the same key share one in-flight call.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import hmac
+import logging
+import os
+import secrets
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from ..adapters.factory import PROVIDER_MODELS, get_adapter
+from ..models.providers import KeyValidationRequest, KeyValidationResponse
+
+logger = logging.getLogger(__name__)
+
+# How long a successful validation is trusted (seconds)
+VALID_TTL = float(os.environ.get("KEY_VALIDATION_TTL", 5 * 60))
+
+# How long an auth failure is remembered (seconds)
+INVALID_TTL = float(os.environ.get("KEY_VALIDATION_NEGATIVE_TTL", 60))
+
+# Maximum number of cached outcomes
+MAX_ENTRIES = 1024
+
+# Per-provider upper bound on a single validation call (seconds)
+DEFAULT_TIMEOUT = 10.0
+PROVIDER_TIMEOUTS: dict[str, float] = {
+    "google": 15.0,  # Gemini's model listing is noticeably slower to answer
+}
+
+INVALID_KEY_MESSAGE = "Invalid API key. Please check your key and try again."
+
+
+@dataclass
+class _CachedOutcome:
+    response: KeyValidationResponse
+    expires_at: float
+
+
+class KeyValidator:
+    """Validates provider keys with a short-TTL outcome cache.
+
+    Cache keys are HMACs under a per-process random salt, so the cache
+    never holds raw keys and its entries can't be matched against the
+    unsalted fingerprints used elsewhere.
+    """
+
+    def __init__(
+        self,
+        valid_ttl: float = VALID_TTL,
+        invalid_ttl: float = INVALID_TTL,
+        max_entries: int = MAX_ENTRIES,
+    ):
+        self._valid_ttl = valid_ttl
+        self._invalid_ttl = invalid_ttl
+        self._max_entries = max_entries
+        self._salt = secrets.token_bytes(16)
+        self._cache: OrderedDict[str, _CachedOutcome] = OrderedDict()
+        self._in_flight: dict[str, asyncio.Task[KeyValidationResponse]] = {}
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def _cache_key(self, provider: str, api_key: str) -> str:
+        message = f"{provider}\0{api_key}".encode("utf-8")
+        return hmac.new(self._salt, message, hashlib.sha256).hexdigest()
+
+    async def validate(self, request: KeyValidationRequest) -> KeyValidationResponse:
+        """Validate one key, answering from the cache when possible."""
+        provider = request.provider.value
+        cache_key = self._cache_key(provider, request.api_key)
+
+        cached = self._lookup(cache_key)
+        if cached is not None:
+            return cached.model_copy(update={"cached": True})
+
+        task = self._in_flight.get(cache_key)
+        if task is None:
+            task = asyncio.ensure_future(self._check_and_store(request, cache_key))
+            self._in_flight[cache_key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(cache_key, None))
+        # Shielded so a disconnecting caller doesn't cancel a shared check
+        return (await asyncio.shield(task)).model_copy()
+
+    async def validate_many(
+        self, requests: list[KeyValidationRequest]
+    ) -> list[KeyValidationResponse]:
+        """Validate several keys concurrently, preserving request order."""
+        return list(await asyncio.gather(*(self.validate(r) for r in requests)))
+
+    async def _check_and_store(
+        self, request: KeyValidationRequest, cache_key: str
+    ) -> KeyValidationResponse:
+        response, ttl = await self._check(request)
+        if ttl > 0:
+            self._store(cache_key, response, ttl)
+        return response
+
+    async def _check(
+        self, request: KeyValidationRequest
+    ) -> tuple[KeyValidationResponse, float]:
+        """Make the live call; return the response and how long to cache it."""
+        provider = request.provider.value
+        try:
+            adapter = get_adapter(provider)
+        except ValueError as e:
+            return _response(request, False, str(e)), 0.0
+
+        timeout = PROVIDER_TIMEOUTS.get(provider, DEFAULT_TIMEOUT)
+        try:
+            is_valid = await asyncio.wait_for(adapter.validate_key(request.api_key), timeout)
+        except asyncio.TimeoutError:
+            message = f"{adapter.label} did not respond within {timeout:.0f}s."
+            return _response(request, False, message), 0.0
+        except RuntimeError as e:
+            # Non-auth failures (network, rate limit, API errors)
+            return _response(request, False, str(e)), 0.0
+
+        if is_valid:
+            return _response(request, True, "API key is valid."), self._valid_ttl
+        return _response(request, False, INVALID_KEY_MESSAGE), self._invalid_ttl
+
+    def _lookup(self, cache_key: str) -> KeyValidationResponse | None:
+        entry = self._cache.get(cache_key)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.monotonic():
+            del self._cache[cache_key]
+            return None
+        self._cache.move_to_end(cache_key)
+        return entry.response
+
+    def _store(self, cache_key: str, response: KeyValidationResponse, ttl: float) -> None:
+        self._cache[cache_key] = _CachedOutcome(response, time.monotonic() + ttl)
+        self._cache.move_to_end(cache_key)
+        while len(self._cache) > self._max_entries:
+            self._cache.popitem(last=False)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+
+def _response(request: KeyValidationRequest, valid: bool, message: str) -> KeyValidationResponse:
+    return KeyValidationResponse(
+        provider=request.provider,
+        valid=valid,
+        message=message,
+        available_models=PROVIDER_MODELS.get(request.provider.value, []) if valid else [],
+    )
+
+
+# Global singleton
+key_validator = KeyValidator()
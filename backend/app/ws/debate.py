@@ -6,22 +6,26 @@ import logging
 
 import socketio
 
+from ..api.debate import StreamCadence
 from ..models.debate import (
     DebateConfig,
     DebateSession,
     DebateStatus,
     Participant,
+    PromptLayout,
     Provider,
+    RoundStrategy,
 )
-from ..orchestrator.engine import DebateOrchestrator
+from ..orchestrator.coalesce import coalesce_events
+from ..orchestrator.engine import DebateEvent, DebateOrchestrator
 from ..services.conspectus import generate_conspectus
+from ..services.hub import DebateHub
 from ..services.session import session_manager
+from ..services.tasks import DEFAULT_ABANDON_GRACE, AbandonPolicy, DebateTask, debate_tasks
+from .emitter import DEFAULT_MAX_EVENTS, OverflowPolicy, SessionEmitter, emitters
 
 logger = logging.getLogger(__name__)
 
-# Active orchestrators keyed by session_id
-_orchestrators: dict[str, DebateOrchestrator] = {}
-
 
 def register_debate_events(sio: socketio.AsyncServer) -> None:
     """Register all debate-related WebSocket event handlers."""
@@ -33,6 +37,7 @@ def register_debate_events(sio: socketio.AsyncServer) -> None:
     @sio.event
     async def disconnect(sid: str) -> None:
         logger.info(f"Client disconnected: {sid}")
+        debate_tasks.leave(sid)
 
     @sio.on("debate:start")
     async def handle_debate_start(sid: str, data: dict) -> None:
@@ -42,15 +47,45 @@ def register_debate_events(sio: socketio.AsyncServer) -> None:
         {
             "topic": "...",
             "participants": [
-                {"provider": "anthropic", "model": "claude-sonnet-4-20250514", "display_name": "Claude Sonnet", "persona": ""},
+                {"provider": "anthropic", "model": "claude-sonnet-4-20250514", "display_name": "Claude Sonnet", "persona": "",
+                 "fallback_provider": "openai", "fallback_model": "gpt-4o",  # Optional
+                 "hedge_provider": "openai", "hedge_model": "gpt-4o"},  # Optional
                 ...
             ],
             "api_keys": {"anthropic": "sk-...", "openai": "sk-...", ...},
             "max_rounds": 10,
             "max_tokens_per_turn": 1024,
             "temperature": 0.7,
-            "consensus_threshold": 0.8
+            "consensus_threshold": 0.8,
+            "prompt_layout": "transcript",  # or "conversation"
+            "round_strategy": "sequential",  # or "simultaneous"
+            "speculative_consensus": false,  # Start the next round while consensus is checked
+            "hedge_requests": false,  # Race a slow first token against a second request
+            "hedge_percentile": 0.95,
+            "hedge_budget_usd": 0.25,
+            "first_token_timeout_seconds": 60,
+            "turn_timeout_seconds": 300,
+            "round_timeout_seconds": null,  # No limit unless set
+            "debate_timeout_seconds": null,
+            "token_flush_ms": 50,  # Token text is batched per window; 0 disables
+            "token_flush_bytes": 1024,
+            "emit_queue_size": 256,  # Events held for a slow client
+            "overflow": "coalesce",  # Or "drop_tokens" or "disconnect" (the owner)
+            "when_abandoned": "pause",  # Or "stop" or "continue"
+            "abandon_grace_seconds": 30
         }
+
+        The debate runs as a background task, so this handler returns once
+        the session is set up and a client can run several debates at
+        once. Events go through a bounded queue drained by a separate
+        task, so a slow client never holds up the provider streams. Once
+        every client has left the debate's room for the grace period,
+        ``when_abandoned`` decides whether it pauses, stops or finishes
+        headless; ``debate:join`` picks it up again.
+
+        Only this client may pause, resume or stop the debate. It gets a
+        ``debate:control`` event holding a ``control_token``; sending the
+        token along with those requests keeps control after a reconnect.
         """
         try:
             participants = [
@@ -59,6 +94,10 @@ def register_debate_events(sio: socketio.AsyncServer) -> None:
                     model=p["model"],
                     display_name=p["display_name"],
                     persona=p.get("persona", ""),
+                    fallback_provider=p.get("fallback_provider"),
+                    fallback_model=p.get("fallback_model"),
+                    hedge_provider=p.get("hedge_provider"),
+                    hedge_model=p.get("hedge_model"),
                 )
                 for p in data.get("participants", [])
             ]
@@ -70,89 +109,210 @@ def register_debate_events(sio: socketio.AsyncServer) -> None:
                 max_tokens_per_turn=data.get("max_tokens_per_turn", 1024),
                 temperature=data.get("temperature", 0.7),
                 consensus_threshold=data.get("consensus_threshold", 0.8),
+                prompt_layout=PromptLayout(data.get("prompt_layout", "transcript")),
+                round_strategy=RoundStrategy(data.get("round_strategy", "sequential")),
+                speculative_consensus=data.get("speculative_consensus", False),
+                hedge_requests=data.get("hedge_requests", False),
+                hedge_percentile=data.get("hedge_percentile", 0.95),
+                hedge_budget_usd=data.get("hedge_budget_usd", 0.25),
+                first_token_timeout_seconds=data.get("first_token_timeout_seconds", 60.0),
+                turn_timeout_seconds=data.get("turn_timeout_seconds", 300.0),
+                round_timeout_seconds=data.get("round_timeout_seconds"),
+                debate_timeout_seconds=data.get("debate_timeout_seconds"),
             )
+            overflow = OverflowPolicy(data.get("overflow", "coalesce"))
+            abandon = AbandonPolicy(data.get("when_abandoned", "pause"))
+            grace = float(data.get("abandon_grace_seconds", DEFAULT_ABANDON_GRACE))
+            # Same limits as the REST endpoints; unset options take the defaults
+            cadence = StreamCadence(**{
+                option: data[option]
+                for option in ("token_flush_ms", "token_flush_bytes")
+                if data.get(option) is not None
+            })
 
             session = DebateSession(
                 config=config,
                 api_keys=data.get("api_keys", {}),
             )
-            session_manager.create_session(session)
+        except Exception as e:
+            logger.error(f"Debate start error: {e}")
+            await sio.emit("debate:error", {"error": str(e)}, to=sid)
+            return
 
-            # Put client in a room for this session
-            sio.enter_room(sid, session.session_id)
+        session_manager.create_session(session)
 
-            orchestrator = DebateOrchestrator(session)
-            _orchestrators[session.session_id] = orchestrator
+        # Put client in a room for this session
+        sio.enter_room(sid, session.session_id)
 
-            # Run the debate and emit events
-            async for event in orchestrator.run():
-                await sio.emit(
-                    event.event_type,
-                    event.data,
-                    room=session.session_id,
-                )
+        orchestrator = DebateOrchestrator(session)
 
-            # Generate conspectus after debate concludes
-            if session.status == DebateStatus.CONCLUDED:
-                await sio.emit(
-                    "debate:generating_conspectus",
-                    {"session_id": session.session_id},
-                    room=session.session_id,
-                )
-                conspectus = await generate_conspectus(session)
-                session.conspectus = conspectus
-                await sio.emit(
-                    "debate:conspectus",
-                    {
-                        "session_id": session.session_id,
-                        "conspectus": conspectus,
-                    },
-                    room=session.session_id,
+        async def broadcast(event_type: str, payload: dict) -> None:
+            await sio.emit(event_type, payload, room=session.session_id)
+
+        hub = DebateHub(session, broadcast)
+
+        async def disconnect_client() -> None:
+            # The queue is shared by every viewer, so the debate's current
+            # owner goes, even if it took over from another connection. The
+            # abandon policy decides what happens if nobody else is watching
+            debate = debate_tasks.find(session.session_id)
+            if debate is not None:
+                await sio.disconnect(debate.owner)
+
+        async def run_debate(debate: DebateTask) -> None:
+            emitter = SessionEmitter(
+                session.session_id,
+                hub.publish,
+                max_events=data.get("emit_queue_size") or DEFAULT_MAX_EVENTS,
+                overflow=overflow,
+                on_overflow=disconnect_client,
+            )
+            emitters.add(emitter)
+            try:
+                # Run the debate and queue its events, batching token text
+                # per the client's cadence
+                async for event in coalesce_events(orchestrator.run(), cadence.coalesce_policy()):
+                    emitter.put(event)
+
+                # Generate conspectus after debate concludes, unless it was
+                # stopped for having nobody left to read it
+                if session.status == DebateStatus.CONCLUDED and debate.attended:
+                    emitter.put(DebateEvent(
+                        "debate:generating_conspectus", {"session_id": session.session_id}
+                    ))
+                    conspectus = await generate_conspectus(session, orchestrator.transcript)
+                    session.conspectus = conspectus
+                    emitter.put(DebateEvent(
+                        "debate:conspectus",
+                        {
+                            "session_id": session.session_id,
+                            "conspectus": conspectus,
+                        },
+                    ))
+                await emitter.close()
+
+            except Exception as e:
+                logger.error(f"Debate {session.session_id} error: {e}")
+                await emitter.close()
+                # Numbered and logged like any other event, for every viewer
+                await hub.publish(
+                    "debate:error", {"session_id": session.session_id, "error": str(e)}
                 )
+            finally:
+                # Only still running when the debate task was cancelled
+                emitter.cancel()
+                emitters.remove(session.session_id)
 
-            # Cleanup
-            _orchestrators.pop(session.session_id, None)
-            session_manager.end_session(session.session_id)
+        debate = debate_tasks.spawn(
+            orchestrator, sid, run_debate, abandon=abandon, grace=grace, hub=hub
+        )
+        # Only the starter gets the token; spectators can watch, not control
+        await sio.emit(
+            "debate:control",
+            {"session_id": session.session_id, "control_token": debate.control_token},
+            to=sid,
+        )
 
-        except Exception as e:
-            logger.error(f"Debate start error: {e}")
-            await sio.emit("debate:error", {"error": str(e)}, to=sid)
+    async def catch_up(sid: str, session_id: str, reply: str, after_seq: int | None) -> None:
+        debate = debate_tasks.join(session_id, sid)
+        if debate is not None:
+            # Catch-up and room entry happen together, so no event is
+            # missed or repeated
+            snapshot, replay = debate.hub.catch_up(after_seq)
+            sio.enter_room(sid, session_id)
+            await sio.emit(
+                reply,
+                {
+                    "session_id": session_id,
+                    "snapshot": snapshot,
+                    "replay": [frame.to_dict() for frame in replay],
+                },
+                to=sid,
+            )
+            return
+        results = debate_tasks.results(session_id)
+        if results is not None:
+            await sio.emit(
+                "debate:results", {"session_id": session_id, "session": results}, to=sid
+            )
+            return
+        await sio.emit(
+            "debate:error", {"session_id": session_id, "error": "Unknown debate"}, to=sid
+        )
+
+    @sio.on("debate:join")
+    async def handle_debate_join(sid: str, data: dict) -> None:
+        """Watch a debate, such as after reconnecting with a new sid.
+
+        Any number of spectators can join a running debate. Each is added
+        to its room, which resumes the debate if it was paused for being
+        abandoned. It gets ``debate:joined`` with a compact snapshot and the
+        events of the turns in progress, then the live events. A debate
+        that ended with nobody watching replies with ``debate:results``.
+        """
+        await catch_up(sid, data.get("session_id", ""), "debate:joined", None)
+
+    @sio.on("debate:resync")
+    async def handle_debate_resync(sid: str, data: dict) -> None:
+        """Resume a debate's events after the last ``seq`` the client saw.
+
+        Every event payload carries a ``seq``, so a client can spot a gap.
+        The reply, ``debate:resynced``, replays the missed events. If the
+        session's event log has been trimmed past ``after_seq``, it holds a
+        snapshot and the turns in progress instead, like ``debate:joined``.
+
+        Expected data: {"session_id": "...", "after_seq": 42}
+        """
+        try:
+            after_seq = int(data.get("after_seq", 0))
+        except (TypeError, ValueError):
+            after_seq = None
+        await catch_up(sid, data.get("session_id", ""), "debate:resynced", after_seq)
+
+    async def controlled(sid: str, data: dict) -> DebateTask | None:
+        session_id = data.get("session_id", "")
+        debate = debate_tasks.control(session_id, sid, data.get("control_token"))
+        if debate is None and debate_tasks.get(session_id) is not None:
+            await sio.emit(
+                "debate:error",
+                {
+                    "session_id": session_id,
+                    "error": "Only the client that started this debate can control it",
+                },
+                to=sid,
+            )
+        return debate
 
     @sio.on("debate:pause")
     async def handle_debate_pause(sid: str, data: dict) -> None:
-        """Pause an ongoing debate."""
+        """Pause an ongoing debate.
+
+        With ``"restart_turn": true`` the current turn is cancelled and
+        starts over on resume, instead of holding its stream open.
+        """
         session_id = data.get("session_id", "")
-        orchestrator = _orchestrators.get(session_id)
-        if orchestrator:
-            orchestrator.pause()
-            await sio.emit(
-                "debate:paused",
-                {"session_id": session_id},
-                room=session_id,
+        restart_turn = bool(data.get("restart_turn", False))
+        debate = await controlled(sid, data)
+        if debate:
+            debate.orchestrator.pause(restart_turn=restart_turn)
+            await debate.hub.publish(
+                "debate:paused", {"session_id": session_id, "restart_turn": restart_turn}
             )
 
     @sio.on("debate:resume")
     async def handle_debate_resume(sid: str, data: dict) -> None:
         """Resume a paused debate."""
         session_id = data.get("session_id", "")
-        orchestrator = _orchestrators.get(session_id)
-        if orchestrator:
-            orchestrator.resume()
-            await sio.emit(
-                "debate:resumed",
-                {"session_id": session_id},
-                room=session_id,
-            )
+        debate = await controlled(sid, data)
+        if debate:
+            debate.orchestrator.resume()
+            await debate.hub.publish("debate:resumed", {"session_id": session_id})
 
     @sio.on("debate:stop")
     async def handle_debate_stop(sid: str, data: dict) -> None:
         """Stop a debate early."""
         session_id = data.get("session_id", "")
-        orchestrator = _orchestrators.get(session_id)
-        if orchestrator:
-            orchestrator.stop()
-            await sio.emit(
-                "debate:stopped",
-                {"session_id": session_id},
-                room=session_id,
-            )
+        debate = await controlled(sid, data)
+        if debate:
+            debate.orchestrator.stop()
+            await debate.hub.publish("debate:stopped", {"session_id": session_id})
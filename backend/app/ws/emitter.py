@@ -0,0 +1,208 @@
+"""Bounded per-session event queue between a debate and its socket room.
+
+Emitting each event straight from the debate loop ties the provider
+stream to the slowest client: while ``sio.emit`` waits on a congested
+socket, no chunk is read from the provider, and a long enough stall makes
+the provider drop the connection. A ``SessionEmitter`` takes events
+without waiting and sends them from its own task. When the queue is full,
+its overflow policy decides what happens to further token text; turn
+boundaries and other events are always kept.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from enum import Enum
+from typing import Awaitable, Callable
+
+from ..orchestrator.engine import DebateEvent
+
+logger = logging.getLogger(__name__)
+
+# Events held for a session before the overflow policy applies
+DEFAULT_MAX_EVENTS = 256
+
+_TURN_BOUNDARIES = ("debate:turn_end", "debate:turn_cancelled")
+
+
+class OverflowPolicy(str, Enum):
+    """What a full queue does with further token text."""
+
+    # Append the text to the speaker's last queued token event
+    COALESCE = "coalesce"
+    # Discard the text; the turn's end event reports how many were dropped
+    DROP_TOKENS = "drop_tokens"
+    # Disconnect the debate's current owner and drop the queued token text;
+    # the queue is shared, so the slow viewer itself can't be singled out.
+    # The debate carries on for anyone still watching
+    DISCONNECT = "disconnect"
+
+
+class SessionEmitter:
+    """Queues one session's events and sends them from a separate task."""
+
+    def __init__(
+        self,
+        session_id: str,
+        send: Callable[[str, dict], Awaitable[None]],
+        max_events: int = DEFAULT_MAX_EVENTS,
+        overflow: OverflowPolicy = OverflowPolicy.COALESCE,
+        on_overflow: Callable[[], Awaitable[None]] | None = None,
+    ):
+        self.session_id = session_id
+        self.max_events = max(1, max_events)
+        self.overflow = overflow
+        self.overflowed = False  # Set once a DISCONNECT overflow happened
+        self.disconnects = 0
+        self.emitted = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self.max_depth = 0
+        self.max_lag = 0.0
+        self._send = send
+        self._on_overflow = on_overflow
+        self._queue: deque[tuple[float, DebateEvent]] = deque()
+        self._ready = asyncio.Event()
+        self._closing = False
+        self._disconnect_pending = False
+        self._dropped_by_speaker: dict[str, int] = {}
+        self._task = asyncio.create_task(self._drain())
+
+    @property
+    def depth(self) -> int:
+        return len(self._queue)
+
+    @property
+    def lag(self) -> float:
+        """Seconds the oldest queued event has been waiting."""
+        if not self._queue:
+            return 0.0
+        return time.monotonic() - self._queue[0][0]
+
+    def put(self, event: DebateEvent) -> None:
+        """Queue ``event`` for sending; never waits on the client."""
+        if self._closing:
+            return
+        is_token = event.event_type == "debate:token_stream"
+        if is_token and len(self._queue) >= self.max_events and not self._overflow(event):
+            return
+        if event.event_type in _TURN_BOUNDARIES:
+            dropped = self._dropped_by_speaker.pop(event.data.get("speaker", ""), 0)
+            if dropped:
+                event = DebateEvent(event.event_type, {**event.data, "dropped_tokens": dropped})
+        self._queue.append((time.monotonic(), event))
+        self.max_depth = max(self.max_depth, len(self._queue))
+        self._ready.set()
+
+    def _overflow(self, event: DebateEvent) -> bool:
+        """Apply the overflow policy to a token event; True to queue it anyway."""
+        speaker = event.data["speaker"]
+        if self.overflow == OverflowPolicy.DROP_TOKENS:
+            self._drop(event)
+            return False
+        if self.overflow == OverflowPolicy.DISCONNECT:
+            logger.warning(
+                f"Session {self.session_id}: client fell {len(self._queue)} events behind, "
+                "disconnecting"
+            )
+            self.overflowed = True
+            self.disconnects += 1
+            # Turn boundaries stay queued and report the dropped text
+            kept: deque[tuple[float, DebateEvent]] = deque()
+            for queued_at, queued in self._queue:
+                if queued.event_type == "debate:token_stream":
+                    self._drop(queued)
+                else:
+                    kept.append((queued_at, queued))
+            self._queue = kept
+            self._drop(event)
+            self._disconnect_pending = True
+            self._ready.set()
+            return False
+        # Merge into the speaker's last token event, unless a turn boundary
+        # or other event was queued after it
+        for index in range(len(self._queue) - 1, -1, -1):
+            queued_at, queued = self._queue[index]
+            if queued.event_type != "debate:token_stream":
+                break
+            if queued.data["speaker"] == speaker:
+                merged = {**queued.data, "token": queued.data["token"] + event.data["token"]}
+                self._queue[index] = (queued_at, DebateEvent(queued.event_type, merged))
+                self.coalesced += 1
+                return False
+        return True
+
+    def _drop(self, event: DebateEvent) -> None:
+        speaker = event.data["speaker"]
+        self.dropped += 1
+        self._dropped_by_speaker[speaker] = self._dropped_by_speaker.get(speaker, 0) + 1
+
+    async def _drain(self) -> None:
+        while True:
+            if self._disconnect_pending:
+                self._disconnect_pending = False
+                if self._on_overflow is not None:
+                    await self._on_overflow()
+                continue
+            if not self._queue:
+                if self._closing:
+                    return
+                self._ready.clear()
+                await self._ready.wait()
+                continue
+            queued_at, event = self._queue.popleft()
+            self.max_lag = max(self.max_lag, time.monotonic() - queued_at)
+            try:
+                await self._send(event.event_type, event.data)
+            except Exception as e:
+                logger.warning(f"Session {self.session_id}: emit of {event.event_type} failed: {e}")
+                continue
+            self.emitted += 1
+
+    async def close(self) -> None:
+        """Send whatever is still queued, then stop the emitter task."""
+        self._closing = True
+        self._ready.set()
+        await self._task
+
+    def cancel(self) -> None:
+        """Stop sending right away, discarding anything still queued."""
+        self._task.cancel()
+
+    def snapshot(self) -> dict:
+        return {
+            "session_id": self.session_id,
+            "overflow": self.overflow.value,
+            "depth": self.depth,
+            "max_depth": self.max_depth,
+            "lag_seconds": round(self.lag, 4),
+            "max_lag_seconds": round(self.max_lag, 4),
+            "emitted": self.emitted,
+            "coalesced": self.coalesced,
+            "dropped": self.dropped,
+            "overflowed": self.overflowed,
+            "disconnects": self.disconnects,
+        }
+
+
+class EmitterRegistry:
+    """Live session emitters, for metrics."""
+
+    def __init__(self):
+        self._emitters: dict[str, SessionEmitter] = {}
+
+    def add(self, emitter: SessionEmitter) -> None:
+        self._emitters[emitter.session_id] = emitter
+
+    def remove(self, session_id: str) -> None:
+        self._emitters.pop(session_id, None)
+
+    def snapshot(self) -> list[dict]:
+        return [emitter.snapshot() for emitter in self._emitters.values()]
+
+
+# Global singleton
+emitters = EmitterRegistry()
@@ -28,7 +28,7 @@ from typing import Callable, Coroutine
 # Ensure the backend app is importable
 sys.path.insert(0, "..")
 
-from app.adapters.base import GenerationConfig, Message, MessageRole
+from app.adapters.base import GenerationConfig, Message, MessageRole, StreamUsage
 from app.adapters.factory import PROVIDER_MODELS, get_adapter
 from app.models.debate import (
     DebateConfig,
@@ -253,8 +253,10 @@ async def test_streaming_generation(api_keys: dict[str, str]) -> TestResult:
         config = GenerationConfig(model=model, max_tokens=20, temperature=0.0)
         try:
             tokens = []
-            async for token in adapter.generate_stream(messages, config, key):
-                tokens.append(token)
+            async for chunk in adapter.generate_stream(messages, config, key):
+                if isinstance(chunk, StreamUsage):
+                    continue
+                tokens.append(chunk)
             full = "".join(tokens)
             results[provider] = f"ok ({len(tokens)} chunks, {len(full)} chars)"
         except Exception as e:
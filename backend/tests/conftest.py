@@ -2,6 +2,11 @@
 
 import pytest
 
+from app.adapters.circuit import breakers
+from app.services.tasks import DebateTaskRegistry
+from app.ws.debate import register_debate_events
+from tests.fake_sio import FakeSio
+
 
 @pytest.fixture
 def sample_api_keys():
@@ -12,3 +17,28 @@ def sample_api_keys():
         "google": "AIza-test-fake-key",
         "xai": "xai-test-fake-key",
     }
+
+
+@pytest.fixture
+def debate_server(monkeypatch):
+    """Socket handlers on a ``FakeSio`` with their own debate task registry.
+
+    The conspectus is stubbed out; ``sio.conspectus_calls`` lists the
+    sessions it was generated for.
+    """
+    breakers.clear()
+    registry = DebateTaskRegistry()
+    monkeypatch.setattr("app.ws.debate.debate_tasks", registry)
+    monkeypatch.setattr("app.api.debate.debate_tasks", registry)
+    conspectus_calls = []
+
+    async def conspectus(session, transcript):
+        conspectus_calls.append(session.session_id)
+        return "summary"
+
+    monkeypatch.setattr("app.ws.debate.generate_conspectus", conspectus)
+    sio = FakeSio()
+    sio.conspectus_calls = conspectus_calls
+    register_debate_events(sio)
+    yield sio, registry
+    breakers.clear()
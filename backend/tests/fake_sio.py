@@ -0,0 +1,40 @@
+"""In-process stand-in for a Socket.IO server.
+
+``register_debate_events`` only needs the decorators, rooms and
+``emit``/``disconnect`` of ``socketio.AsyncServer``. ``FakeSio`` provides
+those and records every emit as ``(event, data, room_or_sid)``, so the
+socket handlers can be driven directly from tests.
+"""
+
+
+class FakeSio:
+    """Collects handlers and emitted events in place of a Socket.IO server."""
+
+    def __init__(self):
+        self.handlers = {}
+        self.emitted = []
+        self.rooms = {}
+        self.disconnected = []
+
+    def event(self, handler):
+        self.handlers[handler.__name__] = handler
+        return handler
+
+    def on(self, name):
+        def register(handler):
+            self.handlers[name] = handler
+            return handler
+        return register
+
+    def enter_room(self, sid, room):
+        self.rooms.setdefault(room, set()).add(sid)
+
+    async def emit(self, event, data, room=None, to=None):
+        self.emitted.append((event, data, room or to))
+
+    async def disconnect(self, sid):
+        self.disconnected.append(sid)
+
+    def sent_to(self, target):
+        """Events emitted to one sid or room, in order."""
+        return [(event, data) for event, data, to in self.emitted if to == target]
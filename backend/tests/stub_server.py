@@ -0,0 +1,492 @@
+"""Local HTTP stub that speaks the providers' streaming wire protocols.
+
+Adapters pointed at a ``StubServer`` through their ``base_url`` run their
+real SDK code paths (HTTP connection handling and stream parsing) without
+any network access, which makes it the backbone of end-to-end throughput
+benchmarks. Three wire formats are served:
+
+* OpenAI chat completions, with ``data:`` SSE chunks and ``[DONE]``. Every
+  OpenAI-compatible adapter uses this one.
+* Anthropic messages, as named SSE events from ``message_start`` to
+  ``message_stop``.
+* Gemini ``generateContent`` and ``streamGenerateContent?alt=sse``, plus
+  the ``cachedContents`` calls made for long prompts.
+
+Responses follow a ``StubBehavior``. The behavior sets latency,
+throughput, the error status and a mid-stream disconnect. Queue
+behaviors with ``enqueue``; requests use them in FIFO order and then fall
+back to the default behavior::
+
+    async with StubServer(StubBehavior(ttft=0.05, tps=500)) as stub:
+        stub.enqueue(StubBehavior(status=429, retry_after=0))
+        adapter = OpenAIAdapter(base_url=stub.base_url("openai"))
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from urllib.parse import parse_qs, urlsplit
+
+_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    401: "Unauthorized",
+    403: "Forbidden",
+    404: "Not Found",
+    413: "Payload Too Large",
+    429: "Too Many Requests",
+    500: "Internal Server Error",
+    503: "Service Unavailable",
+    529: "Overloaded",
+}
+
+# Error bodies as each provider shapes them
+_ANTHROPIC_ERROR_TYPES = {
+    401: "authentication_error",
+    403: "permission_error",
+    413: "request_too_large",
+    429: "rate_limit_error",
+    529: "overloaded_error",
+}
+_GOOGLE_ERROR_STATUSES = {
+    400: "INVALID_ARGUMENT",
+    401: "UNAUTHENTICATED",
+    403: "PERMISSION_DENIED",
+    429: "RESOURCE_EXHAUSTED",
+    503: "UNAVAILABLE",
+}
+
+
+@dataclass
+class StubBehavior:
+    """How the stub answers one request."""
+
+    ttft: float = 0.0  # Seconds before the first chunk (or the whole response)
+    tps: float = 0.0  # Chunks per second after the first; 0 means unthrottled
+    tokens: int = 16  # Number of text chunks in the response
+    text: str = "lorem "  # Text of each chunk
+    status: int = 200  # Non-200 answers with the provider's error body
+    retry_after: float | None = None  # Sent as Retry-After with errors
+    disconnect_after: int | None = None  # Drop the connection after N chunks
+
+
+@dataclass
+class StubRequest:
+    """A request received by the stub, recorded for assertions."""
+
+    provider: str
+    method: str
+    path: str
+    headers: dict[str, str]
+    body: dict = field(default_factory=dict)
+
+
+class StubServer:
+    """An asyncio HTTP/1.1 server that impersonates the provider APIs.
+
+    Connections are kept alive between requests like the real APIs, so
+    SDK connection pooling is exercised too.
+    """
+
+    def __init__(self, default: StubBehavior | None = None, host: str = "127.0.0.1"):
+        self.default = default or StubBehavior()
+        self.host = host
+        self.port = 0
+        self.requests: list[StubRequest] = []
+        self.connections = 0  # Connections accepted so far
+        self._queue: deque[StubBehavior] = deque()
+        self._server: asyncio.Server | None = None
+        self._handlers: set[asyncio.Task] = set()
+        self._caches = 0
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def base_url(self, provider: str) -> str:
+        """Return the ``base_url`` to hand to an adapter for ``provider``."""
+        if provider in ("anthropic", "google"):
+            return self.url  # Their SDKs add the API version to the path
+        return f"{self.url}/v1"
+
+    def enqueue(self, *behaviors: StubBehavior) -> None:
+        """Script the next requests; later requests use the default again."""
+        self._queue.extend(behaviors)
+
+    async def start(self) -> "StubServer":
+        self._server = await asyncio.start_server(self._serve, self.host, 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def close(self) -> None:
+        if self._server is None:
+            return
+        self._server.close()
+        # Clients keep idle connections open; end their handlers explicitly
+        for task in list(self._handlers):
+            task.cancel()
+        await asyncio.gather(*self._handlers, return_exceptions=True)
+        await self._server.wait_closed()
+        self._server = None
+
+    async def __aenter__(self) -> "StubServer":
+        return await self.start()
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+    # -- HTTP plumbing ------------------------------------------------------
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        task = asyncio.current_task()
+        self._handlers.add(task)
+        try:
+            while True:
+                request = await _read_request(reader)
+                if request is None:
+                    break
+                if not await self._respond(request, writer):
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.CancelledError):
+            pass  # Client went away, or the server is closing
+        finally:
+            self._handlers.discard(task)
+            writer.transport.abort()
+
+    async def _respond(self, request: StubRequest, writer: asyncio.StreamWriter) -> bool:
+        """Answer one request; return False once the connection is dropped."""
+        self.requests.append(request)
+        behavior = self._queue.popleft() if self._queue else self.default
+        handler = self._route(request)
+        if handler is None:
+            await _send_json(writer, 404, {"error": {"message": f"No stub for {request.path}"}})
+            return True
+        if behavior.status != 200:
+            await asyncio.sleep(behavior.ttft)
+            headers = {}
+            if behavior.retry_after is not None:
+                headers["retry-after"] = f"{behavior.retry_after:g}"
+            body = _error_body(request.provider, behavior.status)
+            await _send_json(writer, behavior.status, body, headers)
+            return True
+        return await handler(request, behavior, writer)
+
+    def _route(self, request: StubRequest):
+        path = request.path
+        if request.provider == "google":
+            if path.endswith(":streamGenerateContent"):
+                return self._google_stream
+            if path.endswith(":generateContent"):
+                return self._google_generate
+            if "/cachedContents" in path:
+                return self._google_cache
+            if path.endswith("/models"):
+                return self._google_models
+        elif request.provider == "anthropic":
+            if path.endswith("/messages"):
+                return self._anthropic_messages
+            if path.endswith("/models"):
+                return self._anthropic_models
+        else:
+            if path.endswith("/chat/completions"):
+                return self._openai_completions
+            if path.endswith("/models"):
+                return self._openai_models
+        return None
+
+    async def _stream(
+        self,
+        writer: asyncio.StreamWriter,
+        behavior: StubBehavior,
+        events: list[bytes],
+        tail: list[bytes],
+    ) -> bool:
+        """Send ``events`` (one per text chunk) with pacing, then ``tail``."""
+        writer.write(
+            b"HTTP/1.1 200 OK\r\n"
+            b"content-type: text/event-stream\r\n"
+            b"transfer-encoding: chunked\r\n"
+            b"cache-control: no-cache\r\n\r\n"
+        )
+        await writer.drain()
+        await asyncio.sleep(behavior.ttft)
+        interval = 1.0 / behavior.tps if behavior.tps > 0 else 0.0
+        started = time.monotonic()
+        for i, event in enumerate(events):
+            if behavior.disconnect_after is not None and i >= behavior.disconnect_after:
+                writer.transport.abort()
+                return False
+            if interval and i:
+                # Pace against the start so per-chunk overhead doesn't accumulate
+                await asyncio.sleep(max(0.0, started + i * interval - time.monotonic()))
+            _write_chunk(writer, event)
+            await writer.drain()
+        for event in tail:
+            _write_chunk(writer, event)
+        writer.write(b"0\r\n\r\n")
+        await writer.drain()
+        return True
+
+    # -- OpenAI -------------------------------------------------------------
+
+    async def _openai_completions(self, request, behavior, writer) -> bool:
+        model = request.body.get("model", "")
+        usage = _usage(request, behavior)
+        if not request.body.get("stream"):
+            await asyncio.sleep(_total_time(behavior))
+            await _send_json(writer, 200, {
+                "id": "chatcmpl-stub",
+                "object": "chat.completion",
+                "created": 0,
+                "model": model,
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": behavior.text * behavior.tokens},
+                    "finish_reason": "stop",
+                }],
+                "usage": _openai_usage(usage),
+            })
+            return True
+
+        def chunk(delta: dict, finish_reason=None, usage=None) -> bytes:
+            body = {
+                "id": "chatcmpl-stub",
+                "object": "chat.completion.chunk",
+                "created": 0,
+                "model": model,
+                "choices": (
+                    [] if usage else
+                    [{"index": 0, "delta": delta, "finish_reason": finish_reason}]
+                ),
+            }
+            if usage:
+                body["usage"] = usage
+            return _sse(body)
+
+        events = [
+            chunk({"role": "assistant", "content": behavior.text} if i == 0 else {"content": behavior.text})
+            for i in range(behavior.tokens)
+        ]
+        tail = [chunk({}, "stop")]
+        if (request.body.get("stream_options") or {}).get("include_usage"):
+            tail.append(chunk({}, usage=_openai_usage(usage)))
+        tail.append(b"data: [DONE]\n\n")
+        return await self._stream(writer, behavior, events, tail)
+
+    async def _openai_models(self, request, behavior, writer) -> bool:
+        await asyncio.sleep(behavior.ttft)
+        await _send_json(writer, 200, {
+            "object": "list",
+            "data": [{"id": "gpt-4o", "object": "model", "created": 0, "owned_by": "stub"}],
+        })
+        return True
+
+    # -- Anthropic ----------------------------------------------------------
+
+    async def _anthropic_messages(self, request, behavior, writer) -> bool:
+        model = request.body.get("model", "")
+        prompt_tokens, output_tokens = _usage(request, behavior)
+        message = {
+            "id": "msg_stub",
+            "type": "message",
+            "role": "assistant",
+            "model": model,
+            "content": [],
+            "stop_reason": None,
+            "stop_sequence": None,
+            "usage": {"input_tokens": prompt_tokens, "output_tokens": 1},
+        }
+        if not request.body.get("stream"):
+            await asyncio.sleep(_total_time(behavior))
+            message.update(
+                content=[{"type": "text", "text": behavior.text * behavior.tokens}],
+                stop_reason="end_turn",
+                usage={"input_tokens": prompt_tokens, "output_tokens": output_tokens},
+            )
+            await _send_json(writer, 200, message)
+            return True
+
+        head = [
+            _sse({"type": "message_start", "message": message}, "message_start"),
+            _sse({
+                "type": "content_block_start",
+                "index": 0,
+                "content_block": {"type": "text", "text": ""},
+            }, "content_block_start"),
+        ]
+        deltas = [
+            _sse({
+                "type": "content_block_delta",
+                "index": 0,
+                "delta": {"type": "text_delta", "text": behavior.text},
+            }, "content_block_delta")
+            for _ in range(behavior.tokens)
+        ]
+        # message_start rides along with the first delta
+        events = [b"".join(head) + deltas[0], *deltas[1:]] if deltas else head
+        tail = [
+            _sse({"type": "content_block_stop", "index": 0}, "content_block_stop"),
+            _sse({
+                "type": "message_delta",
+                "delta": {"stop_reason": "end_turn", "stop_sequence": None},
+                "usage": {"output_tokens": output_tokens},
+            }, "message_delta"),
+            _sse({"type": "message_stop"}, "message_stop"),
+        ]
+        return await self._stream(writer, behavior, events, tail)
+
+    async def _anthropic_models(self, request, behavior, writer) -> bool:
+        await asyncio.sleep(behavior.ttft)
+        model = {
+            "type": "model",
+            "id": "claude-sonnet-4-6",
+            "display_name": "Claude Sonnet 4.6",
+            "created_at": "2025-01-01T00:00:00Z",
+        }
+        await _send_json(writer, 200, {
+            "data": [model],
+            "has_more": False,
+            "first_id": model["id"],
+            "last_id": model["id"],
+        })
+        return True
+
+    # -- Gemini -------------------------------------------------------------
+
+    async def _google_stream(self, request, behavior, writer) -> bool:
+        prompt_tokens, output_tokens = _usage(request, behavior)
+        model = request.path.rsplit("/", 1)[-1].split(":", 1)[0]
+
+        def chunk(text: str, final: bool = False) -> bytes:
+            candidate = {"content": {"parts": [{"text": text}], "role": "model"}, "index": 0}
+            body = {"candidates": [candidate], "modelVersion": model}
+            if final:
+                candidate["finishReason"] = "STOP"
+            body["usageMetadata"] = _google_usage(prompt_tokens, output_tokens if final else 0)
+            return _sse(body)
+
+        events = [chunk(behavior.text) for _ in range(behavior.tokens)]
+        return await self._stream(writer, behavior, events, [chunk("", final=True)])
+
+    async def _google_generate(self, request, behavior, writer) -> bool:
+        prompt_tokens, output_tokens = _usage(request, behavior)
+        await asyncio.sleep(_total_time(behavior))
+        await _send_json(writer, 200, {
+            "candidates": [{
+                "content": {"parts": [{"text": behavior.text * behavior.tokens}], "role": "model"},
+                "finishReason": "STOP",
+                "index": 0,
+            }],
+            "usageMetadata": _google_usage(prompt_tokens, output_tokens),
+        })
+        return True
+
+    async def _google_cache(self, request, behavior, writer) -> bool:
+        if request.method == "DELETE":
+            await _send_json(writer, 200, {})
+            return True
+        self._caches += 1
+        await _send_json(writer, 200, {
+            "name": f"cachedContents/stub-{self._caches}",
+            "model": request.body.get("model", ""),
+            "usageMetadata": {"totalTokenCount": _usage(request, behavior)[0]},
+        })
+        return True
+
+    async def _google_models(self, request, behavior, writer) -> bool:
+        await asyncio.sleep(behavior.ttft)
+        await _send_json(writer, 200, {"models": [{"name": "models/gemini-2.0-flash"}]})
+        return True
+
+
+async def _read_request(reader: asyncio.StreamReader) -> StubRequest | None:
+    line = await reader.readline()
+    if not line.strip():
+        return None
+    method, target, _ = line.decode("latin-1").split(" ", 2)
+    headers: dict[str, str] = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    raw = await reader.readexactly(int(headers.get("content-length", 0)))
+    body = json.loads(raw) if raw else {}
+    url = urlsplit(target)
+    if "x-goog-api-key" in headers or "alt" in parse_qs(url.query):
+        provider = "google"
+    elif "anthropic-version" in headers:
+        provider = "anthropic"
+    else:
+        provider = "openai"
+    return StubRequest(provider, method, url.path, headers, body)
+
+
+def _write_chunk(writer: asyncio.StreamWriter, data: bytes) -> None:
+    writer.write(f"{len(data):x}\r\n".encode("ascii") + data + b"\r\n")
+
+
+async def _send_json(
+    writer: asyncio.StreamWriter,
+    status: int,
+    body: dict,
+    headers: dict[str, str] | None = None,
+) -> None:
+    payload = json.dumps(body).encode("utf-8")
+    head = [
+        f"HTTP/1.1 {status} {_REASONS.get(status, 'Error')}",
+        "content-type: application/json",
+        f"content-length: {len(payload)}",
+        *(f"{name}: {value}" for name, value in (headers or {}).items()),
+    ]
+    writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + payload)
+    await writer.drain()
+
+
+def _sse(body: dict, event: str | None = None) -> bytes:
+    prefix = f"event: {event}\n" if event else ""
+    return f"{prefix}data: {json.dumps(body)}\n\n".encode("utf-8")
+
+
+def _error_body(provider: str, status: int) -> dict:
+    message = f"Stub error {status}"
+    if provider == "anthropic":
+        error_type = _ANTHROPIC_ERROR_TYPES.get(status, "api_error")
+        return {"type": "error", "error": {"type": error_type, "message": message}}
+    if provider == "google":
+        return {"error": {
+            "code": status,
+            "message": message,
+            "status": _GOOGLE_ERROR_STATUSES.get(status, "INTERNAL"),
+        }}
+    return {"error": {"message": message, "type": "stub_error", "code": status}}
+
+
+def _usage(request: StubRequest, behavior: StubBehavior) -> tuple[int, int]:
+    """Return (prompt, output) token counts; ~4 characters per token."""
+    return max(1, len(json.dumps(request.body)) // 4), behavior.tokens
+
+
+def _openai_usage(usage: tuple[int, int]) -> dict:
+    prompt, output = usage
+    return {"prompt_tokens": prompt, "completion_tokens": output, "total_tokens": prompt + output}
+
+
+def _google_usage(prompt: int, output: int) -> dict:
+    return {
+        "promptTokenCount": prompt,
+        "candidatesTokenCount": output,
+        "totalTokenCount": prompt + output,
+    }
+
+
+def _total_time(behavior: StubBehavior) -> float:
+    """Time a non-streaming response takes: first chunk plus the rest."""
+    rest = (behavior.tokens - 1) / behavior.tps if behavior.tps > 0 else 0.0
+    return behavior.ttft + max(0.0, rest)
@@ -1,8 +1,12 @@
 """Unit tests for LLM provider adapters (offline — no API keys needed)."""
 
+import asyncio
+from contextlib import nullcontext
+from types import SimpleNamespace
+
 import pytest
 
-from app.adapters.base import GenerationConfig, Message, MessageRole
+from app.adapters.base import GenerationConfig, Message, MessageRole, StreamUsage
 from app.adapters.factory import PROVIDER_MODELS, get_adapter
 from app.adapters.anthropic_adapter import AnthropicAdapter, ANTHROPIC_MODELS
 from app.adapters.openai_adapter import OpenAIAdapter, OPENAI_MODELS
@@ -19,6 +23,19 @@ ALL_PROVIDERS = {
 }
 
 
+class _RecordingModels:
+    """Records every call made on a fake SDK ``models`` namespace."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __getattr__(self, name):
+        async def call(*args, **kwargs):
+            self.calls.append((name, kwargs))
+            return []
+        return call
+
+
 class TestAdapterFactory:
     def test_get_anthropic_adapter(self):
         adapter = get_adapter("anthropic")
@@ -93,6 +110,16 @@ class TestAnthropicAdapter:
         assert api_msgs[0]["role"] == "user"
         assert api_msgs[1]["role"] == "assistant"
 
+    @pytest.mark.asyncio
+    async def test_validate_key_lists_models_without_generating(self, monkeypatch):
+        models = _RecordingModels()
+        messages = _RecordingModels()
+        fake_client = SimpleNamespace(models=models, messages=messages)
+        monkeypatch.setattr(AnthropicAdapter, "_client", lambda self, key: nullcontext(fake_client))
+        assert await AnthropicAdapter().validate_key("sk-ant-test")
+        assert models.calls == [("list", {"limit": 1})]
+        assert messages.calls == []
+
     def test_prepare_messages_no_system(self):
         messages = [Message(role=MessageRole.USER, content="Hello")]
         system, api_msgs = AnthropicAdapter._prepare_messages(messages)
@@ -124,6 +151,46 @@ class TestOpenAIAdapter:
         adapter = OpenAIAdapter(base_url="https://custom.api.com/v1")
         assert adapter._base_url == "https://custom.api.com/v1"
 
+    @pytest.mark.asyncio
+    async def test_stream_ends_with_usage_record(self, monkeypatch):
+        def chunk(content=None, finish_reason=None, usage=None):
+            choices = []
+            if content is not None or finish_reason is not None:
+                choices = [SimpleNamespace(
+                    delta=SimpleNamespace(content=content),
+                    finish_reason=finish_reason,
+                )]
+            return SimpleNamespace(choices=choices, usage=usage, model="gpt-4o")
+
+        async def fake_stream():
+            yield chunk("Hello")
+            yield chunk(" world", finish_reason="stop")
+            yield chunk(usage=SimpleNamespace(prompt_tokens=42, completion_tokens=2))
+
+        captured = {}
+
+        async def create(**kwargs):
+            captured.update(kwargs)
+            return fake_stream()
+
+        fake_client = SimpleNamespace(
+            chat=SimpleNamespace(completions=SimpleNamespace(create=create))
+        )
+        monkeypatch.setattr(OpenAIAdapter, "_client", lambda self, key: nullcontext(fake_client))
+
+        chunks = [
+            c async for c in OpenAIAdapter().generate_stream(
+                [Message(role=MessageRole.USER, content="Hi")],
+                GenerationConfig(model="gpt-4o"),
+                "sk-test",
+            )
+        ]
+        assert chunks[:2] == ["Hello", " world"]
+        assert chunks[-1] == StreamUsage(
+            input_tokens=42, output_tokens=2, model="gpt-4o", finish_reason="stop"
+        )
+        assert captured["stream_options"] == {"include_usage": True}
+
 
 class TestXAIAdapter:
     def test_inherits_openai(self):
@@ -173,6 +240,58 @@ class TestGeminiAdapter:
         assert system is None
         assert len(contents) == 1
 
+    @pytest.mark.asyncio
+    async def test_validate_key_lists_models_without_generating(self, monkeypatch):
+        models = _RecordingModels()
+        fake_client = SimpleNamespace(aio=SimpleNamespace(models=models))
+        monkeypatch.setattr(GeminiAdapter, "_client", lambda self, key: nullcontext(fake_client))
+        assert await GeminiAdapter().validate_key("AIza-test")
+        # One page of one model: an authenticated call that bills nothing
+        assert models.calls == [("list", {"config": {"page_size": 1}})]
+
+    @pytest.mark.asyncio
+    async def test_stream_does_not_block_event_loop(self, monkeypatch):
+        chunks = ["The ", "unexamined ", "life ", "is ", "not ", "worth ", "living."]
+
+        async def slow_stream():
+            for text in chunks:
+                await asyncio.sleep(0.01)
+                yield SimpleNamespace(text=text)
+
+        async def generate_content_stream(**kwargs):
+            return slow_stream()
+
+        fake_client = SimpleNamespace(
+            aio=SimpleNamespace(
+                models=SimpleNamespace(generate_content_stream=generate_content_stream)
+            )
+        )
+        monkeypatch.setattr(GeminiAdapter, "_client", lambda self, key: nullcontext(fake_client))
+
+        ticks = 0
+        streaming = True
+
+        async def ticker():
+            nonlocal ticks
+            while streaming:
+                ticks += 1
+                await asyncio.sleep(0.001)
+
+        tick_task = asyncio.create_task(ticker())
+        received = []
+        async for token in GeminiAdapter().generate_stream(
+            [Message(role=MessageRole.USER, content="Hi")],
+            GenerationConfig(model="gemini-2.0-flash"),
+            "AIza-test",
+        ):
+            received.append(token)
+        streaming = False
+        await tick_task
+
+        assert received == chunks
+        # The ticker must have run between chunks, not only after the stream
+        assert ticks >= len(chunks)
+
 
 class TestDeepSeekAdapter:
     def test_inherits_openai(self):
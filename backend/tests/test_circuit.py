@@ -0,0 +1,246 @@
+"""Unit tests for circuit breakers and fallback routing."""
+
+import asyncio
+
+import pytest
+
+from app.adapters.base import (
+    CircuitOpenError,
+    GenerationConfig,
+    GenerationResult,
+    LLMAdapter,
+    ProviderAuthError,
+    ProviderOverloadedError,
+    RetryPolicy,
+    guarded_call,
+)
+from app.adapters.circuit import BreakerRegistry, BreakerSettings, BreakerState, CircuitBreaker
+from app.models.debate import DebateConfig, DebateSession, Participant, Provider
+from app.orchestrator import engine
+from app.orchestrator.engine import DebateOrchestrator
+
+SETTINGS = BreakerSettings(window=4, min_calls=2, failure_ratio=0.5, cooldown=60)
+
+
+class TestCircuitBreaker:
+    def test_trips_on_error_rate(self):
+        breaker = CircuitBreaker(SETTINGS)
+        breaker.record_success(0.1)
+        assert breaker.state == BreakerState.CLOSED
+        breaker.record_failure("503")
+        assert breaker.state == BreakerState.OPEN
+        assert not breaker.allow_request()
+
+    def test_trips_on_slow_calls(self):
+        breaker = CircuitBreaker(BreakerSettings(min_calls=2, slow_call_seconds=1.0))
+        breaker.record_success(5.0)
+        breaker.record_success(5.0)
+        assert breaker.state == BreakerState.OPEN
+        assert "slow" in breaker.last_error
+
+    def test_calls_without_ttft_are_never_slow(self):
+        breaker = CircuitBreaker(BreakerSettings(min_calls=2, slow_call_seconds=1.0))
+        breaker.record_success()
+        breaker.record_success()
+        assert breaker.state == BreakerState.CLOSED
+
+    def test_half_open_admits_one_trial_and_closes_on_success(self):
+        breaker = CircuitBreaker(BreakerSettings(min_calls=1, cooldown=0))
+        breaker.record_failure("overloaded")
+        assert breaker.state == BreakerState.HALF_OPEN
+        assert breaker.allow_request()
+        assert not breaker.allow_request()  # Only one trial at a time
+        breaker.record_success(0.1)
+        assert breaker.state == BreakerState.CLOSED
+
+    def test_failed_trial_reopens(self):
+        breaker = CircuitBreaker(BreakerSettings(min_calls=1, cooldown=0))
+        breaker.record_failure("overloaded")
+        assert breaker.allow_request()
+        breaker.record_failure("still overloaded")
+        assert breaker._state == BreakerState.OPEN
+
+
+class _OverloadedAdapter(LLMAdapter):
+    provider_name = "overloaded"
+    retry_policy = RetryPolicy(max_attempts=1)
+    rate_limited = False
+
+    def __init__(self):
+        self.calls = 0
+
+    @guarded_call
+    async def generate(self, messages, config, api_key):
+        self.calls += 1
+        raise ProviderOverloadedError("529")
+
+    async def generate_stream(self, messages, config, api_key):
+        yield ""
+
+    async def validate_key(self, api_key):
+        return True
+
+    def get_available_models(self):
+        return []
+
+
+class _RejectedAdapter(_OverloadedAdapter):
+    provider_name = "rejected"
+
+    @guarded_call
+    async def generate(self, messages, config, api_key):
+        self.calls += 1
+        raise ProviderAuthError("401")
+
+
+class _SlowAdapter(_OverloadedAdapter):
+    provider_name = "slow"
+
+    @guarded_call
+    async def generate(self, messages, config, api_key):
+        self.calls += 1
+        await asyncio.sleep(0.02)
+        return GenerationResult(content="summary", input_tokens=1, output_tokens=1, model="m")
+
+
+class TestGuardedBreaker:
+    @pytest.mark.asyncio
+    async def test_open_breaker_fails_fast(self, monkeypatch):
+        monkeypatch.setattr("app.adapters.base.breakers", BreakerRegistry(SETTINGS))
+        adapter = _OverloadedAdapter()
+        config = GenerationConfig(model="m")
+        for _ in range(2):
+            with pytest.raises(ProviderOverloadedError):
+                await adapter.generate([], config, "k")
+        with pytest.raises(CircuitOpenError):
+            await adapter.generate([], config, "k")
+        assert adapter.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_rate_limit_wait_releases_the_trial(self, monkeypatch):
+        registry = BreakerRegistry(BreakerSettings(min_calls=1, cooldown=0))
+        monkeypatch.setattr("app.adapters.base.breakers", registry)
+
+        class _Blocked:
+            async def acquire(self, provider, api_key, tokens):
+                await asyncio.sleep(60)
+
+        monkeypatch.setattr("app.adapters.base.rate_limiter", _Blocked())
+        adapter = _OverloadedAdapter()
+        adapter.rate_limited = True
+        breaker = registry.get(adapter.provider_name, "m")
+        breaker.record_failure("overloaded")
+        assert breaker.state == BreakerState.HALF_OPEN
+
+        call = asyncio.create_task(adapter.generate([], GenerationConfig(model="m"), "k"))
+        await asyncio.sleep(0.01)
+        call.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await call
+        assert adapter.calls == 0
+        assert breaker.allow_request()
+
+    @pytest.mark.asyncio
+    async def test_long_generate_calls_do_not_trip_the_breaker(self, monkeypatch):
+        registry = BreakerRegistry(BreakerSettings(min_calls=2, slow_call_seconds=0.01))
+        monkeypatch.setattr("app.adapters.base.breakers", registry)
+        adapter = _SlowAdapter()
+        for _ in range(3):
+            await adapter.generate([], GenerationConfig(model="m"), "k")
+        assert registry.get(adapter.provider_name, "m").state == BreakerState.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_any_failed_trial_reopens_the_breaker(self, monkeypatch):
+        registry = BreakerRegistry(BreakerSettings(min_calls=1, cooldown=60))
+        monkeypatch.setattr("app.adapters.base.breakers", registry)
+        adapter = _RejectedAdapter()
+        breaker = registry.get(adapter.provider_name, "m")
+        breaker.record_failure("overloaded")
+        breaker._opened_at -= 60  # Cooled down
+        assert breaker.state == BreakerState.HALF_OPEN
+        # An auth error doesn't count against a closed breaker, but a
+        # failed trial still reopens it
+        with pytest.raises(ProviderAuthError):
+            await adapter.generate([], GenerationConfig(model="m"), "k")
+        assert breaker.state == BreakerState.OPEN
+
+
+def _session(**participant_kwargs) -> DebateSession:
+    return DebateSession(
+        config=DebateConfig(
+            topic="T",
+            participants=[
+                Participant(
+                    provider=Provider.ANTHROPIC,
+                    model="claude-opus-4-6",
+                    display_name="Claude",
+                    **participant_kwargs,
+                ),
+                Participant(provider=Provider.OPENAI, model="gpt-4o", display_name="GPT"),
+            ],
+        ),
+        api_keys={"anthropic": "a-key", "openai": "o-key"},
+    )
+
+
+class TestFallbackRouting:
+    @pytest.fixture
+    def registry(self, monkeypatch):
+        registry = BreakerRegistry(SETTINGS)
+        monkeypatch.setattr("app.orchestrator.engine.breakers", registry)
+        return registry
+
+    def _trip(self, registry, provider, model):
+        breaker = registry.get(provider, model)
+        breaker.record_failure("overloaded")
+        breaker.record_failure("overloaded")
+
+    def test_healthy_model_is_used(self, registry):
+        orchestrator = DebateOrchestrator(_session())
+        participant = orchestrator.session.config.participants[0]
+        assert orchestrator._route(participant) == ("anthropic", "claude-opus-4-6")
+
+    def test_open_breaker_routes_to_next_same_provider_model(self, registry):
+        self._trip(registry, "anthropic", "claude-opus-4-6")
+        orchestrator = DebateOrchestrator(_session())
+        participant = orchestrator.session.config.participants[0]
+        assert orchestrator._route(participant) == ("anthropic", "claude-sonnet-4-6")
+
+    def test_configured_cross_provider_fallback(self, registry):
+        self._trip(registry, "anthropic", "claude-opus-4-6")
+        orchestrator = DebateOrchestrator(
+            _session(fallback_provider=Provider.OPENAI, fallback_model="gpt-4o-mini")
+        )
+        participant = orchestrator.session.config.participants[0]
+        assert orchestrator._route(participant) == ("openai", "gpt-4o-mini")
+
+    @pytest.mark.asyncio
+    async def test_degraded_event_emitted_once(self, registry):
+        self._trip(registry, "anthropic", "claude-opus-4-6")
+        orchestrator = DebateOrchestrator(_session())
+        participant = orchestrator.session.config.participants[0]
+        provider, model = orchestrator._route(participant)
+        event = orchestrator._routing_event(participant, provider, model)
+        assert event.event_type == "debate:participant_degraded"
+        assert event.data["fallback_model"] == "claude-sonnet-4-6"
+        assert orchestrator._routing_event(participant, provider, model) is None
+        assert ("anthropic", "claude-opus-4-6") in orchestrator._probes
+        for task in orchestrator._probes.values():
+            task.cancel()
+
+    @pytest.mark.asyncio
+    async def test_probes_stop_after_max_probes(self, monkeypatch):
+        registry = BreakerRegistry(BreakerSettings(min_calls=1, cooldown=0))
+        monkeypatch.setattr("app.adapters.base.breakers", registry)
+        monkeypatch.setattr(engine, "breakers", registry)
+        monkeypatch.setattr(engine, "PROBE_INTERVAL", 0.0)
+        monkeypatch.setattr(engine, "MAX_PROBES", 3)
+        adapter = _RejectedAdapter()
+        adapter.provider_name = "anthropic"
+        monkeypatch.setattr(engine, "get_adapter", lambda provider: adapter)
+        registry.get("anthropic", "claude-opus-4-6").record_failure("overloaded")
+
+        orchestrator = DebateOrchestrator(_session())
+        await asyncio.wait_for(orchestrator._probe("anthropic", "claude-opus-4-6"), 1)
+        assert adapter.calls == 3
+        assert registry.get("anthropic", "claude-opus-4-6").state != BreakerState.CLOSED
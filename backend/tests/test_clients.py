@@ -0,0 +1,136 @@
+"""Unit tests for the pooled SDK client cache."""
+
+import asyncio
+
+import pytest
+
+from app.adapters.clients import ClientPool, hash_api_key
+from app.adapters.factory import get_adapter
+from app.models.debate import DebateConfig, DebateSession, Participant, Provider
+from app.services.session import SessionManager
+
+
+class _FakeClient:
+    """Stand-in SDK client that records whether it was closed."""
+
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class _AsyncClient(_FakeClient):
+    async def close(self):
+        await asyncio.sleep(0)
+        self.closed = True
+
+
+def _get(pool, provider, base_url, api_key, factory=_FakeClient):
+    """Lease a client for a call that has already finished."""
+    with pool.lease(provider, base_url, api_key, factory) as client:
+        return client
+
+
+class TestClientPool:
+    def test_same_key_reuses_client(self):
+        pool = ClientPool()
+        first = _get(pool, "openai", None, "sk-1")
+        second = _get(pool, "openai", None, "sk-1")
+        assert first is second
+        assert len(pool) == 1
+
+    def test_distinct_keys_and_base_urls_get_distinct_clients(self):
+        pool = ClientPool()
+        a = _get(pool, "openai", None, "sk-1")
+        b = _get(pool, "openai", None, "sk-2")
+        c = _get(pool, "openai", "https://api.x.ai/v1", "sk-1")
+        assert len({id(a), id(b), id(c)}) == 3
+
+    def test_size_cap_evicts_least_recently_used(self):
+        pool = ClientPool(max_size=2)
+        a = _get(pool, "openai", None, "sk-a")
+        b = _get(pool, "openai", None, "sk-b")
+        _get(pool, "openai", None, "sk-a")  # refresh a
+        _get(pool, "openai", None, "sk-c")
+        assert len(pool) == 2
+        assert b.closed
+        assert not a.closed
+
+    def test_idle_clients_are_evicted(self):
+        pool = ClientPool(idle_timeout=-1)
+        a = _get(pool, "openai", None, "sk-a")
+        b = _get(pool, "openai", None, "sk-a")
+        assert a is not b
+        assert a.closed
+
+    def test_purge_key_closes_every_client_for_key(self):
+        pool = ClientPool()
+        a = _get(pool, "openai", None, "sk-a")
+        x = _get(pool, "xai", "https://api.x.ai/v1", "sk-a")
+        other = _get(pool, "openai", None, "sk-b")
+        assert pool.purge_key("sk-a") == 2
+        assert a.closed and x.closed
+        assert not other.closed
+        assert len(pool) == 1
+
+    def test_leased_clients_are_not_evicted(self):
+        pool = ClientPool(max_size=1, idle_timeout=-1)
+        with pool.lease("openai", None, "sk-a", _FakeClient) as a:
+            # Idle eviction and the size cap both pass over a client in use
+            assert _get(pool, "openai", None, "sk-a") is a
+            b = _get(pool, "openai", None, "sk-b")
+            assert not a.closed
+            assert len(pool) == 2
+        assert not a.closed
+        _get(pool, "openai", None, "sk-c")
+        assert a.closed and b.closed
+
+    def test_purged_client_closes_when_released(self):
+        pool = ClientPool()
+        with pool.lease("openai", None, "sk-a", _FakeClient) as a:
+            assert pool.purge_key("sk-a") == 1
+            assert not a.closed
+            assert len(pool) == 0
+        assert a.closed
+
+    @pytest.mark.asyncio
+    async def test_async_closes_are_tracked_until_done(self):
+        pool = ClientPool(max_size=1)
+        a = _get(pool, "openai", None, "sk-a", _AsyncClient)
+        _get(pool, "openai", None, "sk-b", _AsyncClient)
+        assert len(pool._closing) == 1
+        await pool.aclose()
+        assert a.closed
+        assert not pool._closing
+
+    def test_hash_is_not_the_raw_key(self):
+        assert hash_api_key("sk-secret") != "sk-secret"
+        assert hash_api_key("sk-secret") == hash_api_key("sk-secret")
+
+
+class TestAdapterReuse:
+    def test_get_adapter_returns_shared_instance(self):
+        assert get_adapter("openai") is get_adapter("openai")
+
+
+class TestSessionPurge:
+    def test_end_session_purges_pooled_clients(self, monkeypatch):
+        pool = ClientPool()
+        monkeypatch.setattr("app.services.session.client_pool", pool)
+        client = _get(pool, "anthropic", None, "secret-key")
+
+        mgr = SessionManager()
+        session = DebateSession(
+            config=DebateConfig(
+                topic="T",
+                participants=[
+                    Participant(provider=Provider.ANTHROPIC, model="m", display_name="A"),
+                    Participant(provider=Provider.OPENAI, model="m", display_name="B"),
+                ],
+            ),
+            api_keys={"anthropic": "secret-key"},
+        )
+        mgr.end_session(mgr.create_session(session))
+        assert client.closed
+        assert len(pool) == 0
@@ -0,0 +1,133 @@
+"""Unit tests for coalescing streamed token text."""
+
+import asyncio
+
+import pytest
+
+from app.adapters.base import GenerationConfig, Message, MessageRole, StreamUsage
+from app.adapters.circuit import breakers
+from app.adapters.fake_adapter import FakeAdapter
+from app.models.debate import DebateConfig, DebateSession, Participant, Provider
+from app.orchestrator.coalesce import CoalescePolicy, coalesce_chunks, coalesce_events
+from app.orchestrator.engine import DebateEvent, DebateOrchestrator
+
+
+async def _source(*items, gap=0.0):
+    for item in items:
+        if gap:
+            await asyncio.sleep(gap)
+        yield item
+
+
+def _token(speaker, text):
+    return DebateEvent("debate:token_stream", {"speaker": speaker, "token": text})
+
+
+async def _collect(stream):
+    return [item async for item in stream]
+
+
+class TestCoalescePolicy:
+    def test_from_options(self):
+        assert CoalescePolicy.from_options(None, None) == CoalescePolicy()
+        assert CoalescePolicy.from_options(0, 10) == CoalescePolicy(window=0.0, max_bytes=10)
+        assert CoalescePolicy.from_options(-5, 0).window == 0.0
+
+
+class TestCoalesceChunks:
+    @pytest.mark.asyncio
+    async def test_fast_chunks_become_one_frame(self):
+        usage = StreamUsage(output_tokens=3)
+        frames = await _collect(coalesce_chunks(_source("a", "b", "c", usage), CoalescePolicy()))
+        assert frames == ["abc", usage]
+
+    @pytest.mark.asyncio
+    async def test_window_flushes_a_slow_stream(self):
+        policy = CoalescePolicy(window=0.02)
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        arrivals = []
+        async for frame in coalesce_chunks(_source("a", "b", gap=0.1), policy):
+            arrivals.append((frame, loop.time() - started))
+        assert [frame for frame, _ in arrivals] == ["a", "b"]
+        # "a" went out when its window closed, not when "b" arrived
+        assert arrivals[0][1] < 0.2
+        assert arrivals[1][1] - arrivals[0][1] > 0.05
+
+    @pytest.mark.asyncio
+    async def test_byte_threshold(self):
+        policy = CoalescePolicy(window=10, max_bytes=5)
+        frames = await _collect(coalesce_chunks(_source(*["ab"] * 7), policy))
+        assert frames == ["ababab", "ababab", "ab"]
+
+    @pytest.mark.asyncio
+    async def test_zero_window_passes_chunks_through(self):
+        frames = await _collect(coalesce_chunks(_source("a", "b"), CoalescePolicy(window=0)))
+        assert frames == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_buffered_text_precedes_an_error(self):
+        async def failing():
+            yield "a"
+            await asyncio.sleep(0.01)
+            raise RuntimeError("stream broke")
+
+        frames = []
+        with pytest.raises(RuntimeError):
+            async for frame in coalesce_chunks(failing(), CoalescePolicy(window=1)):
+                frames.append(frame)
+        assert frames == ["a"]
+
+    @pytest.mark.asyncio
+    async def test_fewer_frames_for_a_provider_stream(self):
+        breakers.clear()
+        stream = FakeAdapter().generate_stream(
+            [Message(role=MessageRole.USER, content="Is virtue teachable?")],
+            GenerationConfig(model="fake-model", max_tokens=200),
+            "fake:ttft=0;tps=2000;jitter=0;tokens=200",
+        )
+        frames = await _collect(coalesce_chunks(stream, CoalescePolicy()))
+        text = [f for f in frames if isinstance(f, str)]
+        # About 0.1s of streaming: a few frames instead of one per token
+        assert len(text) * 10 <= frames[-1].output_tokens
+
+
+class TestCoalesceEvents:
+    @pytest.mark.asyncio
+    async def test_per_speaker_and_flushed_at_turn_boundaries(self):
+        turn_end = DebateEvent("debate:turn_end", {"speaker": "A"})
+        events = await _collect(coalesce_events(_source(
+            _token("A", "x"), _token("B", "1"), _token("A", "y"), turn_end,
+            _token("B", "2"),
+        ), CoalescePolicy(window=10)))
+        assert [(e.event_type, e.data.get("token")) for e in events] == [
+            ("debate:token_stream", "xy"),
+            ("debate:token_stream", "1"),
+            ("debate:turn_end", None),
+            ("debate:token_stream", "2"),
+        ]
+        assert [e.data["speaker"] for e in events] == ["A", "B", "A", "B"]
+
+    @pytest.mark.asyncio
+    async def test_debate_sends_an_order_of_magnitude_fewer_token_events(self):
+        breakers.clear()
+        config = DebateConfig(
+            topic="Is virtue teachable?",
+            max_rounds=1,
+            max_tokens_per_turn=200,
+            participants=[
+                Participant(provider=Provider.FAKE, model="fake-model", display_name=f"P{i}")
+                for i in range(2)
+            ],
+        )
+        session = DebateSession(
+            config=config, api_keys={"fake": "fake:ttft=0;tps=2000;jitter=0;tokens=200"}
+        )
+        orchestrator = DebateOrchestrator(session)
+        events = await _collect(coalesce_events(orchestrator.run(), CoalescePolicy()))
+        frames = [e for e in events if e.event_type == "debate:token_stream"]
+        chunks = sum(m.token_count for m in session.transcript)
+        assert len(frames) * 10 <= chunks
+        for message in session.transcript:
+            text = "".join(e.data["token"] for e in frames if e.data["speaker"] == message.speaker)
+            assert text == message.content
@@ -0,0 +1,155 @@
+"""Unit tests for the bounded per-session event emitter."""
+
+import asyncio
+
+import pytest
+
+from app.orchestrator.engine import DebateEvent
+from app.ws.emitter import EmitterRegistry, OverflowPolicy, SessionEmitter
+
+
+class _Client:
+    """Records sent events; blocked until released, like a congested socket."""
+
+    def __init__(self):
+        self.sent = []
+        self.open = asyncio.Event()
+        self.open.set()
+        self.disconnected = False
+
+    async def send(self, event_type, data):
+        await self.open.wait()
+        self.sent.append((event_type, data))
+
+    async def disconnect(self):
+        self.disconnected = True
+
+
+def _token(speaker, text):
+    return DebateEvent("debate:token_stream", {"speaker": speaker, "token": text})
+
+
+def _turn_end(speaker):
+    return DebateEvent("debate:turn_end", {"speaker": speaker})
+
+
+def _stalled(overflow, max_events=2):
+    client = _Client()
+    client.open.clear()
+    emitter = SessionEmitter(
+        "s1", client.send, max_events=max_events, overflow=overflow,
+        on_overflow=client.disconnect,
+    )
+    return client, emitter
+
+
+async def _in_flight(emitter, event):
+    """Queue ``event`` and let the emitter start sending it."""
+    emitter.put(event)
+    await asyncio.sleep(0)
+    assert emitter.depth == 0
+
+
+class TestSessionEmitter:
+    @pytest.mark.asyncio
+    async def test_sends_in_order_from_its_own_task(self):
+        client = _Client()
+        emitter = SessionEmitter("s1", client.send)
+        emitter.put(_token("A", "x"))
+        emitter.put(_turn_end("A"))
+        assert client.sent == []  # put() never waits on the client
+        await emitter.close()
+        assert [e for e, _ in client.sent] == ["debate:token_stream", "debate:turn_end"]
+        assert emitter.emitted == 2 and emitter.depth == 0
+
+    @pytest.mark.asyncio
+    async def test_put_does_not_wait_for_a_stalled_client(self):
+        client, emitter = _stalled(OverflowPolicy.COALESCE, max_events=1000)
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        for i in range(500):
+            emitter.put(_token("A", "x"))
+        assert loop.time() - started < 0.1
+        await asyncio.sleep(0.02)
+        assert emitter.depth >= 499 and emitter.lag > 0
+        client.open.set()
+        await emitter.close()
+        assert len(client.sent) == 500
+
+    @pytest.mark.asyncio
+    async def test_coalesce_overflow_merges_text_but_keeps_boundaries(self):
+        client, emitter = _stalled(OverflowPolicy.COALESCE)
+        await _in_flight(emitter, _token("A", "a"))
+        for event in [
+            _token("A", "b"), _token("B", "1"), _token("A", "c"),
+            _turn_end("A"), _token("B", "2"), _token("B", "3"),
+        ]:
+            emitter.put(event)
+        client.open.set()
+        await emitter.close()
+        assert [(e, d["speaker"], d.get("token")) for e, d in client.sent] == [
+            ("debate:token_stream", "A", "a"),
+            ("debate:token_stream", "A", "bc"),
+            ("debate:token_stream", "B", "1"),
+            ("debate:turn_end", "A", None),
+            ("debate:token_stream", "B", "23"),
+        ]
+        assert emitter.coalesced == 2
+
+    @pytest.mark.asyncio
+    async def test_drop_overflow_reports_dropped_tokens_at_turn_end(self):
+        client, emitter = _stalled(OverflowPolicy.DROP_TOKENS)
+        await _in_flight(emitter, _token("A", "a"))
+        for text in "bcde":
+            emitter.put(_token("A", text))
+        emitter.put(_turn_end("A"))
+        client.open.set()
+        await emitter.close()
+        assert [d.get("token") for _, d in client.sent] == ["a", "b", "c", None]
+        assert client.sent[-1][1]["dropped_tokens"] == 2
+        assert emitter.dropped == 2
+
+    @pytest.mark.asyncio
+    async def test_disconnect_overflow(self):
+        client, emitter = _stalled(OverflowPolicy.DISCONNECT)
+        await _in_flight(emitter, _token("A", "a"))
+        for text in "bcd":
+            emitter.put(_token("A", text))
+        assert emitter.overflowed and emitter.depth == 0
+        emitter.put(_turn_end("A"))  # Still sent to anyone else watching
+        client.open.set()
+        await emitter.close()
+        assert client.disconnected and emitter.disconnects == 1
+        assert [d.get("token") for _, d in client.sent] == ["a", None]
+        assert client.sent[-1][1]["dropped_tokens"] == 3
+
+    @pytest.mark.asyncio
+    async def test_failed_send_does_not_stop_the_emitter(self):
+        sent = []
+
+        async def flaky(event_type, data):
+            if data.get("token") == "bad":
+                raise ConnectionError("socket closed")
+            sent.append(data["token"])
+
+        emitter = SessionEmitter("s1", flaky)
+        for text in ["a", "bad", "c"]:
+            emitter.put(_token("A", text))
+        await emitter.close()
+        assert sent == ["a", "c"]
+
+
+class TestEmitterRegistry:
+    @pytest.mark.asyncio
+    async def test_snapshot(self):
+        registry = EmitterRegistry()
+        client, emitter = _stalled(OverflowPolicy.DROP_TOKENS)
+        registry.add(emitter)
+        emitter.put(_token("A", "a"))
+        [snapshot] = registry.snapshot()
+        assert snapshot["session_id"] == "s1" and snapshot["overflow"] == "drop_tokens"
+        assert snapshot["depth"] + emitter.emitted == 1
+        client.open.set()
+        await emitter.close()
+        registry.remove("s1")
+        assert registry.snapshot() == []
@@ -0,0 +1,234 @@
+"""Unit tests for stopping, pausing and timing out a running debate."""
+
+import asyncio
+
+import pytest
+
+from app.adapters.circuit import breakers
+from app.adapters.fake_adapter import FakeAdapter
+from app.models.debate import DebateConfig, DebateSession, DebateStatus, Participant, Provider
+from app.orchestrator import engine
+from app.orchestrator.engine import DebateOrchestrator
+
+# 100 tokens/s for up to 400 tokens: each turn streams for seconds
+KEY = "fake:ttft=0.01;tps=100;jitter=0;tokens=400"
+
+
+class _SpyAdapter:
+    """Counts the chunks pulled from each provider stream, and the tasks pulling them."""
+
+    def __init__(self):
+        self._adapter = FakeAdapter()
+        self.pulled = 0
+        self.open_streams = 0
+        self.readers: set[asyncio.Task] = set()
+
+    async def generate_stream(self, messages, config, api_key):
+        self.open_streams += 1
+        try:
+            async for chunk in self._adapter.generate_stream(messages, config, api_key):
+                self.pulled += 1
+                self.readers.add(asyncio.current_task())
+                yield chunk
+        finally:
+            self.open_streams -= 1
+
+    async def generate(self, messages, config, api_key):
+        return await self._adapter.generate(messages, config, api_key)
+
+
+@pytest.fixture
+def spy(monkeypatch):
+    breakers.clear()
+    adapter = _SpyAdapter()
+    monkeypatch.setattr(engine, "get_adapter", lambda provider: adapter)
+    yield adapter
+    breakers.clear()
+
+
+def _orchestrator():
+    config = DebateConfig(
+        topic="Is virtue teachable?",
+        max_rounds=1,
+        max_tokens_per_turn=400,
+        participants=[
+            Participant(provider=Provider.FAKE, model="fake-model", display_name=f"P{i}")
+            for i in range(2)
+        ],
+    )
+    return DebateOrchestrator(DebateSession(config=config, api_keys={"fake": KEY}))
+
+
+async def _consume(orchestrator, events):
+    async for event in orchestrator.run():
+        events.append(event)
+
+
+def _tokens(events):
+    return sum(e.event_type == "debate:token_stream" for e in events)
+
+
+class TestStop:
+    @pytest.mark.asyncio
+    async def test_stop_aborts_the_stream_mid_turn(self, spy):
+        orchestrator = _orchestrator()
+        events = []
+        task = asyncio.create_task(_consume(orchestrator, events))
+        await asyncio.sleep(0.1)
+        pulled = spy.pulled
+        assert spy.open_streams == 1 and pulled > 1
+        # One task reads the whole stream, rather than one per chunk
+        assert len(spy.readers) == 1
+
+        loop = asyncio.get_running_loop()
+        stopped_at = loop.time()
+        orchestrator.stop()
+        await asyncio.wait_for(task, 1)
+        assert loop.time() - stopped_at < 0.05
+        # At most the chunk already in flight, then the stream is closed
+        assert spy.pulled <= pulled + 1
+        assert spy.open_streams == 0
+
+        types = [e.event_type for e in events]
+        assert types[-2:] == ["debate:turn_cancelled", "debate:concluded"]
+        assert events[-2].data["reason"] == "stopped"
+        assert events[-2].data["discarded_chunks"] == _tokens(events)
+        assert orchestrator.session.transcript == []
+        # Billed as estimates: the prompt sent and the text streamed
+        streamed = "".join(
+            e.data["token"] for e in events if e.event_type == "debate:token_stream"
+        )
+        session = orchestrator.session
+        assert session.token_usage["P0"] == (len(streamed) + 3) // 4
+        assert session.input_token_usage["P0"] > 0
+
+    @pytest.mark.asyncio
+    async def test_stop_before_run(self, spy):
+        orchestrator = _orchestrator()
+        orchestrator.stop()
+        events = []
+        await _consume(orchestrator, events)
+        assert spy.pulled == 0
+        assert events[-1].event_type == "debate:concluded"
+
+
+class TestPause:
+    @pytest.mark.asyncio
+    async def test_pause_holds_the_stream(self, spy):
+        orchestrator = _orchestrator()
+        events = []
+        task = asyncio.create_task(_consume(orchestrator, events))
+        await asyncio.sleep(0.1)
+        orchestrator.pause()
+        assert orchestrator.session.status == DebateStatus.PAUSED
+        await asyncio.sleep(0.01)
+        pulled, tokens = spy.pulled, _tokens(events)
+        await asyncio.sleep(0.2)
+        # Nothing consumed while paused; the stream stays open
+        assert (spy.pulled, _tokens(events)) == (pulled, tokens)
+        assert spy.open_streams == 1
+
+        orchestrator.resume()
+        assert orchestrator.session.status == DebateStatus.RUNNING
+        await asyncio.sleep(0.1)
+        assert _tokens(events) > tokens
+        orchestrator.stop()
+        await asyncio.wait_for(task, 1)
+
+    @pytest.mark.asyncio
+    async def test_restarting_pause_cancels_the_turn(self, spy):
+        orchestrator = _orchestrator()
+        events = []
+        task = asyncio.create_task(_consume(orchestrator, events))
+        await asyncio.sleep(0.1)
+        orchestrator.pause(restart_turn=True)
+        await asyncio.sleep(0.02)
+        assert spy.open_streams == 0
+        assert events[-1].event_type == "debate:turn_cancelled"
+        assert events[-1].data["reason"] == "paused"
+
+        orchestrator.resume()
+        await asyncio.sleep(0.05)
+        # The same speaker starts over with a new stream
+        starts = [e.data["speaker"] for e in events if e.event_type == "debate:turn_start"]
+        assert starts == ["P0", "P0"]
+        assert spy.open_streams == 1
+        orchestrator.stop()
+        await asyncio.wait_for(task, 1)
+
+
+def _timed_orchestrator(key=KEY, **config):
+    config.setdefault("max_rounds", 1)
+    debate = DebateConfig(
+        topic="Is virtue teachable?",
+        max_tokens_per_turn=400,
+        participants=[
+            Participant(provider=Provider.FAKE, model="fake-model", display_name=f"P{i}")
+            for i in range(2)
+        ],
+        **config,
+    )
+    return DebateOrchestrator(DebateSession(config=debate, api_keys={"fake": key}))
+
+
+def _of(events, event_type):
+    return [e.data for e in events if e.event_type == event_type]
+
+
+class TestDeadlines:
+    @pytest.mark.asyncio
+    async def test_turn_deadline_keeps_partial_output(self, spy):
+        orchestrator = _timed_orchestrator(turn_timeout_seconds=0.1)
+        events = []
+        await _consume(orchestrator, events)
+        assert [d["scope"] for d in _of(events, "debate:deadline")] == ["turn", "turn"]
+        assert all(t["truncated"] and t["finish_reason"] == "timeout"
+                   for t in _of(events, "debate:turn_end"))
+        transcript = orchestrator.session.transcript
+        assert [m.truncated for m in transcript] == [True, True]
+        assert all(0 < m.token_count < 20 for m in transcript)
+        assert spy.open_streams == 0
+        # The debate moved on to the round's consensus check
+        assert len(_of(events, "debate:consensus_check")) == 1
+
+    @pytest.mark.asyncio
+    async def test_round_deadline_skips_remaining_speakers(self, spy):
+        orchestrator = _timed_orchestrator(round_timeout_seconds=0.1)
+        events = []
+        await _consume(orchestrator, events)
+        assert _of(events, "debate:deadline") == [{"scope": "round", "round": 1, "speaker": "P0"}]
+        assert [m.speaker for m in orchestrator.session.transcript] == ["P0"]
+        assert len(_of(events, "debate:consensus_check")) == 1
+
+    @pytest.mark.asyncio
+    async def test_first_token_and_debate_deadlines(self, spy):
+        orchestrator = _timed_orchestrator(
+            "fake:ttft=5;jitter=0",
+            max_rounds=3,
+            first_token_timeout_seconds=0.05,
+            debate_timeout_seconds=0.2,
+        )
+        events = []
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        await _consume(orchestrator, events)
+        assert loop.time() - started < 0.5
+        scopes = [d["scope"] for d in _of(events, "debate:deadline")]
+        assert scopes == ["first_token", "first_token", "debate"]
+        # Nothing was said, so nothing was recorded, but every started
+        # turn was closed
+        assert orchestrator.session.transcript == []
+        started = [d["speaker"] for d in _of(events, "debate:turn_start")]
+        cancelled = _of(events, "debate:turn_cancelled")
+        assert [d["speaker"] for d in cancelled] == started
+        assert {d["reason"] for d in cancelled} == {"timeout"}
+        assert events[-1].event_type == "debate:concluded"
+
+    @pytest.mark.asyncio
+    async def test_paused_time_does_not_count(self):
+        orchestrator = _timed_orchestrator()
+        started = orchestrator._clock()
+        orchestrator.pause()
+        await asyncio.sleep(0.1)
+        orchestrator.resume()
+        assert orchestrator._clock() - started < 0.05
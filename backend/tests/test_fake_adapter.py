@@ -0,0 +1,155 @@
+"""Unit tests for the in-process fake provider."""
+
+import asyncio
+
+import pytest
+
+from app.adapters import fake_adapter
+from app.adapters.base import (
+    GenerationConfig,
+    Message,
+    MessageRole,
+    ProviderAuthError,
+    RetryPolicy,
+    StreamUsage,
+    TransientNetworkError,
+)
+from app.adapters.circuit import breakers
+from app.adapters.factory import PROVIDER_MODELS, get_adapter
+from app.adapters.fake_adapter import FakeAdapter, FakeProfile, VirtualClock
+from app.models.debate import DebateConfig, DebateSession, DebateStatus, Participant, Provider
+from app.orchestrator.engine import DebateOrchestrator
+
+MESSAGES = [
+    Message(role=MessageRole.SYSTEM, content="You are a debater."),
+    Message(role=MessageRole.USER, content="Is virtue teachable?"),
+]
+
+
+@pytest.fixture(autouse=True)
+def _fresh_breakers():
+    breakers.clear()
+    yield
+    breakers.clear()
+
+
+async def _stream(adapter, key, messages=MESSAGES, max_tokens=64):
+    config = GenerationConfig(model="fake-model", max_tokens=max_tokens)
+    return [c async for c in adapter.generate_stream(messages, config, key)]
+
+
+class TestFakeProfile:
+    def test_defaults_and_options(self):
+        assert FakeProfile.parse("fake") == FakeProfile()
+        profile = FakeProfile.parse("fake: ttft=0.1; tps=200;seed=3;clock=virtual")
+        assert (profile.ttft, profile.tps, profile.seed, profile.clock) == (0.1, 200.0, 3, "virtual")
+
+    @pytest.mark.parametrize("key", ["sk-real", "fake:nope=1", "fake:tps=fast", "fake:clock=slow"])
+    def test_invalid_keys(self, key):
+        with pytest.raises(ValueError):
+            FakeProfile.parse(key)
+
+    @pytest.mark.asyncio
+    async def test_validate_key(self):
+        adapter = FakeAdapter()
+        assert await adapter.validate_key("fake:tps=10")
+        assert not await adapter.validate_key("sk-real")
+
+
+class TestFakeAdapter:
+    def test_registered_but_not_listed(self):
+        assert isinstance(get_adapter("fake"), FakeAdapter)
+        assert "fake" not in PROVIDER_MODELS
+
+    @pytest.mark.asyncio
+    async def test_content_is_deterministic_per_seed_and_prompt(self):
+        clock = VirtualClock()
+        first = await _stream(FakeAdapter(clock), "fake:seed=1")
+        again = await _stream(FakeAdapter(clock), "fake:seed=1")
+        other = await _stream(FakeAdapter(clock), "fake:seed=2")
+        assert first == again
+        assert first != other
+        usage = first[-1]
+        assert isinstance(usage, StreamUsage)
+        assert usage.output_tokens == len(first) - 1 <= 64
+
+    @pytest.mark.asyncio
+    async def test_virtual_clock_follows_ttft_and_rate(self):
+        clock = VirtualClock()
+        adapter = FakeAdapter(clock)
+        started = asyncio.get_running_loop().time()
+        chunks = await _stream(adapter, "fake:ttft=2;tps=10;jitter=0;tokens=21", max_tokens=100)
+        tokens = len(chunks) - 1
+        # 2s to the first token, then 0.1s per token, without waiting for real
+        assert clock.time() == pytest.approx(2 + (tokens - 1) * 0.1)
+        assert asyncio.get_running_loop().time() - started < 1
+
+    @pytest.mark.asyncio
+    async def test_virtual_clock_interleaves_concurrent_streams(self):
+        clock = VirtualClock()
+        adapter = FakeAdapter(clock)
+        keys = ["fake:ttft=1;tps=10;jitter=0", "fake:ttft=3;tps=10;jitter=0"]
+        await asyncio.gather(*(_stream(adapter, k, max_tokens=5) for k in keys))
+        # Concurrent sleeps overlap: total time is the slowest stream, not the sum
+        assert clock.time() == pytest.approx(3 + 4 * 0.1)
+
+    @pytest.mark.asyncio
+    async def test_injected_429s_are_retried(self, monkeypatch):
+        monkeypatch.setattr(FakeAdapter, "retry_policy", RetryPolicy(max_attempts=50, base_delay=0))
+        adapter = FakeAdapter(VirtualClock())
+        chunks = await _stream(adapter, "fake:rate_limit=0.5;retry_after=0;ttft=0")
+        assert isinstance(chunks[-1], StreamUsage)
+
+    @pytest.mark.asyncio
+    async def test_mid_stream_failures_surface_after_first_token(self):
+        adapter = FakeAdapter(VirtualClock())
+        received = []
+        with pytest.raises(TransientNetworkError):
+            config = GenerationConfig(model="fake-model", max_tokens=64)
+            async for chunk in adapter.generate_stream(MESSAGES, config, "fake:fail=1"):
+                received.append(chunk)
+        assert received  # Not retried: output was already streamed
+
+    @pytest.mark.asyncio
+    async def test_invalid_key_is_an_auth_error(self):
+        with pytest.raises(ProviderAuthError):
+            await _stream(FakeAdapter(VirtualClock()), "fake:bogus=1")
+
+    @pytest.mark.asyncio
+    async def test_consensus_prompts_get_json(self):
+        from app.orchestrator.consensus import evaluate_consensus_with_llm
+
+        result = await evaluate_consensus_with_llm(
+            "T", [{"speaker": "A", "content": "x"}], FakeAdapter(VirtualClock()), "fake", "fake-model"
+        )
+        assert 0.0 <= result["consensus_score"] <= 1.0
+
+
+class TestConcurrentDebates:
+    @pytest.mark.asyncio
+    async def test_many_debates_on_the_virtual_clock(self, monkeypatch):
+        clock = VirtualClock()
+        monkeypatch.setattr(fake_adapter, "virtual_clock", clock)
+
+        async def run_debate(i):
+            config = DebateConfig(
+                topic=f"Topic {i}",
+                max_rounds=3,
+                max_tokens_per_turn=100,
+                participants=[
+                    Participant(provider=Provider.FAKE, model="fake-model", display_name=f"P{j}")
+                    for j in range(3)
+                ],
+            )
+            session = DebateSession(
+                config=config, api_keys={"fake": f"fake:seed={i};tokens=50;clock=virtual"}
+            )
+            async for _ in DebateOrchestrator(session).run():
+                pass
+            return session
+
+        sessions = await asyncio.gather(*(run_debate(i) for i in range(50)))
+        assert all(s.status == DebateStatus.CONCLUDED for s in sessions)
+        assert all(len(s.transcript) >= 3 for s in sessions)
+        # Each debate streamed for simulated seconds, all of them concurrently
+        assert clock.time() > 5
@@ -0,0 +1,167 @@
+"""Unit tests for hedged requests on slow-starting turns."""
+
+import asyncio
+
+import pytest
+
+from app.adapters.base import GenerationConfig, Message, MessageRole, ProviderError, StreamUsage
+from app.adapters.circuit import breakers
+from app.adapters.fake_adapter import FakeAdapter
+from app.adapters.timing import StreamTiming, TimingRegistry
+from app.models.debate import DebateConfig, DebateSession, Participant, Provider
+from app.orchestrator import engine, hedging
+from app.orchestrator.engine import DebateOrchestrator
+from app.orchestrator.hedging import HedgeOutcome, hedge_delay, hedged_stream
+
+MESSAGES = [Message(role=MessageRole.USER, content="Is virtue teachable?")]
+CONFIG = GenerationConfig(model="fake-model", max_tokens=5)
+FAST = "fake:ttft=0.01;tps=1000;jitter=0;tokens=5"
+SLOW = "fake:ttft=0.5;tps=1000;jitter=0;tokens=5"
+
+
+@pytest.fixture(autouse=True)
+def _fresh_state(monkeypatch):
+    monkeypatch.setattr(hedging, "stream_timings", TimingRegistry())
+    breakers.clear()
+    yield
+    breakers.clear()
+
+
+class _Tracked:
+    """Wraps a stream to record whether it was closed."""
+
+    def __init__(self, key):
+        self.closed = False
+        self._key = key
+
+    async def stream(self):
+        try:
+            async for chunk in FakeAdapter().generate_stream(MESSAGES, CONFIG, self._key):
+                yield chunk
+        finally:
+            self.closed = True
+
+
+async def _failing(delay, name="primary"):
+    await asyncio.sleep(delay)
+    raise ProviderError(f"{name} reset")
+    yield
+
+
+async def _collect(stream):
+    return [c async for c in stream]
+
+
+class TestHedgeDelay:
+    def test_default_until_enough_samples(self):
+        assert hedge_delay("fake", "fake-model", 0.95) == hedging.DEFAULT_HEDGE_DELAY
+
+    def test_follows_the_ttft_percentile(self):
+        for ttft in [0.5, 1.5, 2.0, 2.5, 3.0, 40.0]:
+            hedging.stream_timings.record(StreamTiming("fake", "fake-model", ttft=ttft))
+        assert hedge_delay("fake", "fake-model", 0.5) == 2.5
+        assert hedge_delay("fake", "fake-model", 0.99) == hedging.MAX_HEDGE_DELAY
+        assert hedge_delay("fake", "fake-model", 0.0) == hedging.MIN_HEDGE_DELAY
+
+
+class TestHedgedStream:
+    @pytest.mark.asyncio
+    async def test_fast_primary_is_not_hedged(self):
+        primary = _Tracked(FAST)
+        outcome = HedgeOutcome()
+        chunks = await _collect(
+            hedged_stream(primary.stream(), lambda: pytest.fail("hedged"), 0.2, outcome)
+        )
+        assert isinstance(chunks[-1], StreamUsage) and len(chunks) == 6
+        assert not outcome.issued and outcome.winner == "primary"
+
+    @pytest.mark.asyncio
+    async def test_slow_primary_loses_to_backup(self):
+        primary, backup = _Tracked(SLOW), _Tracked(FAST)
+        outcome = HedgeOutcome()
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        chunks = await _collect(hedged_stream(primary.stream(), backup.stream, 0.05, outcome))
+        assert loop.time() - started < 0.4
+        assert len(chunks) == 6
+        assert outcome.issued and outcome.winner == "backup" and outcome.delay == 0.05
+        assert primary.closed and backup.closed
+
+    @pytest.mark.asyncio
+    async def test_no_backup_when_not_allowed(self):
+        primary = _Tracked(SLOW)
+        outcome = HedgeOutcome()
+        chunks = await _collect(hedged_stream(primary.stream(), lambda: None, 0.05, outcome))
+        assert len(chunks) == 6
+        assert not outcome.issued
+
+    @pytest.mark.asyncio
+    async def test_failed_primary_falls_back_to_backup(self):
+        outcome = HedgeOutcome()
+        backup = _Tracked(SLOW)
+        chunks = await _collect(hedged_stream(_failing(0.1), backup.stream, 0.05, outcome))
+        assert len(chunks) == 6 and outcome.winner == "backup"
+
+    @pytest.mark.asyncio
+    async def test_both_failing_raises_the_primary_error(self):
+        with pytest.raises(ProviderError, match="primary"):
+            await _collect(hedged_stream(
+                _failing(0.2, "primary"), lambda: _failing(0.01, "backup"), 0.05, HedgeOutcome()
+            ))
+
+    @pytest.mark.asyncio
+    async def test_closing_early_closes_both(self):
+        primary, backup = _Tracked(SLOW), _Tracked(SLOW)
+        stream = hedged_stream(primary.stream(), backup.stream, 0.05, HedgeOutcome())
+        await anext(stream)
+        await stream.aclose()
+        assert primary.closed and backup.closed
+
+
+class TestEngineHedging:
+    def _session(self, **config):
+        config.setdefault("hedge_requests", True)
+        debate = DebateConfig(
+            topic="Is virtue teachable?",
+            max_rounds=1,
+            max_tokens_per_turn=100,
+            participants=[
+                Participant(provider=Provider.FAKE, model="fake-model", display_name=f"P{i}")
+                for i in range(2)
+            ],
+            **config,
+        )
+        return DebateSession(config=debate, api_keys={"fake": SLOW})
+
+    async def _turn_ends(self, session):
+        return [
+            e.data async for e in DebateOrchestrator(session).run()
+            if e.event_type == "debate:turn_end"
+        ]
+
+    @pytest.mark.asyncio
+    async def test_turns_report_their_hedge(self, monkeypatch):
+        monkeypatch.setattr(engine, "hedge_delay", lambda *args: 0.05)
+        session = self._session()
+        turn_ends = await self._turn_ends(session)
+        assert [t["hedge"]["issued"] for t in turn_ends] == [True, True]
+        # Same slow profile both ways, so the earlier request wins
+        assert {t["hedge"]["winner"] for t in turn_ends} == {"primary"}
+        assert session.hedged_turns == 2
+
+    @pytest.mark.asyncio
+    async def test_budget_caps_hedges(self, monkeypatch):
+        monkeypatch.setattr(engine, "hedge_delay", lambda *args: 0.05)
+        monkeypatch.setattr(engine, "_prompt_cost", lambda model, messages: 0.1)
+        session = self._session(hedge_budget_usd=0.15)
+        turn_ends = await self._turn_ends(session)
+        assert [t["hedge"] is not None for t in turn_ends] == [True, False]
+        assert session.hedged_turns == 1
+        assert session.hedge_cost_usd == pytest.approx(0.1)
+
+    @pytest.mark.asyncio
+    async def test_off_by_default(self):
+        session = self._session(hedge_requests=False)
+        turn_ends = await self._turn_ends(session)
+        assert all(t["hedge"] is None for t in turn_ends)
+        assert session.hedged_turns == 0
@@ -0,0 +1,337 @@
+"""Unit tests for fanning debate events out to spectators."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from app.api.debate import debate_events, router
+from app.models.debate import DebateConfig, DebateMessage, DebateSession, Participant, Provider
+from app.services.hub import DebateHub
+
+KEY = "fake:ttft=0.01;tps=2000;jitter=0;tokens=40"
+SLOW = "fake:ttft=0.01;tps=200;jitter=0;tokens=60"
+
+
+def _session():
+    config = DebateConfig(
+        topic="Is virtue teachable?",
+        participants=[
+            Participant(provider=Provider.FAKE, model="fake-model", display_name=name)
+            for name in ["A", "B"]
+        ],
+    )
+    return DebateSession(config=config)
+
+
+async def _no_broadcast(event_type, data):
+    pass
+
+
+async def _turn(hub, session, speaker, words, end=True):
+    await hub.publish("debate:turn_start", {"speaker": speaker, "round": 1})
+    for word in words:
+        await hub.publish("debate:token_stream", {"speaker": speaker, "token": word})
+    if end:
+        session.transcript.append(DebateMessage(
+            speaker=speaker, provider=Provider.FAKE, model="fake-model",
+            content="".join(words), round_number=1,
+        ))
+        await hub.publish("debate:turn_end", {"speaker": speaker, "round": 1})
+
+
+def _frames(text):
+    """Parse SSE text into (id, payload) pairs."""
+    frames = []
+    for block in text.split("\n\n"):
+        if not block:
+            continue
+        fields = dict(line.split(": ", 1) for line in block.split("\n"))
+        event_id = int(fields["id"]) if "id" in fields else None
+        frames.append((event_id, json.loads(fields["data"])))
+    return frames
+
+
+def _start(**options):
+    return {
+        "topic": "Is virtue teachable?",
+        "participants": [
+            {"provider": "fake", "model": "fake-model", "display_name": f"P{i}"}
+            for i in range(2)
+        ],
+        "api_keys": {"fake": KEY},
+        "max_rounds": 1,
+        "max_tokens_per_turn": 100,
+        **options,
+    }
+
+
+class TestDebateHub:
+    @pytest.mark.asyncio
+    async def test_catch_up_is_finished_turns_plus_turns_in_progress(self):
+        session = _session()
+        hub = DebateHub(session, _no_broadcast)
+        await hub.publish("debate:round_start", {"round": 1})
+        await _turn(hub, session, "A", ["Yes ", "it ", "is"])
+        await _turn(hub, session, "B", ["No", "pe"], end=False)
+
+        snapshot, replay = hub.catch_up()
+        assert snapshot["round"] == 1
+        assert snapshot["transcript"] == [{"speaker": "A", "round": 1, "content": "Yes it is"}]
+        assert [(f.event_type, f.data.get("token")) for f in replay] == [
+            ("debate:turn_start", None),
+            ("debate:token_stream", "No"),
+            ("debate:token_stream", "pe"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_snapshot_text_comes_from_published_tokens(self):
+        # Simultaneous and speculative turns reach the transcript only
+        # after their turn_end is published
+        session = _session()
+        hub = DebateHub(session, _no_broadcast)
+        for speaker, words in [("A", ["x", "y"]), ("B", ["z"])]:
+            await hub.publish("debate:turn_start", {"speaker": speaker, "round": 2})
+            for word in words:
+                await hub.publish("debate:token_stream", {"speaker": speaker, "token": word})
+            await hub.publish("debate:turn_end", {"speaker": speaker, "round": 2})
+        snapshot, _ = hub.catch_up()
+        assert [t["content"] for t in snapshot["transcript"]] == ["xy", "z"]
+
+        # A speculative turn dropped after it ended leaves the snapshot
+        await hub.publish(
+            "debate:turn_cancelled", {"speaker": "B", "round": 2, "reason": "concluded"}
+        )
+        snapshot, _ = hub.catch_up()
+        assert [t["speaker"] for t in snapshot["transcript"]] == ["A"]
+
+    @pytest.mark.asyncio
+    async def test_failed_and_timed_out_turns_are_not_replayed(self):
+        session = _session()
+        hub = DebateHub(session, _no_broadcast)
+        await _turn(hub, session, "A", ["x"], end=False)
+        await hub.publish("debate:error", {"speaker": "A", "round": 1, "error": "boom"})
+        await _turn(hub, session, "B", ["y"], end=False)
+        await hub.publish("debate:deadline", {"scope": "turn", "round": 1, "speaker": "B"})
+        _, replay = hub.catch_up()
+        assert replay == []
+
+        # A truncated turn still ends with the text it streamed
+        await hub.publish("debate:turn_end", {"speaker": "B", "round": 1})
+        snapshot, _ = hub.catch_up()
+        assert snapshot["transcript"] == [{"speaker": "B", "round": 1, "content": "y"}]
+
+    @pytest.mark.asyncio
+    async def test_each_frame_is_encoded_once_for_all_subscribers(self):
+        session = _session()
+        hub = DebateHub(session, _no_broadcast)
+        first, second = hub.subscribe(), hub.subscribe()
+        await hub.publish("debate:token_stream", {"speaker": "A", "token": "x"})
+        a, b = first.queue.get_nowait(), second.queue.get_nowait()
+        assert a is b and a.sse is b.sse
+        assert _frames(a.sse) == [(1, {
+            "type": "debate:token_stream", "data": {"speaker": "A", "token": "x", "seq": 1},
+        })]
+
+    @pytest.mark.asyncio
+    async def test_replay_buffer_is_bounded(self):
+        session = _session()
+        hub = DebateHub(session, _no_broadcast, replay_frames=4)
+        await _turn(hub, session, "A", list("abcdefgh"), end=False)
+        _, replay = hub.catch_up()
+        assert [f.data["token"] for f in replay] == list("efgh")
+
+    @pytest.mark.asyncio
+    async def test_lagging_subscriber_is_dropped(self, monkeypatch):
+        monkeypatch.setattr("app.services.hub.SUBSCRIBER_QUEUE", 2)
+        hub = DebateHub(_session(), _no_broadcast)
+        lagging = hub.subscribe()
+        for text in "abc":
+            await hub.publish("debate:token_stream", {"speaker": "A", "token": text})
+        assert hub.subscribers == 0
+        assert [frame async for frame in lagging] == []
+
+    @pytest.mark.asyncio
+    async def test_close_ends_subscriptions_after_queued_frames(self):
+        hub = DebateHub(_session(), _no_broadcast)
+        subscription = hub.subscribe()
+        await hub.publish("debate:concluded", {"session_id": "s1"})
+        hub.close()
+        frames = [frame async for frame in subscription]
+        assert [f.event_type for f in frames] == ["debate:concluded"]
+
+
+class TestEventLog:
+    @pytest.mark.asyncio
+    async def test_every_event_is_numbered(self):
+        sent = []
+
+        async def broadcast(event_type, data):
+            sent.append(data["seq"])
+
+        session = _session()
+        hub = DebateHub(session, broadcast)
+        await _turn(hub, session, "A", ["a", "b"])
+        assert sent == [1, 2, 3, 4] and hub.seq == 4
+
+    @pytest.mark.asyncio
+    async def test_since_replays_exactly_the_missed_events(self):
+        session = _session()
+        hub = DebateHub(session, _no_broadcast, replay_frames=4)
+        await _turn(hub, session, "A", list("abcde"), end=False)  # seq 1..6
+        assert [f.seq for f in hub.since(3)] == [4, 5, 6]
+        assert hub.since(6) == []
+        # The log starts at seq 3 now
+        assert [f.seq for f in hub.since(2)] == [3, 4, 5, 6]
+        assert hub.since(1) is None
+        assert hub.since(7) is None
+
+    @pytest.mark.asyncio
+    async def test_trimmed_log_falls_back_to_a_snapshot(self):
+        session = _session()
+        hub = DebateHub(session, _no_broadcast, replay_frames=4)
+        await _turn(hub, session, "A", list("ab"))
+        await _turn(hub, session, "B", list("cd"), end=False)  # seq 5..7
+        snapshot, replay = hub.catch_up(after_seq=5)
+        assert snapshot is None and [f.seq for f in replay] == [6, 7]
+        snapshot, replay = hub.catch_up(after_seq=1)
+        assert snapshot["seq"] == 7
+        assert snapshot["transcript"] == [{"speaker": "A", "round": 1, "content": "ab"}]
+        assert [f.seq for f in replay] == [5, 6, 7]
+
+
+class TestSpectators:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("strategy", ["sequential", "simultaneous"])
+    async def test_socket_spectator_sees_the_whole_debate(self, debate_server, strategy):
+        sio, registry = debate_server
+        await sio.handlers["debate:start"](
+            "sid1", _start(
+                api_keys={"fake": SLOW}, max_rounds=2, consensus_threshold=1.0,
+                round_strategy=strategy,
+            )
+        )
+        [debate] = registry.owned_by("sid1")
+        await asyncio.sleep(0.45)
+
+        await sio.handlers["debate:join"]("sid2", {"session_id": debate.session_id})
+        joined_at = len(sio.emitted)
+        [(event, joined)] = sio.sent_to("sid2")
+        assert event == "debate:joined"
+        assert joined["snapshot"]["participants"] == ["P0", "P1"]
+        assert joined["snapshot"]["transcript"]
+        await asyncio.wait_for(debate.task, 5)
+
+        # Snapshot, then replay, then the room's live events rebuild every
+        # turn exactly: nothing missed, nothing repeated
+        live = [
+            (e, d) for e, d, room in sio.emitted[joined_at:] if room == debate.session_id
+        ]
+        turns = {
+            (turn["speaker"], turn["round"]): turn["content"]
+            for turn in joined["snapshot"]["transcript"]
+        }
+        rounds = {}
+        for event, data in [(r["type"], r["data"]) for r in joined["replay"]] + live:
+            if event == "debate:turn_start":
+                rounds[data["speaker"]] = data["round"]
+                turns[(data["speaker"], data["round"])] = ""
+            elif event == "debate:token_stream":
+                key = (data["speaker"], rounds[data["speaker"]])
+                turns[key] += data["token"]
+        transcript = debate.orchestrator.session.transcript
+        assert turns == {(m.speaker, m.round_number): m.content for m in transcript}
+        assert all(turns.values())
+
+    @pytest.mark.asyncio
+    async def test_sse_spectator(self, debate_server):
+        sio, registry = debate_server
+        await sio.handlers["debate:start"]("sid1", _start())
+        [debate] = registry.owned_by("sid1")
+
+        app = FastAPI()
+        app.include_router(router)
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.get(f"/api/debate/{debate.session_id}/events")
+            assert debate.task.done()
+            missing = await client.get("/api/debate/nope/events")
+        assert missing.status_code == 404
+
+        frames = [payload for _, payload in _frames(response.text)]
+        types = [f["type"] for f in frames]
+        assert types[0] == "debate:snapshot"
+        assert types[-3:] == ["debate:concluded", "debate:generating_conspectus", "debate:conspectus"]
+        assert debate.hub.subscribers == 0
+
+    @pytest.mark.asyncio
+    async def test_sse_client_gone_before_streaming_leaves_nothing(self, debate_server):
+        sio, registry = debate_server
+        await sio.handlers["debate:start"]("sid1", _start(api_keys={"fake": SLOW}))
+        [debate] = registry.owned_by("sid1")
+        response = await debate_events(debate.session_id, last_event_id=None)
+        await response.body_iterator.aclose()  # Never iterated
+        assert debate.viewers == {"sid1"}
+        assert debate.hub.subscribers == 0
+        debate.orchestrator.stop()
+        await asyncio.wait_for(debate.task, 5)
+
+
+class TestResync:
+    @pytest.mark.asyncio
+    async def test_socket_resync_fills_the_gap(self, debate_server):
+        sio, registry = debate_server
+        await sio.handlers["debate:start"]("sid1", _start(api_keys={"fake": SLOW}))
+        [debate] = registry.owned_by("sid1")
+        await asyncio.sleep(0.1)
+        # The client saw up to seq 3, lost its connection and came back
+        await sio.handlers["disconnect"]("sid1")
+        await asyncio.sleep(0.1)
+        await sio.handlers["debate:resync"](
+            "sid2", {"session_id": debate.session_id, "after_seq": 3}
+        )
+        resynced_at = len(sio.emitted)
+        [(event, resynced)] = sio.sent_to("sid2")
+        assert event == "debate:resynced" and resynced["snapshot"] is None
+        await asyncio.wait_for(debate.task, 5)
+
+        live = [d["seq"] for _, d, room in sio.emitted[resynced_at:] if room == debate.session_id]
+        replayed = [r["data"]["seq"] for r in resynced["replay"]]
+        assert replayed + live == list(range(4, debate.hub.seq + 1))
+
+    @pytest.mark.asyncio
+    async def test_socket_resync_after_the_log_was_trimmed(self, debate_server, monkeypatch):
+        monkeypatch.setattr("app.services.hub.REPLAY_FRAMES", 4)
+        sio, registry = debate_server
+        await sio.handlers["debate:start"]("sid1", _start(api_keys={"fake": SLOW}))
+        [debate] = registry.owned_by("sid1")
+        await asyncio.sleep(0.25)
+        await sio.handlers["debate:resync"](
+            "sid2", {"session_id": debate.session_id, "after_seq": 1}
+        )
+        [(event, resynced)] = sio.sent_to("sid2")
+        assert event == "debate:resynced"
+        assert resynced["snapshot"]["seq"] == debate.hub.seq
+        debate.orchestrator.stop()
+        await asyncio.wait_for(debate.task, 5)
+
+    @pytest.mark.asyncio
+    async def test_sse_resumes_from_last_event_id(self, debate_server):
+        sio, registry = debate_server
+        await sio.handlers["debate:start"]("sid1", _start(api_keys={"fake": SLOW}))
+        [debate] = registry.owned_by("sid1")
+        await asyncio.sleep(0.1)
+
+        app = FastAPI()
+        app.include_router(router)
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.get(
+                f"/api/debate/{debate.session_id}/events", headers={"Last-Event-ID": "2"}
+            )
+        frames = _frames(response.text)
+        assert frames[0][1]["type"] != "debate:snapshot"
+        assert [event_id for event_id, _ in frames] == list(range(3, debate.hub.seq + 1))
+        assert all(payload["data"]["seq"] == event_id for event_id, payload in frames)
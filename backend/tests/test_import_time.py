@@ -0,0 +1,54 @@
+"""Cold-import benchmark for the Vercel serverless entry point.
+
+Runs ``python -X importtime`` against ``api/index.py`` in a fresh
+interpreter so every serverless cold start is measured the same way.
+Provider SDKs must stay out of the import graph (they load lazily on the
+first ``get_adapter`` call), and the total import time must stay under
+budget. Override the budget with IMPORT_TIME_BUDGET_MS on slow machines.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+API_DIR = Path(__file__).resolve().parents[2] / "api"
+
+# Cumulative import time budget for `import index`. Eagerly importing the
+# provider SDKs used to cost ~3s here; without them it is well under 1s.
+IMPORT_TIME_BUDGET_MS = float(os.environ.get("IMPORT_TIME_BUDGET_MS", 1500))
+
+LAZY_SDKS = ("openai", "anthropic", "google.genai")
+
+
+def _import_profile() -> dict[str, int]:
+    """Return {module: cumulative microseconds} for a cold `import index`."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import index"],
+        cwd=API_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    profile = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line.split("|")
+        profile[module.strip()] = int(cumulative)
+    return profile
+
+
+class TestColdImport:
+    def test_sdks_are_not_imported_eagerly(self):
+        profile = _import_profile()
+        eager = [sdk for sdk in LAZY_SDKS if sdk in profile]
+        assert eager == [], f"Provider SDKs imported at cold start: {eager}"
+
+    def test_cold_import_within_budget(self):
+        # Best of three runs to damp noise from a busy machine
+        best_ms = min(_import_profile()["index"] for _ in range(3)) / 1000
+        assert best_ms < IMPORT_TIME_BUDGET_MS, (
+            f"Cold import of api/index.py took {best_ms:.0f}ms "
+            f"(budget {IMPORT_TIME_BUDGET_MS:.0f}ms)"
+        )
@@ -0,0 +1,236 @@
+"""Unit tests for provider-side prompt caching."""
+
+import asyncio
+from contextlib import nullcontext
+from types import SimpleNamespace
+
+import pytest
+
+from app.adapters import gemini_adapter
+from app.adapters.anthropic_adapter import AnthropicAdapter, _system_blocks
+from app.adapters.base import GenerationConfig, Message, MessageRole, StreamUsage
+from app.adapters.gemini_adapter import ContextCacheRegistry, GeminiAdapter
+from app.adapters.openai_adapter import OpenAIAdapter
+from app.adapters.xai_adapter import XAIAdapter
+from app.orchestrator.prompts import build_turn_prompt, build_turn_prompt_parts
+
+TRANSCRIPT = [
+    {"speaker": "Claude", "content": "Democracy enables freedom."},
+    {"speaker": "GPT", "content": "But it can lead to tyranny of the majority."},
+]
+
+
+class TestTurnPromptBoundaries:
+    def test_boundaries_end_each_transcript_entry(self):
+        prompt, boundaries = build_turn_prompt_parts("Is democracy good?", TRANSCRIPT)
+        assert prompt == build_turn_prompt("Is democracy good?", TRANSCRIPT)
+        assert prompt[: boundaries[0]].endswith("Democracy enables freedom.")
+        assert prompt[: boundaries[1]].endswith("tyranny of the majority.")
+
+    def test_prefixes_repeat_verbatim_on_later_turns(self):
+        prompt, boundaries = build_turn_prompt_parts("{Braces} in topic", TRANSCRIPT)
+        later, later_boundaries = build_turn_prompt_parts(
+            "{Braces} in topic", TRANSCRIPT + [{"speaker": "Gemini", "content": "Yes."}]
+        )
+        assert later_boundaries[:2] == boundaries
+        assert all(later[:b] == prompt[:b] for b in boundaries)
+
+    def test_no_boundaries_for_opening_turn(self):
+        assert build_turn_prompt_parts("T", [])[1] == ()
+
+
+class TestAnthropicCacheControl:
+    def test_breakpoint_on_last_boundary(self):
+        content = "prefix-one|prefix-two|instruction"
+        messages = [
+            Message(role=MessageRole.SYSTEM, content="Rules"),
+            Message(role=MessageRole.USER, content=content, cache_boundaries=(11, 22)),
+        ]
+        system, api_msgs = AnthropicAdapter._prepare_messages(messages)
+        blocks = api_msgs[0]["content"]
+        assert "".join(b["text"] for b in blocks) == content
+        assert [b.get("cache_control") for b in blocks] == [
+            None, {"type": "ephemeral"}, None
+        ]
+        assert _system_blocks(system)[0]["cache_control"] == {"type": "ephemeral"}
+
+    def test_messages_without_boundaries_stay_plain(self):
+        messages = [Message(role=MessageRole.USER, content="Hello")]
+        _, api_msgs = AnthropicAdapter._prepare_messages(messages)
+        assert api_msgs[0]["content"] == "Hello"
+
+    @pytest.mark.asyncio
+    async def test_usage_reports_cache_tokens(self, monkeypatch):
+        class FakeStream:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            @property
+            def text_stream(self):
+                return _agen("Hi")
+
+            async def get_final_message(self):
+                return SimpleNamespace(
+                    model="claude-sonnet-4-6",
+                    stop_reason="end_turn",
+                    usage=SimpleNamespace(
+                        input_tokens=10,
+                        output_tokens=1,
+                        cache_read_input_tokens=900,
+                        cache_creation_input_tokens=100,
+                    ),
+                )
+
+        fake_client = SimpleNamespace(
+            messages=SimpleNamespace(stream=lambda **kwargs: FakeStream())
+        )
+        monkeypatch.setattr(AnthropicAdapter, "_client", lambda self, key: nullcontext(fake_client))
+
+        chunks = [
+            c async for c in AnthropicAdapter().generate_stream(
+                [Message(role=MessageRole.USER, content="Hi")],
+                GenerationConfig(model="claude-sonnet-4-6"),
+                "sk-ant-test",
+            )
+        ]
+        usage = chunks[-1]
+        assert usage.input_tokens == 1010
+        assert usage.cache_read_tokens == 900
+        assert usage.cache_write_tokens == 100
+
+
+async def _agen(*items):
+    for item in items:
+        yield item
+
+
+def _openai_client(captured, usage):
+    async def create(**kwargs):
+        captured.update(kwargs)
+        return _agen(
+            SimpleNamespace(
+                choices=[SimpleNamespace(delta=SimpleNamespace(content="ok"), finish_reason="stop")],
+                usage=None,
+                model="gpt-4o",
+            ),
+            SimpleNamespace(choices=[], usage=usage, model="gpt-4o"),
+        )
+
+    return SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+
+
+class TestOpenAIPromptCaching:
+    @pytest.mark.asyncio
+    async def test_cache_key_forwarded_and_hits_reported(self, monkeypatch):
+        captured = {}
+        usage = SimpleNamespace(
+            prompt_tokens=2000,
+            completion_tokens=1,
+            prompt_tokens_details=SimpleNamespace(cached_tokens=1536, cache_write_tokens=None),
+        )
+        client = _openai_client(captured, usage)
+        monkeypatch.setattr(OpenAIAdapter, "_client", lambda self, key: nullcontext(client))
+
+        chunks = [
+            c async for c in OpenAIAdapter().generate_stream(
+                [Message(role=MessageRole.USER, content="Hi")],
+                GenerationConfig(model="gpt-4o", cache_key="debate-speaker"),
+                "sk-test",
+            )
+        ]
+        assert captured["prompt_cache_key"] == "debate-speaker"
+        assert chunks[-1] == StreamUsage(
+            input_tokens=2000,
+            output_tokens=1,
+            model="gpt-4o",
+            finish_reason="stop",
+            cache_read_tokens=1536,
+        )
+
+    @pytest.mark.asyncio
+    async def test_compatible_providers_skip_cache_key(self, monkeypatch):
+        captured = {}
+        usage = SimpleNamespace(prompt_tokens=10, completion_tokens=1, prompt_tokens_details=None)
+        client = _openai_client(captured, usage)
+        monkeypatch.setattr(XAIAdapter, "_client", lambda self, key: nullcontext(client))
+
+        async for _ in XAIAdapter().generate_stream(
+            [Message(role=MessageRole.USER, content="Hi")],
+            GenerationConfig(model="grok-3", cache_key="debate-speaker"),
+            "xai-test",
+        ):
+            pass
+        assert "prompt_cache_key" not in captured
+
+
+class _FakeCaches:
+    def __init__(self):
+        self.created = []
+        self.deleted = []
+
+    async def create(self, model, config):
+        self.created.append(config)
+        return SimpleNamespace(
+            name=f"cachedContents/{len(self.created)}",
+            usage_metadata=SimpleNamespace(total_token_count=5000),
+        )
+
+    async def delete(self, name):
+        self.deleted.append(name)
+
+
+class TestGeminiContextCache:
+    @pytest.fixture
+    def caches(self, monkeypatch):
+        monkeypatch.setattr(gemini_adapter, "context_caches", ContextCacheRegistry())
+        monkeypatch.setattr(gemini_adapter, "CONTEXT_CACHE_MIN_CHARS", 100)
+        monkeypatch.setattr(gemini_adapter, "CONTEXT_CACHE_STEP_CHARS", 100)
+        return _FakeCaches()
+
+    def _messages(self, entries):
+        transcript = [{"speaker": f"S{i}", "content": text} for i, text in enumerate(entries)]
+        prompt, boundaries = build_turn_prompt_parts("Topic", transcript)
+        return [
+            Message(role=MessageRole.SYSTEM, content="Rules"),
+            Message(role=MessageRole.USER, content=prompt, cache_boundaries=boundaries),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_short_prompts_are_sent_uncached(self, caches):
+        client = SimpleNamespace(aio=SimpleNamespace(caches=caches))
+        request = await GeminiAdapter()._cached_request(
+            client, "AIza-test", "gemini-2.5-pro", self._messages(["short"])
+        )
+        assert request.cached_content is None
+        assert request.system_instruction == "Rules"
+        assert caches.created == []
+
+    @pytest.mark.asyncio
+    async def test_long_prefix_is_cached_and_reused(self, caches):
+        client = SimpleNamespace(aio=SimpleNamespace(caches=caches))
+        adapter = GeminiAdapter()
+        entries = ["a" * 150]
+
+        first = await adapter._cached_request(client, "k", "gemini-2.5-pro", self._messages(entries))
+        assert first.cached_content == "cachedContents/1"
+        assert first.system_instruction is None
+        assert first.cache_write_tokens == 5000
+        # Only the closing instruction is sent alongside the cache
+        assert "your turn" in first.contents[0].parts[0].text
+        assert "a" * 150 not in first.contents[0].parts[0].text
+
+        entries.append("b" * 20)  # Below the refresh step: reuse the cache
+        second = await adapter._cached_request(client, "k", "gemini-2.5-pro", self._messages(entries))
+        assert second.cached_content == "cachedContents/1"
+        assert second.cache_write_tokens == 0
+        assert second.contents[0].parts[0].text.lstrip().startswith("**S1**: " + "b" * 20)
+
+        entries.append("c" * 200)  # Enough new text: roll over to a new cache
+        third = await adapter._cached_request(client, "k", "gemini-2.5-pro", self._messages(entries))
+        assert third.cached_content == "cachedContents/2"
+        assert len(caches.created) == 2
+        await asyncio.sleep(0)  # Let the background delete run
+        assert caches.deleted == ["cachedContents/1"]
@@ -0,0 +1,90 @@
+"""Unit tests for the per-key token-bucket rate limiter."""
+
+import asyncio
+import time
+
+import pytest
+
+from app.adapters.base import GenerationConfig, GenerationResult, LLMAdapter, guarded_call
+from app.adapters.ratelimit import (
+    PROVIDER_LIMITS,
+    ProviderLimits,
+    RateLimiterRegistry,
+    TokenBucket,
+)
+
+
+class TestTokenBucket:
+    @pytest.mark.asyncio
+    async def test_full_bucket_does_not_wait(self):
+        bucket = TokenBucket(per_minute=600)
+        assert await bucket.acquire(600) < 0.01
+
+    @pytest.mark.asyncio
+    async def test_empty_bucket_waits_for_refill(self):
+        bucket = TokenBucket(per_minute=600)  # 10 tokens/s
+        await bucket.acquire(600)
+        started = time.monotonic()
+        waited = await bucket.acquire(1)
+        assert waited >= 0.05
+        assert time.monotonic() - started >= 0.05
+
+    @pytest.mark.asyncio
+    async def test_adjust_refunds_overestimate(self):
+        bucket = TokenBucket(per_minute=100)
+        await bucket.acquire(100)
+        bucket.adjust(-50)
+        assert bucket.tokens >= 50
+
+
+class TestRateLimiterRegistry:
+    @pytest.mark.asyncio
+    async def test_keys_have_independent_budgets(self, monkeypatch):
+        monkeypatch.setitem(PROVIDER_LIMITS, "test", ProviderLimits(1, 1_000))
+        registry = RateLimiterRegistry()
+        await registry.acquire("test", "key-a", 10)
+        # A different key is not throttled by key-a's spent request budget
+        reservation = await asyncio.wait_for(registry.acquire("test", "key-b", 10), 0.5)
+        assert reservation.waited < 0.01
+
+    @pytest.mark.asyncio
+    async def test_snapshot_reports_waits_without_raw_keys(self, monkeypatch):
+        monkeypatch.setitem(PROVIDER_LIMITS, "test", ProviderLimits(6_000, 100_000))
+        registry = RateLimiterRegistry()
+        await registry.acquire("test", "secret-key", 10)
+        await registry.acquire("test", "secret-key", 10)
+        [entry] = registry.snapshot()
+        assert entry["provider"] == "test"
+        assert entry["requests"] == 2
+        assert "secret" not in entry["key"]
+        assert "avg_wait_seconds" in entry
+
+
+class TestGuardedCallLimiting:
+    @pytest.mark.asyncio
+    async def test_generate_settles_actual_usage(self, monkeypatch):
+        registry = RateLimiterRegistry()
+        monkeypatch.setattr("app.adapters.base.rate_limiter", registry)
+        monkeypatch.setitem(PROVIDER_LIMITS, "metered", ProviderLimits(100, 10_000))
+
+        class _Metered(LLMAdapter):
+            provider_name = "metered"
+
+            @guarded_call
+            async def generate(self, messages, config, api_key):
+                return GenerationResult(content="ok", input_tokens=10, output_tokens=5)
+
+            async def generate_stream(self, messages, config, api_key):
+                yield ""
+
+            async def validate_key(self, api_key):
+                return True
+
+            def get_available_models(self):
+                return []
+
+        await _Metered().generate([], GenerationConfig(model="m", max_tokens=1000), "k")
+        limiter = registry._limiter("metered", "k")
+        # Reserved 1000 tokens up front, then refunded all but the 15 used
+        assert limiter.tokens.tokens >= 10_000 - 15 - 1
+        assert limiter.stats.requests == 1
@@ -0,0 +1,166 @@
+"""Unit tests for typed provider errors and the shared retry layer."""
+
+import pytest
+from google.genai import errors as genai_errors
+
+from app.adapters.base import (
+    ContextTooLongError,
+    GenerationConfig,
+    GenerationResult,
+    LLMAdapter,
+    ProviderAuthError,
+    ProviderOverloadedError,
+    RateLimitedError,
+    RetryPolicy,
+    TransientNetworkError,
+    error_from_status,
+    guarded_call,
+    guarded_stream,
+    parse_retry_after,
+)
+from app.adapters.gemini_adapter import GeminiAdapter
+
+FAST_RETRY = RetryPolicy(max_attempts=3, base_delay=0.0, max_delay=0.0, budget=1.0)
+
+
+class _FlakyAdapter(LLMAdapter):
+    """Adapter whose failures are scripted per attempt."""
+
+    provider_name = "flaky"
+    retry_policy = FAST_RETRY
+    rate_limited = False
+
+    def __init__(self, failures: list[Exception], fail_after_first_chunk=False):
+        self.failures = list(failures)
+        self.fail_after_first_chunk = fail_after_first_chunk
+        self.attempts = 0
+
+    @guarded_stream
+    async def generate_stream(self, messages, config, api_key):
+        self.attempts += 1
+        if self.fail_after_first_chunk:
+            yield "partial"
+        if self.failures:
+            raise self.failures.pop(0)
+        yield "ok"
+
+    @guarded_call
+    async def generate(self, messages, config, api_key):
+        self.attempts += 1
+        if self.failures:
+            raise self.failures.pop(0)
+        return GenerationResult(content="ok")
+
+    async def validate_key(self, api_key):
+        return True
+
+    def get_available_models(self):
+        return []
+
+
+async def _collect(adapter):
+    return [c async for c in adapter.generate_stream([], GenerationConfig(model="m"), "k")]
+
+
+class TestErrorMapping:
+    @pytest.mark.parametrize(
+        "status,expected",
+        [
+            (401, ProviderAuthError),
+            (403, ProviderAuthError),
+            (429, RateLimitedError),
+            (413, ContextTooLongError),
+            (503, ProviderOverloadedError),
+            (529, ProviderOverloadedError),
+            (500, TransientNetworkError),
+        ],
+    )
+    def test_status_codes(self, status, expected):
+        assert isinstance(error_from_status("X", status), expected)
+
+    def test_auth_error_is_value_error(self):
+        assert isinstance(error_from_status("X", 401), ValueError)
+
+    def test_parse_retry_after_seconds_and_ms(self):
+        assert parse_retry_after({"retry-after": "7"}) == 7.0
+        assert parse_retry_after({"retry-after-ms": "1500"}) == 1.5
+        assert parse_retry_after({}) is None
+        assert parse_retry_after({"retry-after": "garbage"}) is None
+
+    def test_gemini_invalid_key_uses_structured_details(self):
+        error = genai_errors.ClientError(400, {"error": {
+            "code": 400,
+            "message": "API key not valid.",
+            "status": "INVALID_ARGUMENT",
+            "details": [{"@type": "type.googleapis.com/google.rpc.ErrorInfo",
+                         "reason": "API_KEY_INVALID"}],
+        }})
+        assert isinstance(GeminiAdapter()._translate_error(error), ProviderAuthError)
+
+    def test_gemini_rate_limit_reads_retry_info(self):
+        error = genai_errors.ClientError(429, {"error": {
+            "code": 429,
+            "message": "Resource exhausted.",
+            "status": "RESOURCE_EXHAUSTED",
+            "details": [{"@type": "type.googleapis.com/google.rpc.RetryInfo",
+                         "retryDelay": "12s"}],
+        }})
+        translated = GeminiAdapter()._translate_error(error)
+        assert isinstance(translated, RateLimitedError)
+        assert translated.retry_after == 12.0
+
+
+class TestRetryPolicy:
+    def test_honors_retry_after(self):
+        policy = RetryPolicy(base_delay=0.0, max_delay=0.0, budget=60)
+        delay = policy.next_delay(0, RateLimitedError("x", retry_after=5), waited=0)
+        assert delay == 5
+
+    def test_non_retryable_errors_are_not_retried(self):
+        assert RetryPolicy().next_delay(0, ProviderAuthError("x"), waited=0) is None
+
+    def test_budget_exhaustion_stops_retries(self):
+        policy = RetryPolicy(budget=10)
+        assert policy.next_delay(0, RateLimitedError("x", retry_after=11), waited=0) is None
+
+    def test_attempt_cap(self):
+        policy = RetryPolicy(max_attempts=2)
+        assert policy.next_delay(1, RateLimitedError("x"), waited=0) is None
+
+
+class TestGuardedStream:
+    @pytest.mark.asyncio
+    async def test_retries_before_first_token(self):
+        adapter = _FlakyAdapter([RateLimitedError("429"), TransientNetworkError("reset")])
+        assert await _collect(adapter) == ["ok"]
+        assert adapter.attempts == 3
+
+    @pytest.mark.asyncio
+    async def test_never_retries_after_first_token(self):
+        adapter = _FlakyAdapter([RateLimitedError("429")], fail_after_first_chunk=True)
+        with pytest.raises(RateLimitedError):
+            await _collect(adapter)
+        assert adapter.attempts == 1
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_attempts(self):
+        adapter = _FlakyAdapter([RateLimitedError("429")] * 5)
+        with pytest.raises(RateLimitedError):
+            await _collect(adapter)
+        assert adapter.attempts == FAST_RETRY.max_attempts
+
+    @pytest.mark.asyncio
+    async def test_auth_errors_fail_fast(self):
+        adapter = _FlakyAdapter([ProviderAuthError("bad key")])
+        with pytest.raises(ProviderAuthError):
+            await _collect(adapter)
+        assert adapter.attempts == 1
+
+
+class TestGuardedCall:
+    @pytest.mark.asyncio
+    async def test_generate_retries_overload(self):
+        adapter = _FlakyAdapter([ProviderOverloadedError("529")])
+        result = await adapter.generate([], GenerationConfig(model="m"), "k")
+        assert result.content == "ok"
+        assert adapter.attempts == 2
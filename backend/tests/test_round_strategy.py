@@ -0,0 +1,227 @@
+"""Unit tests for round strategies and speculative consensus checks."""
+
+import asyncio
+
+import pytest
+
+from app.adapters.circuit import breakers
+from app.adapters.fake_adapter import FakeAdapter
+from app.models.debate import (
+    DebateConfig,
+    DebateSession,
+    Participant,
+    Provider,
+    RoundStrategy,
+)
+from app.orchestrator import engine
+from app.orchestrator.engine import DebateOrchestrator
+
+# 0.2s per turn: 20 tokens at 100 tokens/s
+KEY = "fake:ttft=0.01;tps=100;jitter=0;tokens=20"
+SPEAKERS = ["P0", "P1", "P2"]
+
+
+class _RecordingAdapter:
+    """Keeps the prompt of every turn and counts open streams."""
+
+    def __init__(self):
+        self._adapter = FakeAdapter()
+        self.prompts: list[str] = []
+        self.prompt_chars: list[int] = []
+        self.open_streams = 0
+        self.max_open_streams = 0
+
+    async def generate_stream(self, messages, config, api_key):
+        self.prompts.append("\n".join(m.content for m in messages))
+        self.prompt_chars.append(sum(len(m.content) for m in messages))
+        self.open_streams += 1
+        self.max_open_streams = max(self.max_open_streams, self.open_streams)
+        try:
+            async for chunk in self._adapter.generate_stream(messages, config, api_key):
+                yield chunk
+        finally:
+            self.open_streams -= 1
+
+    async def generate(self, messages, config, api_key):
+        return await self._adapter.generate(messages, config, api_key)
+
+
+@pytest.fixture
+def adapter(monkeypatch):
+    breakers.clear()
+    recording = _RecordingAdapter()
+    monkeypatch.setattr(engine, "get_adapter", lambda provider: recording)
+    yield recording
+    breakers.clear()
+
+
+def _orchestrator(strategy, max_rounds=1, **options):
+    config = DebateConfig(
+        topic="Is virtue teachable?",
+        max_rounds=max_rounds,
+        max_tokens_per_turn=100,
+        round_strategy=strategy,
+        **options,
+        participants=[
+            Participant(provider=Provider.FAKE, model="fake-model", display_name=name)
+            for name in SPEAKERS
+        ],
+    )
+    return DebateOrchestrator(DebateSession(config=config, api_keys={"fake": KEY}))
+
+
+async def _run(orchestrator):
+    return [event async for event in orchestrator.run()]
+
+
+async def _round_seconds(strategy):
+    events = []
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    async for event in _orchestrator(strategy).run():
+        events.append(event)
+        if event.event_type == "debate:consensus_check":
+            return loop.time() - started, events
+
+
+class TestSimultaneousRounds:
+    @pytest.mark.asyncio
+    async def test_round_takes_the_slowest_speaker_not_the_sum(self, adapter):
+        sequential, _ = await _round_seconds(RoundStrategy.SEQUENTIAL)
+        simultaneous, events = await _round_seconds(RoundStrategy.SIMULTANEOUS)
+        assert sequential > 0.45
+        assert simultaneous < 0.3 and simultaneous < sequential / 2
+        assert adapter.max_open_streams == 3
+
+        # Token events stay tagged per speaker and arrive interleaved
+        speakers = [e.data["speaker"] for e in events if e.event_type == "debate:token_stream"]
+        assert speakers[:3] == SPEAKERS
+        assert speakers != sorted(speakers)
+
+    @pytest.mark.asyncio
+    async def test_speakers_see_only_previous_rounds(self, adapter):
+        orchestrator = _orchestrator(RoundStrategy.SIMULTANEOUS, max_rounds=2)
+        orchestrator.session.config.consensus_threshold = 1.0
+        await _run(orchestrator)
+        transcript = orchestrator.session.transcript
+        # Deterministic participant order, whatever order the turns finished in
+        assert [(m.round_number, m.speaker) for m in transcript] == [
+            (1, "P0"), (1, "P1"), (1, "P2"), (2, "P0"), (2, "P1"), (2, "P2"),
+        ]
+        round_one = [m.content for m in transcript[:3]]
+        first_prompts, second_prompts = adapter.prompts[:3], adapter.prompts[3:]
+        assert not any(text in prompt for text in round_one for prompt in first_prompts)
+        assert all(text in prompt for text in round_one for prompt in second_prompts)
+
+    @pytest.mark.asyncio
+    async def test_stop_closes_every_stream(self, adapter):
+        orchestrator = _orchestrator(RoundStrategy.SIMULTANEOUS)
+        task = asyncio.create_task(_run(orchestrator))
+        await asyncio.sleep(0.05)
+        assert adapter.open_streams == 3
+        orchestrator.stop()
+        events = await asyncio.wait_for(task, 1)
+        assert adapter.open_streams == 0
+        cancelled = [e.data["speaker"] for e in events if e.event_type == "debate:turn_cancelled"]
+        assert sorted(cancelled) == SPEAKERS
+        assert orchestrator.session.transcript == []
+
+    @pytest.mark.asyncio
+    async def test_restarting_pause_restarts_every_turn(self, adapter):
+        orchestrator = _orchestrator(RoundStrategy.SIMULTANEOUS)
+        task = asyncio.create_task(_run(orchestrator))
+        await asyncio.sleep(0.05)
+        orchestrator.pause(restart_turn=True)
+        await asyncio.sleep(0.02)
+        assert adapter.open_streams == 0
+        orchestrator.resume()
+        events = await asyncio.wait_for(task, 2)
+        assert len(adapter.prompts) == 6
+        assert [m.speaker for m in orchestrator.session.transcript] == SPEAKERS
+        assert events[-1].event_type == "debate:concluded"
+
+
+def _judge(monkeypatch, score, seconds):
+    """Make every consensus check take ``seconds`` and return ``score``."""
+
+    async def compute_consensus(**kwargs):
+        await asyncio.sleep(seconds)
+        return {"consensus_score": score, "stagnation_detected": False, "summary": ""}
+
+    monkeypatch.setattr(engine, "compute_consensus", compute_consensus)
+
+
+def _index(events, event_type, **data):
+    return next(
+        i for i, e in enumerate(events)
+        if e.event_type == event_type and all(e.data.get(k) == v for k, v in data.items())
+    )
+
+
+class TestSpeculativeConsensus:
+    @pytest.mark.asyncio
+    async def test_next_round_starts_during_the_check(self, adapter, monkeypatch):
+        _judge(monkeypatch, score=0.1, seconds=0.1)
+        orchestrator = _orchestrator(
+            RoundStrategy.SEQUENTIAL, max_rounds=2, speculative_consensus=True
+        )
+        events = await _run(orchestrator)
+        early_turn = _index(events, "debate:turn_start", round=2, speaker="P0")
+        assert early_turn < _index(events, "debate:consensus_check", round=1)
+        assert _index(events, "debate:round_start", round=2) < early_turn
+
+        transcript = orchestrator.session.transcript
+        assert [(m.round_number, m.speaker) for m in transcript] == [
+            (r, name) for r in (1, 2) for name in SPEAKERS
+        ]
+        # The early turn still saw the whole of round one
+        assert all(m.content in adapter.prompts[3] for m in transcript[:3])
+        assert events[-1].data["total_rounds"] == 2
+
+    @pytest.mark.asyncio
+    async def test_concluding_check_cancels_the_early_turn(self, adapter, monkeypatch):
+        _judge(monkeypatch, score=0.95, seconds=0.05)
+        orchestrator = _orchestrator(
+            RoundStrategy.SEQUENTIAL, max_rounds=2, speculative_consensus=True
+        )
+        events = await _run(orchestrator)
+        assert adapter.open_streams == 0
+
+        cancelled = events[_index(events, "debate:turn_cancelled")].data
+        assert (cancelled["speaker"], cancelled["round"]) == ("P0", 2)
+        assert cancelled["reason"] == "concluded"
+        assert 0 < cancelled["discarded_chunks"] < 20
+
+        session = orchestrator.session
+        assert [m.round_number for m in session.transcript] == [1, 1, 1]
+        assert events[-1].data["total_rounds"] == 1
+        # The cancelled turn's prompt and what it streamed are billed as
+        # estimates on top of round one
+        streamed = "".join(
+            e.data["token"] for e in events[_index(events, "debate:turn_start", round=2):]
+            if e.event_type == "debate:token_stream"
+        )
+        first_turn = session.transcript[0]
+        assert session.token_usage["P0"] == first_turn.token_count + (len(streamed) + 3) // 4
+        assert session.input_token_usage["P0"] == (
+            first_turn.input_tokens + adapter.prompt_chars[3] // 4
+        )
+
+    @pytest.mark.asyncio
+    async def test_simultaneous_rounds_speculate_every_turn(self, adapter, monkeypatch):
+        _judge(monkeypatch, score=0.95, seconds=0.05)
+        orchestrator = _orchestrator(
+            RoundStrategy.SIMULTANEOUS, max_rounds=2, speculative_consensus=True
+        )
+        events = await _run(orchestrator)
+        cancelled = [e.data["speaker"] for e in events if e.event_type == "debate:turn_cancelled"]
+        assert sorted(cancelled) == SPEAKERS
+        assert adapter.max_open_streams == 3 and adapter.open_streams == 0
+
+    @pytest.mark.asyncio
+    async def test_off_by_default(self, adapter, monkeypatch):
+        _judge(monkeypatch, score=0.1, seconds=0.05)
+        events = await _run(_orchestrator(RoundStrategy.SEQUENTIAL, max_rounds=2))
+        assert _index(events, "debate:consensus_check", round=1) < _index(
+            events, "debate:round_start", round=2
+        )
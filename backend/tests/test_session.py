@@ -1,12 +1,14 @@
 """Unit tests for session management."""
 
+import time
+
 from app.models.debate import (
     DebateConfig,
     DebateSession,
     Participant,
     Provider,
 )
-from app.services.session import SessionManager
+from app.services.session import SESSION_TIMEOUT, SessionManager
 
 
 def _make_session(**kwargs) -> DebateSession:
@@ -76,6 +78,20 @@ class TestSessionManager:
         assert s1.session_id in sessions
         assert s2.session_id in sessions
 
+    def test_expire_skips_sessions_kept_alive(self):
+        mgr = SessionManager()
+        idle = _make_session()
+        running = _make_session()
+        mgr.create_session(idle)
+        mgr.create_session(running)
+        mgr.keep_alive(running.session_id)
+
+        later = time.time() + SESSION_TIMEOUT + 1
+        assert mgr.expire(later) == [idle.session_id]
+        assert running.api_keys
+        mgr.end_session(running.session_id)
+        assert mgr.list_sessions() == []
+
     def test_end_nonexistent_session_no_error(self):
         mgr = SessionManager()
         mgr.end_session("nonexistent")  # Should not raise
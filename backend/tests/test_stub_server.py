@@ -0,0 +1,217 @@
+"""End-to-end adapter tests against the local provider stub server."""
+
+import inspect
+import time
+
+import anthropic
+import pytest
+import pytest_asyncio
+
+from app.adapters import factory
+from app.adapters.anthropic_adapter import AnthropicAdapter
+from app.adapters.base import (
+    GenerationConfig,
+    Message,
+    MessageRole,
+    RateLimitedError,
+    RetryPolicy,
+    StreamUsage,
+    TransientNetworkError,
+)
+from app.adapters.circuit import breakers
+from app.adapters.clients import client_pool
+from app.adapters.deepseek_adapter import DeepSeekAdapter
+from app.adapters.gemini_adapter import GeminiAdapter
+from app.adapters.openai_adapter import OpenAIAdapter
+from tests.stub_server import StubBehavior, StubServer
+
+MESSAGES = [
+    Message(role=MessageRole.SYSTEM, content="You are a debater."),
+    Message(role=MessageRole.USER, content="Is virtue teachable?"),
+]
+
+ADAPTERS = {
+    "openai": (OpenAIAdapter, "gpt-4o"),
+    "google": (GeminiAdapter, "gemini-2.0-flash"),
+}
+
+# The adapter passes temperature, which some SDK releases no longer accept
+anthropic_adapter_supported = pytest.mark.skipif(
+    "temperature" not in inspect.signature(anthropic.AsyncAnthropic(api_key="x").messages.stream).parameters,
+    reason="installed anthropic SDK does not accept temperature",
+)
+
+
+@pytest_asyncio.fixture
+async def stub():
+    breakers.clear()
+    async with StubServer() as server:
+        yield server
+    await client_pool.aclose()
+    breakers.clear()
+
+
+def _adapter(stub, provider, **overrides):
+    adapter_class, model = ADAPTERS[provider]
+    adapter = adapter_class(base_url=stub.base_url(provider))
+    for name, value in overrides.items():
+        setattr(adapter, name, value)
+    return adapter, GenerationConfig(model=model, max_tokens=256)
+
+
+async def _collect(adapter, config, key="sk-stub"):
+    return [c async for c in adapter.generate_stream(MESSAGES, config, key)]
+
+
+class TestWireProtocols:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("provider", ADAPTERS)
+    async def test_stream_and_usage(self, stub, provider):
+        adapter, config = _adapter(stub, provider)
+        chunks = await _collect(adapter, config)
+        assert chunks[:-1] == ["lorem "] * 16
+        usage = chunks[-1]
+        assert isinstance(usage, StreamUsage)
+        assert usage.output_tokens == 16 and usage.input_tokens > 0
+        assert usage.finish_reason == "stop"
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("provider", ADAPTERS)
+    async def test_generate_and_validate(self, stub, provider):
+        adapter, config = _adapter(stub, provider)
+        result = await adapter.generate(MESSAGES, config, "sk-stub")
+        assert result.content == "lorem " * 16
+        assert await adapter.validate_key("sk-stub")
+        stub.enqueue(StubBehavior(status=401))
+        assert not await adapter.validate_key("sk-rejected")
+
+    @pytest.mark.asyncio
+    async def test_openai_request_carries_stream_options(self, stub):
+        adapter, config = _adapter(stub, "openai")
+        config.cache_key = "debate-speaker"
+        await _collect(adapter, config)
+        body = stub.requests[-1].body
+        assert body["stream_options"] == {"include_usage": True}
+        assert body["prompt_cache_key"] == "debate-speaker"
+
+    @pytest.mark.asyncio
+    async def test_compatible_adapters_take_a_base_url(self, stub):
+        adapter = DeepSeekAdapter(base_url=stub.base_url("deepseek"))
+        chunks = await _collect(adapter, GenerationConfig(model="deepseek-chat"))
+        assert len(chunks) == 17
+        assert "prompt_cache_key" not in stub.requests[-1].body
+
+    @pytest.mark.asyncio
+    async def test_anthropic_event_stream(self, stub):
+        client = anthropic.AsyncAnthropic(
+            api_key="sk-ant-stub", base_url=stub.base_url("anthropic"), max_retries=0
+        )
+        async with client.messages.stream(
+            model="claude-sonnet-4-6",
+            max_tokens=256,
+            messages=[{"role": "user", "content": "Is virtue teachable?"}],
+        ) as stream:
+            texts = [t async for t in stream.text_stream]
+            final = await stream.get_final_message()
+        await client.close()
+        assert texts == ["lorem "] * 16
+        assert final.stop_reason == "end_turn"
+        assert final.usage.output_tokens == 16
+
+    @pytest.mark.asyncio
+    @anthropic_adapter_supported
+    async def test_anthropic_adapter(self, stub):
+        adapter = AnthropicAdapter(base_url=stub.base_url("anthropic"))
+        chunks = await _collect(adapter, GenerationConfig(model="claude-sonnet-4-6"))
+        assert chunks[-1].output_tokens == 16
+        assert await adapter.validate_key("sk-ant-stub")
+
+
+class TestScriptedBehavior:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("provider", ADAPTERS)
+    async def test_429_is_retried_with_retry_after(self, stub, provider):
+        adapter, config = _adapter(stub, provider, retry_policy=RetryPolicy(base_delay=0))
+        stub.enqueue(StubBehavior(status=429, retry_after=0))
+        chunks = await _collect(adapter, config)
+        assert isinstance(chunks[-1], StreamUsage)
+        assert len(stub.requests) == 2
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("provider", ADAPTERS)
+    async def test_429_surfaces_retry_after(self, stub, provider):
+        adapter, config = _adapter(stub, provider, retry_policy=RetryPolicy(max_attempts=1))
+        stub.enqueue(StubBehavior(status=429, retry_after=7))
+        with pytest.raises(RateLimitedError) as excinfo:
+            await _collect(adapter, config)
+        assert excinfo.value.retry_after == 7
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("provider", ADAPTERS)
+    async def test_disconnect_mid_stream(self, stub, provider):
+        adapter, config = _adapter(stub, provider)
+        stub.enqueue(StubBehavior(disconnect_after=3))
+        received = []
+        with pytest.raises(TransientNetworkError):
+            async for chunk in adapter.generate_stream(MESSAGES, config, "sk-stub"):
+                received.append(chunk)
+        # Output had started, so the call is not retried
+        assert received == ["lorem "] * 3
+        assert len(stub.requests) == 1
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("provider", ADAPTERS)
+    async def test_request_timeout_is_passed_to_the_sdk(self, stub, provider):
+        adapter, config = _adapter(stub, provider, retry_policy=RetryPolicy(max_attempts=1))
+        config.timeout = 0.1
+        stub.enqueue(StubBehavior(ttft=1.0))
+        started = time.perf_counter()
+        with pytest.raises(TransientNetworkError):
+            await _collect(adapter, config)
+        assert time.perf_counter() - started < 0.5
+
+    @pytest.mark.asyncio
+    async def test_latency_and_throughput(self, stub):
+        adapter, config = _adapter(stub, "openai")
+        stub.enqueue(StubBehavior(ttft=0.1, tps=100, tokens=11))
+        started = time.perf_counter()
+        arrivals = []
+        async for chunk in adapter.generate_stream(MESSAGES, config, "sk-stub"):
+            arrivals.append(time.perf_counter() - started)
+        assert arrivals[0] >= 0.1
+        assert arrivals[-2] - arrivals[0] >= 0.09  # 10 more chunks at 100/s
+
+    @pytest.mark.asyncio
+    async def test_connections_are_kept_alive(self, stub):
+        adapter, config = _adapter(stub, "openai")
+        for _ in range(3):
+            await adapter.generate(MESSAGES, config, "sk-stub")
+        assert stub.connections == 1
+
+
+class TestBaseUrlOverrides:
+    def test_env_overrides_reach_adapters(self, monkeypatch):
+        monkeypatch.setenv("PROVIDER_BASE_URLS", "xai=http://127.0.0.1:9/v1, bogus")
+        monkeypatch.setattr(factory, "PROVIDER_BASE_URLS", {})
+        monkeypatch.setattr(factory, "_ADAPTER_INSTANCES", {})
+        factory._load_env_base_urls()
+        assert factory.PROVIDER_BASE_URLS == {"xai": "http://127.0.0.1:9/v1"}
+        assert factory.get_adapter("xai")._base_url == "http://127.0.0.1:9/v1"
+        assert factory.get_adapter("deepseek")._base_url == "https://api.deepseek.com"
+
+
+class TestStreamingThroughput:
+    """SDK parsing and connection overhead per chunk, with no network."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("provider", ADAPTERS)
+    async def test_chunks_per_second(self, stub, provider):
+        adapter, config = _adapter(stub, provider)
+        stub.default = StubBehavior(tokens=2000)
+        started = time.perf_counter()
+        chunks = await _collect(adapter, config)
+        elapsed = time.perf_counter() - started
+        assert len(chunks) == 2001
+        # A loose floor against pathological slowdowns
+        rate = 2000 / elapsed
+        assert rate > 200, f"{provider}: {rate:,.0f} chunks/s"
@@ -0,0 +1,324 @@
+"""Unit tests for running debates as supervised background tasks."""
+
+import asyncio
+import time
+
+import pytest
+
+from app.models.debate import (
+    DebateConfig,
+    DebateSession,
+    Participant,
+    PromptLayout,
+    Provider,
+)
+from app.orchestrator.engine import DebateOrchestrator
+from app.services.session import SESSION_TIMEOUT, session_manager
+from app.services.tasks import DebateTaskRegistry
+from app.ws.debate import register_debate_events
+
+from tests.fake_sio import FakeSio
+
+KEY = "fake:ttft=0.01;tps=2000;jitter=0;tokens=20"
+
+
+def _orchestrator():
+    config = DebateConfig(
+        topic="Is virtue teachable?",
+        max_rounds=1,
+        max_tokens_per_turn=100,
+        participants=[
+            Participant(provider=Provider.FAKE, model="fake-model", display_name=f"P{i}")
+            for i in range(2)
+        ],
+    )
+    session = DebateSession(config=config, api_keys={"fake": KEY})
+    session_manager.create_session(session)
+    return DebateOrchestrator(session)
+
+
+class TestDebateTaskRegistry:
+    @pytest.mark.asyncio
+    async def test_cleanup_after_the_debate_ends(self):
+        registry = DebateTaskRegistry()
+        orchestrator = _orchestrator()
+        session_id = orchestrator.session.session_id
+        debate = registry.spawn(orchestrator, "sid1", lambda debate: asyncio.sleep(0.01))
+        assert registry.get(session_id) is orchestrator
+        assert registry.snapshot()[0]["owner"] == "sid1"
+        # However long it runs, its session (and API keys) don't expire
+        assert session_id not in session_manager.expire(time.time() + SESSION_TIMEOUT + 1)
+        await debate.task
+        assert registry.get(session_id) is None
+        assert session_manager.get_session(session_id) is None
+
+    @pytest.mark.asyncio
+    async def test_cleanup_after_a_failure(self):
+        registry = DebateTaskRegistry()
+        orchestrator = _orchestrator()
+
+        async def failing(debate):
+            raise RuntimeError("boom")
+
+        debate = registry.spawn(orchestrator, "sid1", failing)
+        await debate.task  # The error is logged, not raised
+        assert registry.snapshot() == []
+        assert session_manager.get_session(orchestrator.session.session_id) is None
+
+    @pytest.mark.asyncio
+    async def test_shutdown_cancels_running_debates(self):
+        registry = DebateTaskRegistry()
+        first, second = _orchestrator(), _orchestrator()
+        registry.spawn(first, "sid1", lambda debate: asyncio.sleep(60))
+        registry.spawn(second, "sid1", lambda debate: asyncio.sleep(60))
+        assert len(registry.owned_by("sid1")) == 2
+        await asyncio.wait_for(registry.shutdown(), 1)
+        assert registry.snapshot() == []
+        assert session_manager.get_session(first.session.session_id) is None
+
+
+class TestDebateStartHandler:
+    @pytest.mark.asyncio
+    async def test_one_connection_runs_debates_side_by_side(self, debate_server):
+        sio, registry = debate_server
+        start = {
+            "topic": "Is virtue teachable?",
+            "participants": [
+                {"provider": "fake", "model": "fake-model", "display_name": f"P{i}"}
+                for i in range(2)
+            ],
+            "api_keys": {"fake": KEY},
+            "max_rounds": 1,
+            "max_tokens_per_turn": 100,
+        }
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        await sio.handlers["debate:start"]("sid1", start)
+        await sio.handlers["debate:start"]("sid1", start)
+        # The handler returns before the debate has done anything
+        assert loop.time() - started < 0.05
+        debates = registry.owned_by("sid1")
+        assert len(debates) == 2
+
+        await asyncio.wait_for(asyncio.gather(*(d.task for d in debates)), 5)
+        for debate in debates:
+            room = [e for e, _, r in sio.emitted if r == debate.session_id]
+            assert room[0] == "debate:started" and room[-1] == "debate:conspectus"
+        assert registry.snapshot() == []
+
+    @pytest.mark.asyncio
+    async def test_start_options_reach_the_session(self, debate_server):
+        sio, registry = debate_server
+        participants = [
+            {"provider": "fake", "model": "fake-model", "display_name": f"P{i}"}
+            for i in range(2)
+        ]
+        participants[0].update(hedge_provider="fake", hedge_model="fake-hedge")
+        participants[1].update(fallback_provider="fake", fallback_model="fake-fallback")
+        await sio.handlers["debate:start"]("sid1", {
+            "topic": "Is virtue teachable?",
+            "participants": participants,
+            "api_keys": {"fake": KEY},
+            "max_rounds": 1,
+            "hedge_requests": True,
+            "hedge_percentile": 0.9,
+            "hedge_budget_usd": 0.5,
+            "prompt_layout": "conversation",
+            "speculative_consensus": True,
+            "first_token_timeout_seconds": 5,
+            "turn_timeout_seconds": 30,
+            "debate_timeout_seconds": 600,
+        })
+        [debate] = registry.owned_by("sid1")
+        config = debate.orchestrator.session.config
+        assert config.prompt_layout == PromptLayout.CONVERSATION
+        assert config.hedge_requests and config.speculative_consensus
+        assert (config.hedge_percentile, config.hedge_budget_usd) == (0.9, 0.5)
+        assert (config.first_token_timeout_seconds, config.turn_timeout_seconds) == (5, 30)
+        assert config.round_timeout_seconds is None and config.debate_timeout_seconds == 600
+        first = config.participants[0]
+        assert (first.hedge_provider, first.hedge_model) == (Provider.FAKE, "fake-hedge")
+        second = config.participants[1]
+        assert (second.fallback_provider, second.fallback_model) == (Provider.FAKE, "fake-fallback")
+        debate.orchestrator.stop()
+        await asyncio.wait_for(debate.task, 1)
+
+    @pytest.mark.asyncio
+    async def test_invalid_start_reports_an_error(self):
+        sio = FakeSio()
+        register_debate_events(sio)
+        await sio.handlers["debate:start"]("sid1", {"participants": []})
+        assert sio.emitted[0][0] == "debate:error" and sio.emitted[0][2] == "sid1"
+
+    @pytest.mark.asyncio
+    async def test_out_of_range_token_flush_is_rejected(self, debate_server):
+        sio, registry = debate_server
+        for options in ({"token_flush_ms": 5000}, {"token_flush_bytes": 0}):
+            sio.emitted.clear()
+            await sio.handlers["debate:start"]("sid1", {
+                "topic": "Is virtue teachable?",
+                "participants": [
+                    {"provider": "fake", "model": "fake-model", "display_name": f"P{i}"}
+                    for i in range(2)
+                ],
+                "api_keys": {"fake": KEY},
+                **options,
+            })
+            [(event, data)] = sio.sent_to("sid1")
+            assert event == "debate:error" and "token_flush" in data["error"]
+        assert registry.owned_by("sid1") == []
+
+
+SLOW = "fake:ttft=0.01;tps=100;jitter=0;tokens=400"
+
+
+async def _start(sio, registry, **options):
+    await sio.handlers["debate:start"]("sid1", {
+        "topic": "Is virtue teachable?",
+        "participants": [
+            {"provider": "fake", "model": "fake-model", "display_name": f"P{i}"}
+            for i in range(2)
+        ],
+        "api_keys": {"fake": SLOW},
+        "max_rounds": 1,
+        "max_tokens_per_turn": 400,
+        "abandon_grace_seconds": 0.05,
+        **options,
+    })
+    [debate] = registry.owned_by("sid1")
+    return debate
+
+
+class TestAbandonedDebates:
+    @pytest.mark.asyncio
+    async def test_paused_after_the_grace_period_and_resumed_on_join(self, debate_server):
+        sio, registry = debate_server
+        debate = await _start(sio, registry)
+        await asyncio.sleep(0.05)
+        await sio.handlers["disconnect"]("sid1")
+        await asyncio.sleep(0.02)
+        assert debate.orchestrator.session.status.value == "running"
+        await asyncio.sleep(0.08)
+        assert debate.orchestrator.session.status.value == "paused"
+        # The turn in flight was dropped rather than held open
+        cancelled = [d for e, d, _ in sio.emitted if e == "debate:turn_cancelled"]
+        assert [d["reason"] for d in cancelled] == ["paused"]
+
+        await sio.handlers["debate:join"]("sid2", {"session_id": debate.session_id})
+        assert debate.orchestrator.session.status.value == "running"
+        assert sio.sent_to("sid2")[0][0] == "debate:joined"
+        debate.orchestrator.stop()
+        await asyncio.wait_for(debate.task, 1)
+
+    @pytest.mark.asyncio
+    async def test_rejoin_within_the_grace_period(self, debate_server):
+        sio, registry = debate_server
+        debate = await _start(sio, registry)
+        await sio.handlers["disconnect"]("sid1")
+        await sio.handlers["debate:join"]("sid2", {"session_id": debate.session_id})
+        await asyncio.sleep(0.1)
+        assert debate.orchestrator.session.status.value == "running"
+        assert debate.viewers == {"sid2"}
+        debate.orchestrator.stop()
+        await asyncio.wait_for(debate.task, 1)
+
+    @pytest.mark.asyncio
+    async def test_stop_policy_skips_the_conspectus_and_keeps_results(self, debate_server):
+        sio, registry = debate_server
+        debate = await _start(sio, registry, when_abandoned="stop")
+        await sio.handlers["disconnect"]("sid1")
+        await asyncio.wait_for(debate.task, 1)
+        assert sio.conspectus_calls == []
+
+        await sio.handlers["debate:join"]("sid2", {"session_id": debate.session_id})
+        [(event, data)] = sio.sent_to("sid2")
+        assert event == "debate:results"
+        assert data["session"]["session_id"] == debate.session_id
+        assert "api_keys" not in data["session"]
+
+    @pytest.mark.asyncio
+    async def test_continue_policy_finishes_headless(self, debate_server):
+        sio, registry = debate_server
+        debate = await _start(
+            sio, registry, when_abandoned="continue", api_keys={"fake": KEY}
+        )
+        await sio.handlers["disconnect"]("sid1")
+        await asyncio.wait_for(debate.task, 5)
+        assert sio.conspectus_calls == [debate.session_id]
+        assert registry.results(debate.session_id)["conspectus"] == "summary"
+
+
+class TestDebateControl:
+    @pytest.mark.asyncio
+    async def test_spectators_cannot_control_the_debate(self, debate_server):
+        sio, registry = debate_server
+        debate = await _start(sio, registry)
+        await asyncio.sleep(0.05)
+        await sio.handlers["debate:join"]("sid2", {"session_id": debate.session_id})
+        await sio.handlers["debate:stop"]("sid2", {"session_id": debate.session_id})
+        assert sio.sent_to("sid2")[-1][0] == "debate:error"
+        assert debate.orchestrator.session.status.value == "running"
+
+        await sio.handlers["debate:stop"]("sid1", {"session_id": debate.session_id})
+        await asyncio.wait_for(debate.task, 1)
+        assert "debate:stopped" in [e for e, _ in sio.sent_to(debate.session_id)]
+
+    @pytest.mark.asyncio
+    async def test_control_token_survives_a_reconnect(self, debate_server):
+        sio, registry = debate_server
+        debate = await _start(sio, registry)
+        await asyncio.sleep(0.05)
+        [(event, data)] = sio.sent_to("sid1")
+        assert event == "debate:control"
+        await sio.handlers["disconnect"]("sid1")
+        await sio.handlers["debate:join"]("sid3", {"session_id": debate.session_id})
+        await sio.handlers["debate:pause"](
+            "sid3", {"session_id": debate.session_id, "control_token": data["control_token"]}
+        )
+        assert debate.orchestrator.session.status.value == "paused"
+        assert debate.owner == "sid3"
+        debate.orchestrator.stop()
+        await asyncio.wait_for(debate.task, 1)
+
+    @pytest.mark.asyncio
+    async def test_control_events_go_through_the_hub(self, debate_server):
+        sio, registry = debate_server
+        debate = await _start(sio, registry)
+        await asyncio.sleep(0.05)
+        await sio.handlers["debate:pause"]("sid1", {"session_id": debate.session_id})
+        [paused] = [d for e, d in sio.sent_to(debate.session_id) if e == "debate:paused"]
+        logged = [frame for frame in debate.hub.since(0) if frame.event_type == "debate:paused"]
+        assert [frame.seq for frame in logged] == [paused["seq"]]
+        debate.orchestrator.stop()
+        await asyncio.wait_for(debate.task, 1)
+
+    @pytest.mark.asyncio
+    async def test_disconnect_overflow_drops_the_current_owner(self, debate_server):
+        sio, registry = debate_server
+        emit = sio.emit
+
+        async def slow_emit(event, data, room=None, to=None):
+            if event == "debate:token_stream":
+                await asyncio.sleep(0.02)
+            await emit(event, data, room=room, to=to)
+
+        sio.emit = slow_emit
+        debate = await _start(
+            sio, registry, overflow="disconnect", emit_queue_size=1, token_flush_ms=0
+        )
+        await asyncio.sleep(0.05)
+        [(_, data)] = sio.sent_to("sid1")
+        await sio.handlers["debate:join"]("sid3", {"session_id": debate.session_id})
+        await sio.handlers["debate:pause"](
+            "sid3", {"session_id": debate.session_id, "control_token": data["control_token"]}
+        )
+        await sio.handlers["debate:resume"]("sid3", {"session_id": debate.session_id})
+        sio.disconnected.clear()
+        for _ in range(50):
+            if sio.disconnected:
+                break
+            await asyncio.sleep(0.02)
+        assert set(sio.disconnected) == {"sid3"}
+        debate.orchestrator.stop()
+        await asyncio.wait_for(debate.task, 1)
@@ -0,0 +1,76 @@
+"""Unit tests for per-stream timing instrumentation."""
+
+import asyncio
+
+import pytest
+
+from app.adapters import base
+from app.adapters.base import GenerationConfig, Message, MessageRole, StreamUsage
+from app.adapters.circuit import breakers
+from app.adapters.fake_adapter import FakeAdapter
+from app.adapters.timing import StreamTimer, TimingRegistry
+
+MESSAGES = [Message(role=MessageRole.USER, content="Is virtue teachable?")]
+CONFIG = GenerationConfig(model="fake-model", max_tokens=20)
+# 50ms to the first token, then 200 tokens/s, no jitter
+KEY = "fake:ttft=0.05;tps=200;jitter=0;tokens=20"
+
+
+@pytest.fixture
+def timings(monkeypatch):
+    registry = TimingRegistry()
+    monkeypatch.setattr(base, "stream_timings", registry)
+    breakers.clear()
+    return registry
+
+
+class TestStreamTimer:
+    def test_no_chunks(self):
+        timer = StreamTimer("fake", "m")
+        timer.attempt(0.5)
+        timing = timer.finish()
+        assert timing.chunks == 0 and timing.tokens_per_second == 0.0
+        assert timing.queued == 0.5
+        assert timer.finish() is timing
+
+
+class TestGuardedStreamTiming:
+    @pytest.mark.asyncio
+    async def test_usage_carries_ttft_and_rate(self, timings):
+        chunks = [c async for c in FakeAdapter().generate_stream(MESSAGES, CONFIG, KEY)]
+        timing = chunks[-1].timing
+        assert timing.provider == "fake" and timing.model == "fake-model"
+        assert timing.ttft == pytest.approx(0.05, abs=0.03)
+        assert timing.output_tokens == 20 and timing.chunks == 20
+        assert 100 < timing.tokens_per_second < 260
+        assert timing.gap_mean == pytest.approx(0.005, abs=0.004)
+        assert timing.duration >= timing.ttft + timing.generation
+
+    @pytest.mark.asyncio
+    async def test_caller_time_is_not_generation_time(self, timings):
+        consumer_sleep = 0.01
+        usage = None
+        async for chunk in FakeAdapter().generate_stream(MESSAGES, CONFIG, KEY):
+            if isinstance(chunk, StreamUsage):
+                usage = chunk
+            else:
+                await asyncio.sleep(consumer_sleep)  # e.g. emitting an event
+        timing = usage.timing
+        assert timing.consumer >= 20 * consumer_sleep
+        # Still ~200 tokens/s: the slow caller shows up as consumer time only
+        assert 100 < timing.tokens_per_second < 260
+
+    @pytest.mark.asyncio
+    async def test_registry_aggregates_per_model(self, timings):
+        adapter = FakeAdapter()
+        for _ in range(3):
+            async for _ in adapter.generate_stream(MESSAGES, CONFIG, KEY):
+                pass
+        with pytest.raises(Exception):
+            async for _ in adapter.generate_stream(MESSAGES, CONFIG, "fake:fail=1;ttft=0"):
+                pass
+        [entry] = timings.snapshot()
+        assert (entry["provider"], entry["model"]) == ("fake", "fake-model")
+        assert entry["streams"] == 3 and entry["errors"] == 1
+        assert entry["ttft_p50_seconds"] == pytest.approx(0.05, abs=0.03)
+        assert entry["tokens_per_second_p50"] > 100
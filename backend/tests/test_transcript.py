@@ -0,0 +1,167 @@
+"""Unit tests and a microbenchmark for incremental transcript rendering."""
+
+import gc
+import statistics
+import time
+
+from app.adapters.base import MessageRole
+from app.models.debate import DebateMessage, PromptLayout, Provider
+from app.orchestrator.prompts import (
+    build_consensus_prompt,
+    build_conspectus_prompt,
+    build_turn_prompt_parts,
+)
+from app.orchestrator.transcript import TranscriptRenderer
+
+ROUNDS = 50
+PARTICIPANTS = 8
+
+
+def _messages(rounds=ROUNDS, participants=PARTICIPANTS, words=200):
+    text = " ".join(["wisdom"] * words)
+    return [
+        DebateMessage(
+            speaker=f"Speaker {i}",
+            provider=Provider.OPENAI,
+            model="gpt-4o",
+            content=f"{text} ({r}.{i})",
+            round_number=r,
+        )
+        for r in range(1, rounds + 1)
+        for i in range(participants)
+    ]
+
+
+def _entries(messages):
+    return [
+        {"speaker": m.speaker, "content": m.content, "round": m.round_number}
+        for m in messages
+    ]
+
+
+class TestTranscriptRenderer:
+    def test_turn_prompt_matches_full_render(self):
+        messages = _messages(rounds=3, participants=3, words=5)
+        renderer = TranscriptRenderer("Is {virtue} teachable?")
+        assert renderer.turn_prompt() == build_turn_prompt_parts("Is {virtue} teachable?", [])
+        for i, message in enumerate(messages, start=1):
+            renderer.append(message.speaker, message.content, message.round_number)
+            expected = build_turn_prompt_parts("Is {virtue} teachable?", _entries(messages[:i]))
+            assert renderer.turn_prompt() == expected
+
+    def test_prompts_are_served_by_reference_until_append(self):
+        messages = _messages(rounds=1, participants=2, words=5)
+        renderer = TranscriptRenderer("T", messages[:1])
+        first = renderer.turn_prompt()
+        assert renderer.turn_prompt() is first
+        renderer.append(messages[1].speaker, messages[1].content, 1)
+        assert renderer.turn_prompt() is not first
+
+    def test_system_prompt_rendered_once_per_participant(self):
+        renderer = TranscriptRenderer("T")
+        assert renderer.system_prompt("GPT", "Skeptic") is renderer.system_prompt("GPT", "Skeptic")
+        assert "Skeptic" in renderer.system_prompt("GPT", "Skeptic")
+
+    def test_consensus_prompt_covers_one_round(self):
+        messages = _messages(rounds=3, participants=2, words=5)
+        renderer = TranscriptRenderer("T", messages)
+        round_two = [m for m in messages if m.round_number == 2]
+        assert renderer.consensus_prompt(2) == build_consensus_prompt("T", _entries(round_two))
+
+    def test_conspectus_prompt_matches_full_render(self):
+        messages = _messages(rounds=2, participants=2, words=5)
+        renderer = TranscriptRenderer("T", messages)
+        expected = build_conspectus_prompt("T", ["A", "B"], 2, 0.75, _entries(messages))
+        assert renderer.conspectus_prompt(["A", "B"], 2, 0.75) == expected
+
+
+class TestConversationLayout:
+    def _renderer(self, rounds):
+        renderer = TranscriptRenderer("Is virtue teachable?")
+        for r in range(1, rounds + 1):
+            for speaker in ("A", "B", "C"):
+                renderer.append(speaker, f"{speaker} says {r}", r)
+        return renderer
+
+    def test_own_turns_are_assistant_messages(self):
+        renderer = self._renderer(rounds=1)
+        renderer.append("A", "A says 2", 2)
+        messages = renderer.turn_messages("B", layout=PromptLayout.CONVERSATION)
+        assert [m.role for m in messages] == [
+            MessageRole.SYSTEM, MessageRole.USER, MessageRole.ASSISTANT, MessageRole.USER
+        ]
+        assert "Is virtue teachable?" in messages[1].content
+        assert "**A**: A says 1" in messages[1].content
+        assert messages[2].content == "B says 1"
+        assert "**C**: C says 1" in messages[3].content
+        assert "**A**: A says 2" in messages[3].content
+
+    def test_first_speaker_opens_the_debate(self):
+        messages = TranscriptRenderer("T").turn_messages("A", layout=PromptLayout.CONVERSATION)
+        assert len(messages) == 2
+        assert "first to speak" in messages[1].content
+
+    def test_history_is_byte_stable_between_a_speakers_turns(self):
+        renderer = self._renderer(rounds=1)
+        renderer.append("A", "A says 2", 2)
+        before = renderer.conversation("B")
+        renderer.append("B", "B says 2", 2)
+        renderer.append("C", "C says 2", 2)
+        renderer.append("A", "A says 3", 3)
+        after = renderer.conversation("B")
+        # Everything B saw last time, its last prompt included, is repeated verbatim
+        assert [(m.role, m.content) for m in after[: len(before)]] == [
+            (m.role, m.content) for m in before
+        ]
+        assert after[len(before)].content == "B says 2"
+        assert after[-1].cache_boundaries == (len(after[-1].content),)
+
+    def test_transcript_layout_is_the_default(self):
+        renderer = self._renderer(rounds=1)
+        messages = renderer.turn_messages("A", "Skeptic")
+        assert [m.role for m in messages] == [MessageRole.SYSTEM, MessageRole.USER]
+        assert messages[1].content == renderer.turn_prompt()[0]
+
+
+def _median_us(samples):
+    return statistics.median(samples) * 1e6
+
+
+class TestRenderingBenchmark:
+    """50 rounds x 8 participants: per-turn rendering cost must stay flat."""
+
+    def test_per_turn_cost_is_flat(self):
+        messages = _messages()
+        renderer = TranscriptRenderer("Is democracy the best form of government?")
+        append_times, turn_times, legacy_times = [], [], []
+        prompt = None
+        gc.disable()  # As timeit does; collections would land on random turns
+        try:
+            for i, message in enumerate(messages, start=1):
+                started = time.perf_counter()
+                renderer.append(message.speaker, message.content, message.round_number)
+                appended = time.perf_counter()
+                next_prompt = renderer.turn_prompt()
+                finished = time.perf_counter()
+                append_times.append(appended - started)
+                turn_times.append(finished - started)
+                # Freeing the previous prompt is the caller's cost, not rendering's
+                prompt = next_prompt
+
+                # What _generate_turn used to do on every turn
+                started = time.perf_counter()
+                build_turn_prompt_parts(
+                    renderer.topic,
+                    [{"speaker": m.speaker, "content": m.content} for m in messages[:i]],
+                )
+                legacy_times.append(time.perf_counter() - started)
+        finally:
+            gc.enable()
+        assert prompt is not None
+
+        window = PARTICIPANTS * 5
+        early, late = slice(0, window), slice(-window, None)
+        # Rendering a finished message costs the same in round 50 as in round 1
+        assert _median_us(append_times[late]) < 3 * _median_us(append_times[early]) + 5
+        # The remaining per-turn work is a single join, far below a full re-render
+        assert _median_us(turn_times[late]) * 5 < _median_us(legacy_times[late])
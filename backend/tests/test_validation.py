@@ -0,0 +1,116 @@
+"""Unit tests for cached, concurrent key validation."""
+
+import asyncio
+
+import pytest
+
+from app.adapters.base import RateLimitedError
+from app.models.debate import Provider
+from app.models.providers import KeyValidationRequest
+from app.services.validation import KeyValidator
+
+
+class _StubAdapter:
+    """Counts validation calls; keys starting with "bad" are rejected."""
+
+    label = "Stub"
+
+    def __init__(self, delay=0.0, error=None):
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+
+    async def validate_key(self, api_key):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return not api_key.startswith("bad")
+
+
+@pytest.fixture
+def stub(monkeypatch):
+    adapter = _StubAdapter()
+    monkeypatch.setattr("app.services.validation.get_adapter", lambda provider: adapter)
+    return adapter
+
+
+def _request(key, provider=Provider.OPENAI):
+    return KeyValidationRequest(provider=provider, api_key=key)
+
+
+class TestKeyValidator:
+    @pytest.mark.asyncio
+    async def test_valid_outcome_is_cached(self, stub):
+        validator = KeyValidator()
+        first = await validator.validate(_request("sk-good"))
+        second = await validator.validate(_request("sk-good"))
+        assert first.valid and second.valid
+        assert not first.cached and second.cached
+        assert second.available_models
+        assert stub.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_auth_failures_are_negatively_cached(self, stub):
+        validator = KeyValidator()
+        await validator.validate(_request("bad-key"))
+        result = await validator.validate(_request("bad-key"))
+        assert not result.valid and result.cached
+        assert stub.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_revalidated(self, stub):
+        validator = KeyValidator(valid_ttl=-1)
+        await validator.validate(_request("sk-good"))
+        await validator.validate(_request("sk-good"))
+        assert stub.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_transient_errors_are_not_cached(self, stub):
+        stub.error = RateLimitedError("slow down")
+        validator = KeyValidator()
+        result = await validator.validate(_request("sk-good"))
+        assert not result.valid
+        assert "slow down" in result.message
+        assert len(validator) == 0
+
+    @pytest.mark.asyncio
+    async def test_cache_is_keyed_per_provider(self, stub):
+        validator = KeyValidator()
+        await validator.validate(_request("same-key", Provider.OPENAI))
+        await validator.validate(_request("same-key", Provider.XAI))
+        assert stub.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_never_holds_raw_keys(self, stub):
+        validator = KeyValidator()
+        await validator.validate(_request("sk-secret"))
+        assert all("sk-secret" not in key for key in validator._cache)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_call(self, stub):
+        stub.delay = 0.05
+        validator = KeyValidator()
+        results = await asyncio.gather(*(validator.validate(_request("sk-good")) for _ in range(5)))
+        assert all(r.valid for r in results)
+        assert stub.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_batch_runs_concurrently_with_timeouts(self, stub, monkeypatch):
+        stub.delay = 0.2
+        monkeypatch.setattr("app.services.validation.DEFAULT_TIMEOUT", 0.5)
+        monkeypatch.setattr("app.services.validation.PROVIDER_TIMEOUTS", {"google": 0.05})
+        validator = KeyValidator()
+        requests = [
+            _request("sk-a", Provider.OPENAI),
+            _request("sk-b", Provider.ANTHROPIC),
+            _request("bad-c", Provider.XAI),
+            _request("sk-d", Provider.GOOGLE),
+        ]
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        results = await validator.validate_many(requests)
+        assert loop.time() - started < 0.4  # Not 4 x 0.2s sequentially
+        assert [r.provider for r in results] == [r.provider for r in requests]
+        assert [r.valid for r in results] == [True, True, False, False]
+        assert "did not respond" in results[3].message
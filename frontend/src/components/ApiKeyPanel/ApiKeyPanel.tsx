@@ -7,13 +7,16 @@ import { PROVIDERS } from "@/types/providers";
 import { healthCheck } from "@/services/api";
 
 export function ApiKeyPanel() {
-  const { initFromStorage, clearAll, getValidatedProviders } = useKeyStore();
+  const { initFromStorage, validateAll, clearAll, getValidatedProviders } =
+    useKeyStore();
   const validCount = getValidatedProviders().length;
   const [backendDown, setBackendDown] = useState(false);
 
   useEffect(() => {
     initFromStorage();
-  }, [initFromStorage]);
+    // Re-check keys restored from session storage in a single request
+    validateAll();
+  }, [initFromStorage, validateAll]);
 
   useEffect(() => {
     healthCheck()
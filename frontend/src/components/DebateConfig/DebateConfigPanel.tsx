@@ -15,6 +15,7 @@ export function DebateConfigPanel() {
     maxTokensPerTurn,
     consensusThreshold,
     moderatorIndex,
+    promptLayout,
     canStartDebate,
   } = useConfigStore();
 
@@ -33,6 +34,7 @@ export function DebateConfigPanel() {
         max_tokens_per_turn: maxTokensPerTurn,
         consensus_threshold: consensusThreshold,
         moderator_index: moderatorIndex,
+        prompt_layout: promptLayout,
       },
       apiKeys
     );
@@ -1,6 +1,7 @@
 import { Settings } from "lucide-react";
 import { Slider } from "@/components/common/Slider";
 import { useConfigStore } from "@/stores/configStore";
+import { PromptLayout } from "@/types";
 
 export function ParameterControls() {
   const {
@@ -9,10 +10,12 @@ export function ParameterControls() {
     maxTokensPerTurn,
     consensusThreshold,
     moderatorIndex,
+    promptLayout,
     setMaxRounds,
     setMaxTokensPerTurn,
     setConsensusThreshold,
     setModeratorIndex,
+    setPromptLayout,
   } = useConfigStore();
 
   return (
@@ -72,6 +75,24 @@ export function ParameterControls() {
             Evaluates consensus and writes the final conspectus
           </p>
         </div>
+
+        {/* Prompt layout selector */}
+        <div className="space-y-1">
+          <label className="text-xs font-medium text-ink">Prompt Layout</label>
+          <select
+            value={promptLayout}
+            onChange={(e) => setPromptLayout(e.target.value as PromptLayout)}
+            className="w-full rounded-lg border border-stone/30 bg-white px-3 py-2
+              text-sm text-ink focus:border-bronze focus:outline-none"
+          >
+            <option value={PromptLayout.TRANSCRIPT}>Transcript</option>
+            <option value={PromptLayout.CONVERSATION}>Conversation</option>
+          </select>
+          <p className="text-[10px] text-stone">
+            Conversation shows each speaker its own turns as its replies,
+            which lets provider prompt caches hit more often
+          </p>
+        </div>
       </div>
     </div>
   );
@@ -30,6 +30,21 @@ export async function validateKey(
   return res.json();
 }
 
+export async function validateKeys(
+  keys: { provider: Provider; apiKey: string }[]
+): Promise<KeyValidationResult[]> {
+  const res = await fetch(`${API_BASE}/keys/validate-batch`, {
+    method: "POST",
+    headers: { "Content-Type": "application/json" },
+    body: JSON.stringify({
+      keys: keys.map(({ provider, apiKey }) => ({ provider, api_key: apiKey })),
+    }),
+  });
+  if (!res.ok) throw new Error(`Validation failed: ${res.status}`);
+  const data = await res.json();
+  return data.results;
+}
+
 export async function fetchProviders(): Promise<
   Record<string, string[]>
 > {
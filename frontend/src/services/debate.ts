@@ -6,7 +6,7 @@
  * Vercel's serverless function timeout.
  */
 
-import type { Participant } from "@/types";
+import type { Participant, PromptLayout } from "@/types";
 import { getBackendUrl } from "./api";
 
 // ---------------------------------------------------------------------------
@@ -20,6 +20,10 @@ export interface TurnParams {
   api_key: string;
   max_tokens: number;
   temperature: number;
+  prompt_layout?: PromptLayout;
+  /** Token frame cadence; the server default is 50ms / 1024 bytes, 0 disables */
+  token_flush_ms?: number;
+  token_flush_bytes?: number;
 }
 
 export interface TurnResult {
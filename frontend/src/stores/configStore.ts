@@ -1,4 +1,5 @@
 import { create } from "zustand";
+import { PromptLayout } from "@/types";
 import type { Participant, Provider } from "@/types";
 
 interface ConfigStore {
@@ -8,6 +9,7 @@ interface ConfigStore {
   maxTokensPerTurn: number;
   consensusThreshold: number;
   moderatorIndex: number;
+  promptLayout: PromptLayout;
 
   setTopic: (topic: string) => void;
   addParticipant: (participant: Participant) => void;
@@ -17,6 +19,7 @@ interface ConfigStore {
   setMaxTokensPerTurn: (value: number) => void;
   setConsensusThreshold: (value: number) => void;
   setModeratorIndex: (index: number) => void;
+  setPromptLayout: (layout: PromptLayout) => void;
   canStartDebate: () => boolean;
   getUniqueProviders: () => Provider[];
   reset: () => void;
@@ -29,6 +32,7 @@ export const useConfigStore = create<ConfigStore>((set, get) => ({
   maxTokensPerTurn: 1024,
   consensusThreshold: 0.8,
   moderatorIndex: 0,
+  promptLayout: PromptLayout.TRANSCRIPT,
 
   setTopic: (topic) => set({ topic }),
 
@@ -64,6 +68,7 @@ export const useConfigStore = create<ConfigStore>((set, get) => ({
   setMaxTokensPerTurn: (maxTokensPerTurn) => set({ maxTokensPerTurn }),
   setConsensusThreshold: (consensusThreshold) => set({ consensusThreshold }),
   setModeratorIndex: (moderatorIndex) => set({ moderatorIndex }),
+  setPromptLayout: (promptLayout) => set({ promptLayout }),
 
   canStartDebate: () => {
     const { topic, participants } = get();
@@ -83,5 +88,6 @@ export const useConfigStore = create<ConfigStore>((set, get) => ({
       maxTokensPerTurn: 1024,
       consensusThreshold: 0.8,
       moderatorIndex: 0,
+      promptLayout: PromptLayout.TRANSCRIPT,
     }),
 }));
@@ -149,6 +149,7 @@ export const useDebateStore = create<DebateStore>((set, get) => {
               api_key: apiKeys[participant.provider] ?? "",
               max_tokens: config.max_tokens_per_turn,
               temperature: participant.temperature,
+              prompt_layout: config.prompt_layout,
             },
             (token) => {
               tokenBuffer[participant.display_name] =
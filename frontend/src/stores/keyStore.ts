@@ -1,6 +1,9 @@
 import { create } from "zustand";
 import type { Provider, KeyState } from "@/types";
-import { validateKey as apiValidateKey } from "@/services/api";
+import {
+  validateKey as apiValidateKey,
+  validateKeys as apiValidateKeys,
+} from "@/services/api";
 
 const STORAGE_PREFIX = "agora_key_";
 
@@ -8,6 +11,19 @@ function loadKey(provider: Provider): string {
   return sessionStorage.getItem(`${STORAGE_PREFIX}${provider}`) ?? "";
 }
 
+function describeError(err: unknown): string {
+  if (err instanceof TypeError) {
+    return "Cannot reach the backend. Is the server running?";
+  }
+  if (err instanceof Error && err.message.includes("405")) {
+    return "Backend not connected. Start the backend locally or set VITE_BACKEND_URL.";
+  }
+  if (err instanceof Error) {
+    return err.message;
+  }
+  return "Validation failed unexpectedly.";
+}
+
 function saveKey(provider: Provider, key: string): void {
   if (key) {
     sessionStorage.setItem(`${STORAGE_PREFIX}${provider}`, key);
@@ -20,6 +36,7 @@ interface KeyStore {
   keys: Record<string, KeyState>;
   setKey: (provider: Provider, key: string) => void;
   validateKey: (provider: Provider) => Promise<void>;
+  validateAll: () => Promise<void>;
   clearKey: (provider: Provider) => void;
   clearAll: () => void;
   getValidatedProviders: () => Provider[];
@@ -110,17 +127,7 @@ export const useKeyStore = create<KeyStore>((set, get) => ({
         },
       }));
     } catch (err) {
-      let error: string;
-      if (err instanceof TypeError) {
-        error = "Cannot reach the backend. Is the server running?";
-      } else if (err instanceof Error && err.message.includes("405")) {
-        error =
-          "Backend not connected. Start the backend locally or set VITE_BACKEND_URL.";
-      } else if (err instanceof Error) {
-        error = err.message;
-      } else {
-        error = "Validation failed unexpectedly.";
-      }
+      const error = describeError(err);
       set((s) => ({
         keys: {
           ...s.keys,
@@ -136,6 +143,59 @@ export const useKeyStore = create<KeyStore>((set, get) => ({
     }
   },
 
+  validateAll: async () => {
+    // One batch request; the backend validates concurrently and answers
+    // recently seen keys from its cache.
+    const pending = Object.entries(get().keys)
+      .filter(([, state]) => state.key && state.valid !== true && !state.validating)
+      .map(([provider, state]) => ({ provider: provider as Provider, apiKey: state.key }));
+    if (pending.length === 0) return;
+
+    set((s) => {
+      const keys = { ...s.keys };
+      for (const { provider } of pending) {
+        keys[provider] = { ...keys[provider], validating: true, error: null };
+      }
+      return { keys };
+    });
+
+    try {
+      const results = await apiValidateKeys(pending);
+      set((s) => {
+        const keys = { ...s.keys };
+        results.forEach((result, i) => {
+          const { provider, apiKey } = pending[i];
+          // Skip keys the user edited while the batch was in flight
+          if (keys[provider]?.key !== apiKey) return;
+          keys[provider] = {
+            key: apiKey,
+            valid: result.valid,
+            validating: false,
+            models: result.available_models,
+            error: result.valid ? null : result.message,
+          };
+        });
+        return { keys };
+      });
+    } catch (err) {
+      const error = describeError(err);
+      set((s) => {
+        const keys = { ...s.keys };
+        for (const { provider, apiKey } of pending) {
+          if (keys[provider]?.key !== apiKey) continue;
+          keys[provider] = {
+            key: apiKey,
+            valid: false,
+            validating: false,
+            models: [],
+            error,
+          };
+        }
+        return { keys };
+      });
+    }
+  },
+
   clearKey: (provider) => {
     saveKey(provider, "");
     set((state) => ({
@@ -8,11 +8,14 @@ export interface DebateStartedPayload {
 
 export interface RoundStartPayload {
   round: number;
+  /** Started while the previous round's consensus check is still running. */
+  speculative?: boolean;
 }
 
 export interface TurnStartPayload {
   speaker: string;
   provider: Provider;
+  model: string;
   round: number;
 }
 
@@ -25,6 +28,61 @@ export interface TurnEndPayload {
   speaker: string;
   round: number;
   token_count: number;
+  input_tokens: number;
+  cache_read_tokens: number;
+  cache_write_tokens: number;
+  finish_reason: string;
+  truncated: boolean;
+  timing: StreamTiming | null;
+  hedge: HedgeOutcome | null;
+  /** Token events a slow client missed under the "drop_tokens" overflow policy */
+  dropped_tokens?: number;
+}
+
+/** A turn, round or whole-debate deadline passed; the debate moves on. */
+export interface DeadlinePayload {
+  scope: "first_token" | "turn" | "round" | "debate";
+  round: number;
+  speaker: string | null;
+}
+
+/**
+ * A turn cut short by stop, by a pause that restarts it, or dropped because
+ * the consensus check it ran ahead of ended the debate. "timeout" is a turn
+ * that hit a deadline before its first token.
+ */
+export interface TurnCancelledPayload {
+  speaker: string;
+  round: number;
+  reason: "stopped" | "paused" | "concluded" | "timeout";
+  discarded_chunks: number;
+}
+
+/** Timing of one generation stream, as measured by the backend. */
+export interface StreamTiming {
+  provider: string;
+  model: string;
+  attempts: number;
+  queued_seconds: number;
+  ttft_seconds: number;
+  generation_seconds: number;
+  duration_seconds: number;
+  chunks: number;
+  output_tokens: number;
+  tokens_per_second: number;
+  gap_mean_seconds: number;
+  gap_max_seconds: number;
+  consumer_seconds: number;
+}
+
+/** A second request sent for a turn that was slow to start. */
+export interface HedgeOutcome {
+  issued: boolean;
+  winner: "primary" | "backup";
+  provider: string;
+  model: string;
+  delay_seconds: number;
+  cost_usd: number;
 }
 
 export interface ConsensusCheckPayload {
@@ -51,6 +109,9 @@ export interface ConcludedPayload {
   total_rounds: number;
   final_consensus: number;
   token_usage: Record<string, number>;
+  input_token_usage: Record<string, number>;
+  hedged_turns: number;
+  hedge_cost_usd: number;
 }
 
 export interface ConspectusPayload {
@@ -59,6 +120,7 @@ export interface ConspectusPayload {
 }
 
 export interface DebateErrorPayload {
+  session_id?: string;
   error: string;
   speaker?: string;
   round?: number;
@@ -76,6 +138,76 @@ export interface DebateStoppedPayload {
   session_id: string;
 }
 
+/** Compact state of a running debate, sent to a late joiner. */
+export interface DebateSnapshot {
+  session_id: string;
+  /** Sequence number of the last event the snapshot covers */
+  seq: number;
+  topic: string;
+  participants: string[];
+  status: string;
+  round: number;
+  consensus_score: number | null;
+  /** Finished turns */
+  transcript: Array<{ speaker: string; round: number; content: string }>;
+}
+
+/**
+ * Reply to debate:join for a debate that is still running. The replay holds
+ * the events of the turns in progress; live events follow on the room. The
+ * SSE stream at /api/debate/{session_id}/events opens with the same
+ * snapshot as a "debate:snapshot" frame, followed by the replay.
+ */
+export interface DebateJoinedPayload {
+  session_id: string;
+  snapshot: DebateSnapshot;
+  replay: Array<{ type: string; data: Record<string, unknown> }>;
+}
+
+/**
+ * Every Socket.IO debate event payload carries a `seq`, increasing by one
+ * per event, so a client can detect a gap. A debate:resync request
+ * ({ session_id, after_seq }) is answered with debate:resynced: the missed
+ * events as `replay` with a null snapshot, or a snapshot plus the turns in
+ * progress when the session's event log no longer reaches back that far.
+ */
+export interface DebateResyncedPayload {
+  session_id: string;
+  snapshot: DebateSnapshot | null;
+  replay: Array<{ type: string; data: Record<string, unknown> }>;
+}
+
+/**
+ * Sent only to the client that started a debate. Pause, resume and stop
+ * requests from any other client are refused unless they carry this token,
+ * which also lets the starter keep control after reconnecting.
+ */
+export interface DebateControlPayload {
+  session_id: string;
+  control_token: string;
+}
+
+/** Reply to debate:join for a debate that ended with nobody watching. */
+export interface DebateResultsPayload {
+  session_id: string;
+  session: Record<string, unknown>;
+}
+
 export interface GeneratingConspectusPayload {
   session_id: string;
 }
+
+export interface ParticipantDegradedPayload {
+  speaker: string;
+  provider: Provider;
+  model: string;
+  reason: string;
+  fallback_provider: Provider | null;
+  fallback_model: string | null;
+}
+
+export interface ParticipantRecoveredPayload {
+  speaker: string;
+  provider: Provider;
+  model: string;
+}
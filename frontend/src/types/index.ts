@@ -18,6 +18,13 @@ export enum DebateStatus {
   ERROR = "error",
 }
 
+export enum PromptLayout {
+  /** One user message holding the whole transcript */
+  TRANSCRIPT = "transcript",
+  /** Own turns as assistant messages, others' turns as user messages */
+  CONVERSATION = "conversation",
+}
+
 export interface Participant {
   provider: Provider;
   model: string;
@@ -33,6 +40,7 @@ export interface DebateConfig {
   max_tokens_per_turn: number;
   consensus_threshold: number;
   moderator_index: number;
+  prompt_layout: PromptLayout;
 }
 
 export interface DebateMessage {
@@ -59,6 +67,7 @@ export interface KeyValidationResult {
   valid: boolean;
   message: string;
   available_models: string[];
+  cached?: boolean;
 }
 
 export interface KeyState {